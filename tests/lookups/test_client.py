@@ -1,4 +1,4 @@
-from mock import patch
+from mock import patch, ANY
 from tests.tools import create_mock_json
 from twilio.rest import TwilioLookupsClient
 
@@ -11,4 +11,4 @@ def test_phone_numbers(mock):
     client.phone_numbers.get("+15108675309")
     uri = "https://lookups.twilio.com/v1/PhoneNumbers/+15108675309"
     mock.assert_called_with("GET", uri, params={}, auth=("ACCOUNT_SID", "AUTH_TOKEN"),
-                            use_json_extension=False)
+                            use_json_extension=False, http_client=ANY)
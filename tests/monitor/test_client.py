@@ -1,4 +1,4 @@
-from mock import patch
+from mock import patch, ANY
 
 from tests.tools import create_mock_json
 from twilio.rest.monitor import TwilioMonitorClient
@@ -11,4 +11,5 @@ def test_events(mock):
     mock.return_value = resp
     client.events.get("AEaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa")
     uri = "https://monitor.twilio.com/v1/Events/AEaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
-    mock.assert_called_with("GET", uri, auth=("ACCOUNT_SID", "AUTH_TOKEN"), use_json_extension=False)
+    mock.assert_called_with("GET", uri, auth=("ACCOUNT_SID", "AUTH_TOKEN"), use_json_extension=False,
+                            http_client=ANY)
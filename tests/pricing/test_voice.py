@@ -35,6 +35,19 @@ class VoiceTest(unittest.TestCase):
             use_json_extension=False,
         )
 
+    @patch('twilio.rest.resources.base.make_twilio_request')
+    def test_voice_countries_raw(self, request):
+        resp = create_mock_json(
+            'tests/resources/pricing/voice_countries_list.json')
+        resp.status_code = 200
+        request.return_value = resp
+
+        countries = VoiceCountries(BASE_URI + "/Voice", AUTH)
+        result = countries.list_raw(fields=["iso_country"])
+
+        assert_equal(result[0], {"iso_country": "AC"})
+        assert_equal(len(result), 3)
+
     @patch('twilio.rest.resources.base.make_twilio_request')
     def test_voice_country(self, request):
         resp = create_mock_json('tests/resources/pricing/voice_country_instance.json')
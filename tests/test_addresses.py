@@ -22,6 +22,19 @@ class AddressesTest(unittest.TestCase):
         uri = "http://api.twilio.com/Addresses/123"
         request.assert_called_with("POST", uri, data={"FriendlyName": "hi"})
 
+    def test_list_raw(self):
+        request = Mock()
+        request.return_value = (Mock(), {
+            "addresses": [{"sid": "AD123", "friendly_name": "home"}],
+        })
+        self.resource.request = request
+
+        records = self.resource.list_raw(iso_country="US", fields=["sid"])
+
+        assert_equal(records, [{"sid": "AD123"}])
+        request.assert_called_with("GET", "http://api.twilio.com/Addresses",
+                                   params={"IsoCountry": "US"})
+
     @raises(TwilioException)
     def test_update_rejects_iso_country(self):
         self.resource.update("123", iso_country="CA")
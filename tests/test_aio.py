@@ -0,0 +1,214 @@
+import sys
+import unittest
+
+from mock import Mock
+from nose.plugins.skip import SkipTest
+from nose.tools import assert_equal, assert_true, raises
+
+if sys.version_info < (3, 5):
+    raise SkipTest("asyncio support requires Python 3.5")
+
+import asyncio
+
+from twilio.rest.aio import AsyncTwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources.aio import (
+    AsyncListResource,
+    ExecutorHttpClient,
+    make_async,
+)
+from twilio.rest.resources.calls import Calls
+from tests.tools import FakeHttpClient
+
+AUTH = ("AC123", "token")
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+
+
+def run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+def collect(iterator):
+    items = []
+    while True:
+        try:
+            items.append(run(iterator.__anext__()))
+        except StopAsyncIteration:
+            return items
+
+
+class AsyncClientTest(unittest.TestCase):
+
+    def client(self, *contents, **kwargs):
+        self.http_client = FakeHttpClient(*contents, **kwargs)
+        return AsyncTwilioRestClient("AC123", "token",
+                                     http_client=self.http_client)
+
+    def test_get(self):
+        client = self.client('{"sid": "CA123", "status": "completed"}')
+
+        call = run(client.calls.get("CA123"))
+
+        assert_equal(call.sid, "CA123")
+        assert_equal(call.status, "completed")
+        assert_equal(self.http_client.requests,
+                     [("GET", "%s/Calls/CA123.json" % BASE_URI, None)])
+
+    def test_create(self):
+        client = self.client('{"sid": "SM123"}', status=201)
+
+        message = run(client.messages.create(to="+1", from_="+2", body="hi"))
+
+        assert_equal(message.sid, "SM123")
+        method, url, body = self.http_client.requests[0]
+        assert_equal(method, "POST")
+        assert_equal(url, "%s/Messages.json" % BASE_URI)
+        assert_true("Body=hi" in body)
+
+    def test_create_many(self):
+        client = self.client('{"sid": "SM1"}', '{"sid": "SM2"}', status=201)
+
+        results = run(client.messages.create_many([
+            {"to": "+1", "from_": "+3", "body": "hi"},
+            {"to": "+2", "from_": "+3", "body": "hi"},
+        ], concurrency=2))
+
+        assert_equal([m.sid for m in results], ["SM1", "SM2"])
+        assert_equal(len(self.http_client.requests), 2)
+
+    def test_create_many_errors(self):
+        client = self.client('{"code": 21211, "message": "Invalid To"}',
+                             status=400)
+
+        results = run(client.messages.create_many([{"to": "x", "body": "hi"}]))
+
+        assert_true(isinstance(results[0], TwilioRestException))
+
+    def test_iter(self):
+        client = self.client(
+            '{"calls": [{"sid": "CA1"}, {"sid": "CA2"}],'
+            ' "next_page_uri": "/Calls.json?Page=1&PageToken=PA2"}',
+            '{"calls": [{"sid": "CA3"}], "next_page_uri": null}',
+        )
+
+        calls = collect(client.calls.iter(status="completed"))
+
+        assert_equal([c.sid for c in calls], ["CA1", "CA2", "CA3"])
+        assert_equal(len(self.http_client.requests), 2)
+        assert_true("Page=1" in self.http_client.requests[1][1])
+
+    def test_iter_prefetch(self):
+        client = self.client(
+            '{"calls": [{"sid": "CA1"}], "next_page_uri": "/Calls.json?Page=1"}',
+            '{"calls": [{"sid": "CA2"}], "next_page_uri": "/Calls.json?Page=2"}',
+            '{"calls": [{"sid": "CA3"}], "next_page_uri": null}',
+        )
+
+        calls = collect(client.calls.iter(prefetch=1))
+
+        assert_equal([c.sid for c in calls], ["CA1", "CA2", "CA3"])
+        assert_true("Prefetch" not in self.http_client.requests[0][1])
+
+    def test_iter_limit(self):
+        client = self.client(
+            '{"calls": [{"sid": "CA1"}, {"sid": "CA2"}], "next_page_uri": '
+            '"/Calls.json?PageSize=3&Page=1&PageToken=PA1"}',
+            '{"calls": [{"sid": "CA3"}, {"sid": "CA4"}], "next_page_uri": '
+            '"/Calls.json?PageSize=1&Page=3&PageToken=PA2"}',
+        )
+
+        calls = collect(client.calls.iter(limit=3))
+
+        assert_equal([c.sid for c in calls], ["CA1", "CA2", "CA3"])
+        assert_equal(len(self.http_client.requests), 2)
+        first, second = [url for _, url, _ in self.http_client.requests]
+        assert_true("PageSize=3" in first)
+        assert_true("Limit" not in first)
+        assert_true("PageSize=1" in second)
+        assert_true("PageToken=PA1" in second)
+
+    def test_iter_limit_zero(self):
+        client = self.client()
+
+        assert_equal(collect(client.calls.iter(limit=0)), [])
+        assert_equal(self.http_client.requests, [])
+
+    @raises(TypeError)
+    def test_iter_expand(self):
+        client = self.client()
+        client.calls.iter(expand=["recordings"])
+
+    @raises(TypeError)
+    def test_iter_workers(self):
+        client = self.client()
+        client.calls.iter(workers=4)
+
+    def test_iter_sync_only_defaults(self):
+        client = self.client('{"calls": [], "next_page_uri": null}')
+
+        collect(client.calls.iter(workers=0, stream=False, expand=None))
+
+        url = self.http_client.requests[0][1]
+        for name in ("Workers", "Stream", "Expand"):
+            assert_true(name not in url)
+
+    def test_instances_use_sync_parent(self):
+        client = self.client('{"sid": "CA123"}')
+
+        call = run(client.calls.get("CA123"))
+
+        assert_true(isinstance(call.parent, Calls))
+        assert_true(not isinstance(call.parent, AsyncListResource))
+
+    def test_resource_specific_methods(self):
+        sync_http_client = FakeHttpClient('{"sid": "PN123"}')
+        async_http_client = FakeHttpClient(
+            '{"incoming_phone_numbers": [{"sid": "PN123"}]}')
+        client = AsyncTwilioRestClient(
+            "AC123", "token", http_client=sync_http_client,
+            async_http_client=ExecutorHttpClient(async_http_client))
+
+        numbers = run(client.phone_numbers.list())
+
+        assert_equal([n.sid for n in numbers], ["PN123"])
+        assert_equal(async_http_client.requests, [
+            ("GET", "%s/IncomingPhoneNumbers.json?" % BASE_URI, None),
+        ])
+
+        # The instances still block, with the original http client
+        numbers[0].update(friendly_name="home")
+        assert_equal(len(sync_http_client.requests), 1)
+
+    @raises(TwilioRestException)
+    def test_resource_specific_errors(self):
+        client = self.client('{"code": 20404, "message": "Not found"}',
+                             status=404)
+        run(client.phone_numbers.list())
+
+    @raises(TwilioRestException)
+    def test_error(self):
+        client = self.client('{"code": 20404, "message": "Not found"}',
+                             status=404)
+        run(client.calls.get("CA123"))
+
+    def test_nested_resources(self):
+        client = self.client()
+
+        assert_true(isinstance(client.sip.domains, AsyncListResource))
+        assert_true(isinstance(client.sip.credentials("CL123"),
+                               AsyncListResource))
+        assert_true(isinstance(client.usage.records.daily,
+                               AsyncListResource))
+        assert_true(isinstance(client.participants("CF123"),
+                               AsyncListResource))
+        assert_true(client.phone_numbers.available_phone_numbers.phone_numbers
+                    is client.phone_numbers)
+
+    def test_make_async_keeps_sync_resource(self):
+        calls = Calls(BASE_URI, AUTH)
+
+        async_calls = make_async(calls, Mock())
+
+        assert_true(async_calls.sync is calls)
+        assert_true(not isinstance(calls, AsyncListResource))
+        assert_equal(async_calls.uri, calls.uri)
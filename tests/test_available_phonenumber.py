@@ -47,6 +47,19 @@ class AvailablePhoneNumbersTest(unittest.TestCase):
         uri = "http://api.twilio.com/AvailablePhoneNumbers/US/Local"
         request.assert_called_with("GET", uri, params={})
 
+    def test_list_raw(self):
+        request = Mock()
+        request.return_value = (Mock(), {"available_phone_numbers": [
+            {"phone_number": "+14155550100", "region": "CA"},
+        ]})
+        self.resource.request = request
+
+        numbers = self.resource.list_raw(fields=["phone_number"])
+
+        assert_equal(numbers, [{"phone_number": "+14155550100"}])
+        uri = "http://api.twilio.com/AvailablePhoneNumbers/US/Local"
+        request.assert_called_with("GET", uri, params={})
+
     def test_load_instance(self):
         instance = self.resource.load_instance({"hey": "you"})
         assert_true(isinstance(instance.parent, Mock))
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from datetime import datetime
+import time
 import unittest
 
 from mock import Mock, sentinel, patch, ANY
@@ -7,10 +8,13 @@ from nose.tools import assert_equal, assert_true
 import pytz
 from six import advance_iterator
 
+from twilio.exceptions import TwilioException
+from twilio.rest.exceptions import TwilioRestException
 from twilio.rest.resources.imports import json
 from twilio.rest.resources import Resource, NextGenListResource, NextGenInstanceResource
 from twilio.rest.resources import ListResource
 from twilio.rest.resources import InstanceResource
+from twilio.rest.resources import StreamingResponse
 
 base_uri = "https://api.twilio.com/2010-04-01"
 account_sid = "AC123"
@@ -56,7 +60,7 @@ class ListResourceTest(unittest.TestCase):
         self.r.request = Mock()
         self.r.request.return_value = Mock(), {self.r.key: [{'sid': 'foo'}]}
         advance_iterator(self.r.iter())
-        self.r.request.assert_called_with("GET", "https://api.twilio.com/2010-04-01/Resources", params={})
+        self.r.request.assert_called_with("GET", "https://api.twilio.com/2010-04-01/Resources", params={'PageSize': 1000})
 
     def testIterOneItem(self):
         self.r.request = Mock()
@@ -73,6 +77,264 @@ class ListResourceTest(unittest.TestCase):
 
         self.assertRaises(StopIteration, advance_iterator, self.r.iter())
 
+    def testIterPrefetch(self):
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            (Mock(), {self.r.key: [{'sid': 'foo'}, {'sid': 'bar'}],
+                      'next_page_uri': '/Resources?Page=1&PageToken=PA1'}),
+            (Mock(), {self.r.key: [{'sid': 'baz'}], 'next_page_uri': None}),
+        ]
+
+        items = list(self.r.iter(prefetch=1))
+
+        assert_equal([i.sid for i in items], ['foo', 'bar', 'baz'])
+        self.r.request.assert_called_with(
+            "GET", "https://api.twilio.com/2010-04-01/Resources",
+            params={'Page': ['1'], 'PageToken': ['PA1'], 'PageSize': 1000},
+        )
+
+    def testIterPrefetchError(self):
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            (Mock(), {self.r.key: [{'sid': 'foo'}],
+                      'next_page_uri': '/Resources?Page=1'}),
+            ValueError("boom"),
+        ]
+
+        items = self.r.iter(prefetch=2)
+        assert_equal(advance_iterator(items).sid, 'foo')
+        self.assertRaises(ValueError, advance_iterator, items)
+
+    def testIterPrefetchClose(self):
+        pages = (
+            (Mock(), {self.r.key: [{'sid': 'foo'}],
+                      'next_page_uri': '/Resources?Page=%d' % i})
+            for i in range(1, 1000)
+        )
+        self.r.request = Mock(side_effect=pages)
+
+        items = self.r.iter(prefetch=2)
+        advance_iterator(items)
+        items.close()
+        time.sleep(0.3)
+        calls = self.r.request.call_count
+        time.sleep(0.3)
+
+        assert_true(calls <= 5)
+        assert_equal(self.r.request.call_count, calls)
+
+    def testIterWorkers(self):
+        def request(method, uri, params):
+            number = params.get('Page', 0)
+            time.sleep(0.01 * (5 - number))
+            return Mock(), {self.r.key: [{'sid': 'foo%d' % number}],
+                            'page': number, 'page_size': 1, 'num_pages': 5}
+        self.r.request = Mock(side_effect=request)
+
+        items = list(self.r.iter(workers=3, status='completed'))
+
+        assert_equal([i.sid for i in items],
+                     ['foo0', 'foo1', 'foo2', 'foo3', 'foo4'])
+        self.r.request.assert_any_call(
+            "GET", "https://api.twilio.com/2010-04-01/Resources",
+            params={'Status': 'completed', 'Page': 3, 'PageSize': 1},
+        )
+        assert_equal(self.r.request.call_count, 5)
+
+    def testCreateMany(self):
+        def request(method, uri, data):
+            time.sleep(0.01 * (3 - len(data['Name'])))
+            if data['Name'] == 'bad':
+                raise TwilioRestException(400, uri, "Invalid name")
+            return Mock(status_code=201), {'sid': data['Name']}
+        self.r.request = Mock(side_effect=request)
+        items = iter([{'name': 'a'}, {'name': 'bad'}, {'name': 'ccc'}])
+
+        results = list(self.r.create_many(items, concurrency=2))
+
+        assert_equal(results[0].sid, 'a')
+        assert_true(isinstance(results[1], TwilioRestException))
+        assert_equal(results[1].status, 400)
+        assert_equal(results[2].sid, 'ccc')
+        self.r.request.assert_any_call(
+            "POST", "https://api.twilio.com/2010-04-01/Resources",
+            data={'Name': 'ccc'},
+        )
+
+    def testCreateManyStreamsItems(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(status_code=201), {'sid': 'foo'}
+        consumed = []
+
+        def items():
+            for i in range(10):
+                consumed.append(i)
+                yield {'name': 'foo%d' % i}
+
+        results = self.r.create_many(items(), concurrency=2)
+        advance_iterator(results)
+
+        assert_true(len(consumed) <= 3)
+
+    def testCreateManyUsesCreate(self):
+        self.r.create = Mock(return_value=sentinel.instance)
+
+        results = list(self.r.create_many([{'from_': '+1', 'to': '+2'}]))
+
+        assert_equal(results, [sentinel.instance])
+        self.r.create.assert_called_with(from_='+1', to='+2')
+
+    def testIterWorkersWithoutPageCount(self):
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            (Mock(), {self.r.key: [{'sid': 'foo'}],
+                      'next_page_uri': '/Resources?Page=1&PageToken=PA1'}),
+            (Mock(), {self.r.key: [{'sid': 'bar'}], 'next_page_uri': None}),
+        ]
+
+        items = list(self.r.iter(workers=3))
+
+        assert_equal([i.sid for i in items], ['foo', 'bar'])
+
+    def testIterStream(self):
+        pages = [
+            '{"resources": [{"sid": "foo"}, {"sid": "bar"}], '
+            '"next_page_uri": "/Resources?Page=1&PageToken=PA1"}',
+            '{"resources": [{"sid": "baz"}], "next_page_uri": null}',
+        ]
+        with patch('twilio.rest.resources.base.make_twilio_request') as mock:
+            mock.side_effect = [Mock(content=page) for page in pages]
+            items = list(self.r.iter(stream=True))
+
+        assert_equal([item.sid for item in items], ['foo', 'bar', 'baz'])
+        assert_equal(mock.call_args[1]['params'],
+                     {'Page': ['1'], 'PageToken': ['PA1'], 'PageSize': 1000})
+
+    def testIterStreamReadsRecordsLazily(self):
+        chunks = [b'{"resources": [{"sid": "foo"}', b', {"sid": "bar"}]}']
+        body = iter(chunks)
+        resp = StreamingResponse(Mock(status=200), body, base_uri)
+        with patch('twilio.rest.resources.base.make_twilio_request',
+                   return_value=resp):
+            items = self.r.iter(stream=True)
+            assert_equal(advance_iterator(items).sid, 'foo')
+
+        assert_equal(list(body), [chunks[1]])
+
+    def testIterStreamAhead(self):
+        self.assertRaises(TwilioException, advance_iterator,
+                          self.r.iter(stream=True, workers=4))
+        self.assertRaises(TwilioException, advance_iterator,
+                          self.r.iter(stream=True, prefetch=2))
+
+    def testIterLimit(self):
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            (Mock(), {self.r.key: [{'sid': 'foo'}, {'sid': 'bar'}],
+                      'next_page_uri': '/Resources?PageSize=2&Page=1'
+                                       '&PageToken=PA1'}),
+            (Mock(), {self.r.key: [{'sid': 'baz'}],
+                      'next_page_uri': '/Resources?PageSize=1&Page=3'
+                                       '&PageToken=PA2'}),
+        ]
+
+        items = list(self.r.iter(page_size=2, limit=3))
+
+        assert_equal([item.sid for item in items], ['foo', 'bar', 'baz'])
+        assert_equal(self.r.request.call_count, 2)
+        assert_equal(self.r.request.call_args[1]['params']['PageSize'], 1)
+
+    def testIterLimitPageSize(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {
+            self.r.key: [{'sid': 'foo%d' % i} for i in range(10)],
+            'next_page_uri': '/Resources?Page=1&PageToken=PA1',
+        }
+
+        items = list(self.r.iter(limit=5))
+
+        assert_equal(len(items), 5)
+        self.r.request.assert_called_once_with("GET", ANY,
+                                               params={'PageSize': 5})
+
+    def testIterLimitNumberedPages(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {
+            self.r.key: [{'sid': 'foo'}, {'sid': 'bar'}],
+            'next_page_uri': '/Resources?PageSize=2&Page=1',
+        }
+
+        items = list(self.r.iter(page_size=2, limit=3))
+
+        assert_equal(len(items), 3)
+        assert_equal(self.r.request.call_args[1]['params']['PageSize'],
+                     ['2'])
+
+    def testIterLimitWorkers(self):
+        def request(method, uri, params):
+            number = params.get('Page', 0)
+            return Mock(), {self.r.key: [{'sid': 'foo%d' % number}] * 2,
+                            'page': number, 'page_size': 2, 'num_pages': 10}
+        self.r.request = Mock(side_effect=request)
+
+        items = list(self.r.iter(workers=4, limit=5))
+
+        assert_equal(len(items), 5)
+        assert_equal(self.r.request.call_count, 3)
+
+    def testIterLimitStream(self):
+        page = ('{"resources": [{"sid": "foo"}, {"sid": "bar"}], '
+                '"next_page_uri": "/Resources?Page=1&PageToken=PA1"}')
+        with patch('twilio.rest.resources.base.make_twilio_request') as mock:
+            mock.return_value = Mock(content=page)
+            items = list(self.r.iter(stream=True, limit=2))
+
+        assert_equal(len(items), 2)
+        assert_equal(mock.call_count, 1)
+
+    def testIterLimitZero(self):
+        self.r.request = Mock()
+        assert_equal(list(self.r.iter(limit=0)), [])
+        assert_equal(self.r.request.call_count, 0)
+
+    def testIterRaw(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {
+            self.r.key: [{'sid': 'foo', 'from': '+1', 'date_created': 'x'}],
+        }
+
+        items = list(self.r.iter_raw())
+
+        assert_equal(items, [{'sid': 'foo', 'from': '+1', 'date_created': 'x'}])
+
+    def testIterRawFields(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {
+            self.r.key: [{'sid': 'foo', 'from': '+1', 'date_created': 'x'}],
+        }
+
+        items = list(self.r.iter_raw(fields=['sid', 'from', 'missing']))
+
+        assert_equal(items, [{'sid': 'foo', 'from': '+1', 'missing': None}])
+        self.r.request.assert_called_with(
+            "GET", "https://api.twilio.com/2010-04-01/Resources",
+            params={'PageSize': 1000},
+        )
+
+    def testListRaw(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {
+            self.r.key: [{'sid': 'foo', 'status': 'completed'}],
+        }
+
+        items = self.r.list_raw(fields=['sid'], status='completed')
+
+        assert_equal(items, [{'sid': 'foo'}])
+        self.r.request.assert_called_with(
+            "GET", "https://api.twilio.com/2010-04-01/Resources",
+            params={'Status': 'completed'},
+        )
+
     def testKeyValue(self):
         self.r.key = "Hey"
         assert_equal(self.r.key, "Hey")
@@ -125,9 +387,27 @@ class NextGenListResourceTest(unittest.TestCase):
         self.r.request = Mock()
         self.r.request.return_value = Mock(), {'meta': {'key': 'foos'}, 'foos': [{'sid': '123'}]}
         item = advance_iterator(self.r.iter())
-        self.r.request.assert_called_with("GET", "https://api.twilio.com/2010-04-01/Resources")
+        self.r.request.assert_called_with("GET", "https://api.twilio.com/2010-04-01/Resources?PageSize=1000")
         assert_equal(item.sid, '123')
 
+    def test_iter_limit(self):
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            (Mock(), {'meta': {'key': 'foos', 'next_page_url':
+                               'https://example.com/Resources?PageSize=2'
+                               '&Page=1&PageToken=PT1'},
+                      'foos': [{'sid': '123'}, {'sid': '456'}]}),
+            (Mock(), {'meta': {'key': 'foos', 'next_page_url': None},
+                      'foos': [{'sid': '789'}]}),
+        ]
+
+        items = list(self.r.iter(page_size=2, limit=3))
+
+        assert_equal([item.sid for item in items], ['123', '456', '789'])
+        uri = self.r.request.call_args[0][1]
+        assert_true('PageSize=1' in uri)
+        assert_true('PageToken=PT1' in uri)
+
     def test_iter_one_item(self):
         self.r.request = Mock()
         self.r.request.return_value = Mock(), {'meta': {'key': 'foos', 'next_page_url': None}, 'foos': [{'sid': '123'}]}
@@ -137,6 +417,31 @@ class NextGenListResourceTest(unittest.TestCase):
 
         self.assertRaises(StopIteration, advance_iterator, items)
 
+    def test_iter_raw(self):
+        self.r.request = Mock()
+        self.r.request.return_value = Mock(), {
+            'meta': {'key': 'foos'},
+            'foos': [{'sid': '123', 'friendly_name': 'foo'}],
+        }
+
+        items = list(self.r.iter_raw(fields=['sid']))
+
+        assert_equal(items, [{'sid': '123'}])
+
+    def test_iter_prefetch(self):
+        self.r.request = Mock()
+        self.r.request.side_effect = [
+            (Mock(), {'meta': {'key': 'foos', 'next_page_url': 'NEXT'},
+                      'foos': [{'sid': '123'}]}),
+            (Mock(), {'meta': {'key': 'foos', 'next_page_url': None},
+                      'foos': [{'sid': '456'}]}),
+        ]
+
+        items = list(self.r.iter(prefetch=1))
+
+        assert_equal([i.sid for i in items], ['123', '456'])
+        self.r.request.assert_called_with("GET", "NEXT")
+
     def test_instance_loading(self):
         instance = self.r.load_instance({"sid": "foo"})
 
@@ -172,6 +477,47 @@ class testInstanceResourceInit(unittest.TestCase):
         except AttributeError:
             pass
 
+    def testLoadDateLazily(self):
+        self.r._parse_date = Mock(return_value=datetime(2012, 9, 29))
+        self.r.load({"date_created": "Sat, 29 Sep 2012 12:47:54 +0000"})
+
+        assert_true("date_created" not in self.r.__dict__)
+        assert_equal(self.r.date_created, datetime(2012, 9, 29))
+        assert_equal(self.r.date_created, datetime(2012, 9, 29))
+        self.r._parse_date.assert_called_once_with(
+            "Sat, 29 Sep 2012 12:47:54 +0000")
+
+    def testLoadDateConcurrently(self):
+        reads = []
+
+        def parse(value):
+            # Another thread reads the date while this one is parsing it
+            if self.r._parse_date.call_count == 1:
+                reads.append(self.r.date_created)
+            return datetime(2012, 9, 29)
+
+        self.r._parse_date = Mock(side_effect=parse)
+        self.r.load({"date_created": "Sat, 29 Sep 2012 12:47:54 +0000"})
+
+        assert_equal(self.r.date_created, datetime(2012, 9, 29))
+        assert_equal(reads, [datetime(2012, 9, 29)])
+
+        # A thread which missed the attribute before the last date was
+        # parsed, and looks it up after
+        assert_equal(self.r.__dict__["_unparsed_dates"], {})
+        assert_equal(self.r.__getattr__("date_created"),
+                     datetime(2012, 9, 29))
+
+    def testReloadDate(self):
+        self.r.load({"date_updated": "Sat, 29 Sep 2012 12:47:54 +0000"})
+        assert_equal(self.r.date_updated, datetime(2012, 9, 29, 12, 47, 54))
+
+        other = InstanceResource(self.parent, "123")
+        other.load({"date_updated": "Sun, 30 Sep 2012 08:00:00 +0000"})
+        self.r.load(other.__dict__)
+
+        assert_equal(self.r.date_updated, datetime(2012, 9, 30, 8))
+
     def testLoadNullDate(self):
         self.r.load({"date_created": None, "uri": "foobar"})
         assert self.r.date_created is None
@@ -180,11 +526,39 @@ class testInstanceResourceInit(unittest.TestCase):
         self.r.load({"from": "foo"})
         assert_equal(self.r.from_, "foo")
 
+    def testLoadLeavesEntries(self):
+        entries = {"from": "foo", "uri": "bar",
+                   "date_created": "Sat, 29 Sep 2012 12:47:54 +0000"}
+        self.r.load(entries)
+
+        assert_equal(self.r.from_, "foo")
+        assert_equal(entries, {"from": "foo", "uri": "bar",
+                               "date_created": "Sat, 29 Sep 2012 12:47:54 +0000"})
+
     def testLoadSubresources(self):
         m = Mock()
+        m.key = "foos"
         self.r.subresources = [m]
         self.r.load_subresources()
-        m.assert_called_with(self.r.uri, self.r.auth, self.r.timeout)
+        assert_true(not m.called)
+
+        assert_equal(self.r.foos, m.return_value)
+        assert_equal(self.r.foos, m.return_value)
+        m.assert_called_once_with(self.r.uri, self.r.auth, self.r.timeout,
+                                  http_client=None)
+
+    def testLoadSubresourcesReplacesFields(self):
+        m = Mock()
+        m.key = "foos"
+        self.r.subresources = [m]
+        self.r.load({"foos": "/foos"})
+        self.r.load_subresources()
+
+        assert_equal(self.r.foos, m.return_value)
+
+    def testMissingAttribute(self):
+        self.r.subresources = [Mock(key="foos")]
+        self.assertRaises(AttributeError, getattr, self.r, "bars")
 
 
 class NextGenInstanceResourceTest(unittest.TestCase):
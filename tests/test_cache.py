@@ -0,0 +1,227 @@
+import unittest
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import (
+    CachingHttpClient,
+    InstanceCache,
+)
+from twilio.rest.resources.base import Response
+from twilio.rest.resources.cache import instance_url
+from tests.tools import FakeHttpClient
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+
+
+def queue_json(friendly_name):
+    return '{"sid": "QU123", "friendly_name": "%s"}' % friendly_name
+
+
+class InstanceCacheTest(unittest.TestCase):
+
+    @patch("twilio.rest.resources.cache.time")
+    def test_ttl(self, mock_time):
+        mock_time.time.return_value = 100
+        cache = InstanceCache(ttl=10)
+        cache.set("a", 1)
+
+        mock_time.time.return_value = 109
+        assert_equal(cache.get("a"), 1)
+        mock_time.time.return_value = 110
+        assert_equal(cache.get("a"), None)
+
+        stats = cache.stats()
+        assert_equal(stats['hits'], 1)
+        assert_equal(stats['misses'], 1)
+        assert_equal(stats['expired'], 1)
+        # Expired entries are kept to be revalidated
+        assert_equal(stats['size'], 1)
+        assert_equal(cache.stale("a"), 1)
+
+    def test_lru(self):
+        cache = InstanceCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert_equal(cache.get("b"), None)
+        assert_equal(cache.get("a"), 1)
+        assert_equal(cache.get("c"), 3)
+        assert_equal(cache.stats()['evicted'], 1)
+
+    def test_invalidate(self):
+        cache = InstanceCache()
+        cache.set("a", 1)
+
+        cache.invalidate("a")
+        cache.invalidate("b")
+
+        assert_equal(cache.get("a"), None)
+        assert_equal(cache.stats()['invalidated'], 1)
+
+    def test_instance_url(self):
+        assert_true(instance_url("%s/Queues/QU123.json" % BASE_URI))
+        assert_true(instance_url("https://taskrouter.twilio.com/v1/"
+                                 "Workspaces/WS123/Workflows/WW123"))
+        assert_true(not instance_url("%s/Queues.json" % BASE_URI))
+        assert_true(not instance_url("%s/Queues.json?Page=1" % BASE_URI))
+        assert_true(not instance_url("%s/Usage/Records/Daily.json"
+                                     % BASE_URI))
+
+
+class CachingHttpClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.http_client = FakeHttpClient()
+        self.cache = InstanceCache()
+        self.client = TwilioRestClient("AC123", "token",
+                                       http_client=self.http_client,
+                                       instance_cache=self.cache)
+
+    def test_get(self):
+        self.http_client.contents = [queue_json("1")]
+        first = self.client.queues.get("QU123")
+        second = self.client.queues.get("QU123")
+
+        assert_equal(len(self.http_client.requests), 1)
+        assert_equal(first.friendly_name, second.friendly_name)
+        assert_true(first is not second)
+        assert_equal(self.cache.stats()['hits'], 1)
+
+    def test_no_cache(self):
+        self.http_client.contents = [queue_json("1"), queue_json("2")]
+        self.client.queues.get("QU123")
+
+        resp, queue = self.client.queues.request(
+            "GET", "%s/Queues/QU123" % BASE_URI,
+            headers={"Cache-Control": "no-cache"})
+
+        assert_equal(queue["friendly_name"], "2")
+        assert_equal(len(self.http_client.requests), 2)
+        assert_equal(self.client.queues.get("QU123").friendly_name, "2")
+
+    def test_update_invalidates(self):
+        self.http_client.contents = [queue_json("1"), queue_json("2"),
+                                     queue_json("3")]
+        self.client.queues.get("QU123")
+        self.client.queues.update("QU123", friendly_name="new")
+        queue = self.client.queues.get("QU123")
+
+        assert_equal(queue.friendly_name, "3")
+        assert_equal([m for m, _, _ in self.http_client.requests],
+                     ["GET", "POST", "GET"])
+
+    def test_delete_invalidates(self):
+        self.http_client.contents = [queue_json("1"), (204, ""),
+                                     queue_json("1")]
+        self.client.queues.get("QU123")
+        self.client.queues.delete("QU123")
+        self.client.queues.get("QU123")
+
+        assert_equal(len(self.http_client.requests), 3)
+
+    def test_lists_not_cached(self):
+        self.http_client.request = Mock(return_value=Response(
+            Mock(status=200), '{"queues": []}', "%s/Queues.json" % BASE_URI))
+
+        self.client.queues.list()
+        self.client.queues.list()
+
+        assert_equal(self.http_client.request.call_count, 2)
+
+    def test_errors_not_cached(self):
+        http_client = Mock()
+        http_client.request.return_value = Mock(status_code=404)
+        client = CachingHttpClient(http_client, self.cache)
+        url = "%s/Queues/QU404.json" % BASE_URI
+
+        client.request("GET", url)
+        client.request("GET", url)
+
+        assert_equal(http_client.request.call_count, 2)
+
+
+class ConditionalRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.http_client = Mock()
+        self.cache = InstanceCache(ttl=0)
+        self.client = CachingHttpClient(self.http_client, self.cache)
+        self.url = "%s/Applications/AP123.json" % BASE_URI
+
+    def respond(self, status, content="", headers=None):
+        self.http_client.request.return_value = Response(
+            Mock(status=status), content, self.url, headers=headers)
+
+    def test_not_modified(self):
+        self.respond(200, '{"sid": "AP123"}', {"ETag": '"abc"',
+                                               "Last-Modified": "yesterday"})
+        first = self.client.request("GET", self.url)
+        assert_equal(first.json(), {"sid": "AP123"})
+
+        self.respond(304)
+        second = self.client.request("GET", self.url)
+
+        assert_true(second is first)
+        self.http_client.request.assert_called_with(
+            "GET", self.url, body=None,
+            headers={"If-None-Match": '"abc"',
+                     "If-Modified-Since": "yesterday"},
+            auth=None, timeout=None, allow_redirects=False,
+        )
+        assert_equal(self.cache.stats()['revalidated'], 1)
+
+    def test_modified(self):
+        self.respond(200, '{"sid": "AP123"}', {"ETag": '"abc"'})
+        self.client.request("GET", self.url)
+
+        self.respond(200, '{"sid": "AP123", "friendly_name": "new"}',
+                     {"ETag": '"def"'})
+        resp = self.client.request("GET", self.url)
+
+        assert_equal(resp.json()["friendly_name"], "new")
+        assert_equal(self.cache.stale(self.url).headers["etag"], '"def"')
+
+    def test_no_validators(self):
+        self.respond(200, '{"sid": "AP123"}')
+        self.client.request("GET", self.url)
+        self.client.request("GET", self.url)
+
+        self.http_client.request.assert_called_with(
+            "GET", self.url, body=None, headers=None, auth=None,
+            timeout=None, allow_redirects=False,
+        )
+
+    def test_pages(self):
+        self.cache.ttl = 60
+        url = "https://pricing.twilio.com/v1/Voice/Countries?PageSize=50"
+        self.respond(200, '{"countries": []}', {"ETag": '"abc"'})
+        self.client.request("GET", url)
+
+        # Pages aren't kept, so they're neither served nor revalidated
+        self.client.request("GET", url)
+
+        assert_equal(self.cache.stats()['size'], 0)
+        assert_equal(self.http_client.request.call_count, 2)
+        assert_equal(self.http_client.request.call_args[1]['headers'], None)
+
+    def test_not_conditional(self):
+        self.client.conditional = False
+        self.respond(200, '{"sid": "AP123"}', {"ETag": '"abc"'})
+        self.client.request("GET", self.url)
+        self.client.request("GET", self.url)
+
+        assert_equal(self.http_client.request.call_args[1]['headers'], None)
+
+
+def test_response_json_decoded_once():
+    resp = Response(Mock(status=200), '{"sid": "AP123"}', "")
+    resp.codec = Mock()
+
+    resp.json()
+    resp.json()
+
+    resp.codec.loads.assert_called_once_with('{"sid": "AP123"}')
@@ -49,6 +49,7 @@ class CallFeedbackTest(unittest.TestCase):
             "POST", "/base/CA123/Feedback",
             data=exp_data, auth=AUTH,
             timeout=ANY, use_json_extension=True,
+            http_client=ANY,
         )
 
     @patch('twilio.rest.resources.base.make_twilio_request')
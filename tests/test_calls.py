@@ -1,6 +1,7 @@
 from datetime import date
 from mock import patch, Mock
-from nose.tools import assert_true
+from nose.tools import assert_equal, assert_true, raises
+from twilio.exceptions import TwilioException
 from twilio.rest.resources import Calls, Call
 from tests.tools import create_mock_json
 
@@ -94,7 +95,7 @@ def test_paging_iter(mock):
 
     uri = "%s/Calls" % (BASE_URI)
     next(list_resource.iter(started_before=date(2010, 12, 5)))
-    exp_params = {'StartTime<': '2010-12-05'}
+    exp_params = {'StartTime<': '2010-12-05', 'PageSize': 1000}
 
     mock.assert_called_with("GET", uri, params=exp_params, auth=AUTH,
                             use_json_extension=True)
@@ -154,3 +155,80 @@ def test_delete(req):
     app.delete()
     uri = "https://api.twilio.com/2010-04-01/Accounts/AC123/Calls/CA123"
     req.assert_called_with("DELETE", uri)
+
+
+@patch("twilio.rest.resources.base.ListResource.iter")
+def test_parallel_iter(mock):
+    mock.side_effect = lambda **kw: iter([kw["StartTime>"]])
+
+    calls = list_resource.parallel_iter(date(2016, 1, 1), date(2016, 1, 4),
+                                        shards=2, ordered=True)
+
+    assert_equal(list(calls), ["2016-01-03", "2016-01-01"])
+    mock.assert_any_call(**{
+        "from": None,
+        "StartTime<": "2016-01-04",
+        "StartTime>": "2016-01-03",
+        "StartTime": None,
+        "EndTime<": None,
+        "EndTime>": None,
+        "EndTime": None,
+    })
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_iter_raw(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    resp.status_code = 200
+    mock.return_value = resp
+
+    calls = list_resource.iter_raw(fields=["sid"], started_after=date(2016, 1, 1))
+
+    call = next(calls)
+    assert_equal(call, {"sid": "CA24388be8ed59a5733d2c1c1c69a83a28"})
+    mock.assert_called_with("GET", "%s/Calls" % BASE_URI, auth=AUTH,
+                            params={"StartTime>": "2016-01-01",
+                                    "PageSize": 1000},
+                            use_json_extension=True)
+
+
+def list_response(method, uri, **kwargs):
+    if uri.endswith("/Calls"):
+        return create_mock_json("tests/resources/calls_list.json")
+    return create_mock_json("tests/resources/recordings_list.json")
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_iter_expand(mock):
+    mock.side_effect = list_response
+
+    call = next(list_resource.iter(expand=["recordings"]))
+
+    # The first page of calls, and the recordings of each of its calls.
+    # call_count isn't updated atomically, so count the recorded calls.
+    assert_equal(len(mock.call_args_list), 51)
+    recordings_uri = "%s/Calls/%s/Recordings" % (BASE_URI, call.sid)
+    mock.assert_any_call("GET", recordings_uri, params={}, auth=AUTH,
+                         use_json_extension=True)
+
+    recordings = call.recordings.list()
+    assert_equal(len(recordings), 50)
+    assert_equal(len(mock.call_args_list), 51)
+
+    call.recordings.list(page=1)
+    assert_equal(len(mock.call_args_list), 52)
+
+
+@raises(TwilioException)
+def test_iter_expand_unknown():
+    next(list_resource.iter(expand=["recordings", "transcriptions"]))
+
+
+@raises(TwilioException)
+def test_iter_expand_feedback():
+    next(list_resource.iter(expand=["feedback"]))
+
+
+@raises(TwilioException)
+def test_iter_expand_raw():
+    next(list_resource.iter(raw=True, expand=["recordings"]))
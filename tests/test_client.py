@@ -22,12 +22,23 @@ class RestClientTest(unittest.TestCase):
         mock.assert_called_with("GET", "https://api.twilio.com/2010-04-01",
                                 headers={"User-Agent": ANY,
                                          'Accept-Charset': 'utf-8'},
-                                params={}, auth=AUTH, data=None)
+                                params={}, auth=AUTH, data=None,
+                                http_client=self.client.http_client)
         called_kwargs = mock.mock_calls[0][2]
         self.assertTrue(
             'twilio-python' in called_kwargs['headers']['User-Agent']
         )
 
+    def test_request_uses_http_client(self):
+        http_client = Mock()
+        http_client.request.return_value = Mock(content="<Response/>")
+        client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                  http_client=http_client)
+
+        assert_equal(client.request("2010-04-01", method="GET"),
+                     "<Response/>")
+        assert_true(http_client.request.called)
+
     def test_connect_apps(self):
         assert_true(isinstance(self.client.connect_apps,
                                resources.ConnectApps))
@@ -36,6 +47,26 @@ class RestClientTest(unittest.TestCase):
         assert_true(isinstance(self.client.authorized_connect_apps,
                                resources.AuthorizedConnectApps))
 
+    def test_default_http_client(self):
+        http_client = self.client.http_client
+        assert_true(isinstance(http_client, resources.Httplib2Client))
+        assert_true(isinstance(http_client.connection_pool,
+                               resources.ConnectionPool))
+        assert_true(self.client.calls.http_client is http_client)
+
+    def test_http_client(self):
+        http_client = Mock()
+        http_client.request.return_value = resources.Response(
+            Mock(status=200), '{"queue_members": []}', "url"
+        )
+        client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                  http_client=http_client)
+        assert_equal([], client.members("QU123").list())
+        http_client.request.assert_called_with(
+            "GET", ANY, body=None, headers=ANY, auth=AUTH, timeout=None,
+            allow_redirects=False,
+        )
+
     @patch("twilio.rest.resources.base.make_request")
     def test_conferences(self, mock):
         mock.return_value = Mock()
@@ -51,7 +82,7 @@ class RestClientTest(unittest.TestCase):
         uri = "https://api.twilio.com/2010-04-01/Accounts/ACCOUNT_SID" \
               "/Queues/QU123/Members"
         mock.assert_called_with("GET", uri, params={}, auth=AUTH,
-                                use_json_extension=True)
+                                use_json_extension=True, http_client=ANY)
 
     @patch("twilio.rest.resources.base.make_request")
     def test_workflows(self, request):
@@ -64,7 +95,7 @@ class RestClientTest(unittest.TestCase):
         assert_true(workflows[0].sid is not None)
         uri = "https://taskrouter.twilio.com/v1/Workspaces/WS123/Workflows"
         request.assert_called_with("GET", uri, headers=ANY, params={},
-                                   auth=AUTH)
+                                   auth=AUTH, http_client=ANY)
 
 
 class RestClientTimeoutTest(unittest.TestCase):
@@ -79,7 +110,8 @@ class RestClientTimeoutTest(unittest.TestCase):
         self.client.members("QU123").list()
         mock_request.assert_called_with("GET", ANY, params=ANY, auth=AUTH,
                                         timeout=sentinel.timeout,
-                                        use_json_extension=True)
+                                        use_json_extension=True,
+                                        http_client=ANY)
 
     @patch("twilio.rest.resources.base.make_twilio_request")
     def test_arbitrary_member(self, mock_request):
@@ -90,4 +122,5 @@ class RestClientTimeoutTest(unittest.TestCase):
         assert_equal([], self.client.sms.short_codes.list())
         mock_request.assert_called_once_with("GET", ANY, params=ANY, auth=AUTH,
                                              timeout=sentinel.timeout,
-                                             use_json_extension=True)
+                                             use_json_extension=True,
+                                             http_client=ANY)
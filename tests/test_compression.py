@@ -0,0 +1,169 @@
+import gzip
+import io
+import unittest
+import zlib
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest.resources import Httplib2Client, TransferStats, Urllib3Client
+from twilio.rest.resources.base import prepare_twilio_request
+from twilio.rest.resources.compression import (
+    Decompressor,
+    accept_encoding,
+    content_encoding,
+    decompress_body,
+    decompress_stream,
+)
+
+BODY = b'{"calls": [' + b', '.join([b'{"sid": "CA123"}'] * 200) + b']}'
+
+
+def gzipped(data):
+    buf = io.BytesIO()
+    f = gzip.GzipFile(fileobj=buf, mode="wb")
+    f.write(data)
+    f.close()
+    return buf.getvalue()
+
+
+def raw_deflated(data):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class DecompressorTest(unittest.TestCase):
+
+    def decompress(self, encoding, data, size):
+        decompressor = Decompressor(encoding)
+        chunks = [decompressor.decompress(c) for c in chunked(data, size)]
+        return b"".join(chunks) + decompressor.flush()
+
+    def test_gzip(self):
+        for size in (1, 7, 1024):
+            assert_equal(self.decompress("gzip", gzipped(BODY), size), BODY)
+
+    def test_deflate(self):
+        for size in (1, 7, 1024):
+            assert_equal(self.decompress("deflate", zlib.compress(BODY),
+                                         size), BODY)
+
+    def test_raw_deflate(self):
+        assert_equal(self.decompress("deflate", raw_deflated(BODY), 16),
+                     BODY)
+
+
+class CompressionTest(unittest.TestCase):
+
+    def test_content_encoding(self):
+        assert_equal(content_encoding({"Content-Encoding": "GZIP "}), "gzip")
+        assert_equal(content_encoding({"content-encoding": "deflate"}),
+                     "deflate")
+        assert_equal(content_encoding({"content-encoding": "br"}), None)
+        assert_equal(content_encoding({}), None)
+
+    def test_decompress_body(self):
+        stats = TransferStats()
+        compressed = gzipped(BODY)
+
+        assert_equal(decompress_body(compressed, "gzip", stats), BODY)
+        assert_equal(decompress_body(b"{}", None, stats), b"{}")
+
+        counters = stats.stats()
+        assert_equal(counters['responses'], 2)
+        assert_equal(counters['compressed_responses'], 1)
+        assert_equal(counters['compressed_bytes'], len(compressed) + 2)
+        assert_equal(counters['uncompressed_bytes'], len(BODY) + 2)
+        assert_equal(counters['ratio'] < 0.5, True)
+
+    def test_decompress_stream(self):
+        stats = TransferStats()
+        compressed = gzipped(BODY)
+        chunks = iter(chunked(compressed, 10))
+        stream = decompress_stream(chunks, "gzip", stats)
+
+        first = next(stream)
+        assert_equal(BODY.startswith(first), True)
+        assert_equal(first + b"".join(stream), BODY)
+        assert_equal(stats.stats()['compressed_bytes'], len(compressed))
+        assert_equal(stats.stats()['uncompressed_bytes'], len(BODY))
+
+    def test_no_bytes(self):
+        assert_equal(TransferStats().stats()['ratio'], None)
+
+    def test_accept_encoding(self):
+        headers = accept_encoding({"Accept": "application/json"})
+        assert_equal(headers, {"Accept": "application/json",
+                               "Accept-Encoding": "gzip, deflate"})
+
+        headers = accept_encoding({"accept-encoding": "identity"})
+        assert_equal(headers, {"accept-encoding": "identity"})
+
+    def test_twilio_request(self):
+        # Only transports which decompress responses ask for compression
+        uri, kwargs = prepare_twilio_request("GET", "https://api.twilio.com")
+        assert_true("Accept-Encoding" not in kwargs['headers'])
+
+
+class TransportCompressionTest(unittest.TestCase):
+
+    def urllib3_response(self, body, headers):
+        pool_manager = Mock()
+        resp = pool_manager.urlopen.return_value
+        resp.status = 200
+        resp.headers = headers
+        resp.data = body
+        resp.stream.return_value = iter(chunked(body, 32))
+        return pool_manager
+
+    def test_urllib3(self):
+        pool_manager = self.urllib3_response(gzipped(BODY),
+                                             {"Content-Encoding": "gzip"})
+        client = Urllib3Client(pool_manager=pool_manager)
+
+        resp = client.request("GET", "https://api.twilio.com/")
+        assert_equal(resp.json()["calls"][0], {"sid": "CA123"})
+        assert_equal(client.transfer_stats.stats()['compressed_responses'],
+                     1)
+
+    def test_urllib3_accept_encoding(self):
+        pool_manager = self.urllib3_response(BODY, {})
+        client = Urllib3Client(pool_manager=pool_manager)
+
+        client.request("GET", "https://api.twilio.com/",
+                       headers={"Accept": "application/json"})
+
+        headers = pool_manager.urlopen.call_args[1]['headers']
+        assert_equal(headers['Accept-Encoding'], "gzip, deflate")
+
+    def test_urllib3_stream(self):
+        pool_manager = self.urllib3_response(zlib.compress(BODY),
+                                             {"Content-Encoding": "deflate"})
+        client = Urllib3Client(pool_manager=pool_manager, stream=True)
+
+        resp = client.request("GET", "https://api.twilio.com/")
+        assert_equal(b"".join(resp.iter_content()), BODY)
+        stats = client.transfer_stats.stats()
+        assert_equal(stats['compressed_bytes'], len(zlib.compress(BODY)))
+        assert_equal(stats['uncompressed_bytes'], len(BODY))
+
+    @patch('twilio.rest.resources.base.Response')
+    @patch('httplib2.Http')
+    def test_httplib2(self, http_mock, response_mock):
+        http = http_mock.return_value
+        client = Httplib2Client()
+
+        http.request.return_value = ({"-content-encoding": "gzip"}, BODY)
+        client.request("GET", "https://api.twilio.com/")
+        http.request.return_value = ({}, b"{}")
+        client.request("GET", "https://api.twilio.com/")
+
+        stats = client.transfer_stats.stats()
+        assert_equal(stats['responses'], 2)
+        assert_equal(stats['unmeasured_responses'], 1)
+        assert_equal(stats['compressed_bytes'], 2)
+        assert_equal(stats['uncompressed_bytes'], 2)
@@ -0,0 +1,231 @@
+import threading
+import time
+import unittest
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitedHttpClient,
+    RateLimitedHttpClient,
+    RateLimiter,
+)
+from twilio.rest.resources.concurrency import request_kind
+
+URL = "https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json"
+
+
+class AdaptiveConcurrencyLimiterTest(unittest.TestCase):
+
+    def test_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=3)
+
+        for _ in range(10):
+            limiter.release(limiter.acquire(), 0.1)
+
+        assert_equal(limiter.stats(), {
+            'limit': 3,
+            'in_flight': 0,
+            'increases': 3,
+            'decreases': 0,
+        })
+
+    def test_decrease_on_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+
+        limiter.release(limiter.acquire(), 0.1, overloaded=True)
+
+        assert_equal(limiter.stats()['limit'], 4)
+
+    def test_decrease_on_latency(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, latency_target=0.5)
+
+        limiter.release(limiter.acquire(), 2)
+
+        assert_equal(limiter.stats()['limit'], 4)
+
+    def test_decrease_on_slowdown(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+
+        for _ in range(10):
+            limiter.release(limiter.acquire(), 0.2)
+        limiter.release(limiter.acquire(), 1)
+
+        assert_equal(limiter.stats()['decreases'], 1)
+
+    def test_steady_slow_responses(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+
+        for _ in range(50):
+            limiter.release(limiter.acquire(), 3)
+
+        assert_equal(limiter.stats()['decreases'], 0)
+        assert_true(limiter.stats()['limit'] > 8)
+
+    def test_slow_responses_catch_up(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=8)
+
+        for _ in range(10):
+            limiter.release(limiter.acquire(), 0.2)
+        for _ in range(50):
+            limiter.release(limiter.acquire(), 3)
+
+        # Once the baseline follows the slower responses, the cap recovers
+        assert_true(limiter.stats()['decreases'] < 10)
+        assert_equal(limiter.stats()['limit'], 8)
+
+    def test_fast_outlier_fades(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=8)
+
+        for _ in range(10):
+            limiter.release(limiter.acquire(), 1)
+        limiter.release(limiter.acquire(), 0.05)
+        for _ in range(50):
+            limiter.release(limiter.acquire(), 1)
+
+        assert_true(limiter.stats()['decreases'] < 10)
+        assert_equal(limiter.stats()['limit'], 8)
+        assert_true(limiter.baselines[None] > 0.9)
+
+    def test_failures_not_measured(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+
+        limiter.release(limiter.acquire(), 1)
+        for _ in range(5):
+            limiter.release(limiter.acquire(), 0.01, failed=True)
+            limiter.release(limiter.acquire(), 0.01, overloaded=True)
+
+        assert_equal(limiter.baselines, {None: 1})
+
+    def test_baselines_per_kind(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+
+        for _ in range(20):
+            limiter.release(limiter.acquire(), 0.1, kind="instance")
+            limiter.release(limiter.acquire(), 3, kind="page")
+
+        assert_equal(limiter.stats()['decreases'], 0)
+
+    def test_decrease_once_per_burst(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+        tokens = [limiter.acquire() for _ in range(4)]
+
+        for token in tokens:
+            limiter.release(token, 0.1, overloaded=True)
+
+        assert_equal(limiter.stats()['limit'], 4)
+        assert_equal(limiter.stats()['decreases'], 1)
+
+    def test_minimum(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, minimum=1)
+
+        for _ in range(5):
+            limiter.release(limiter.acquire(), 0.1, overloaded=True)
+
+        assert_equal(limiter.stats()['limit'], 1)
+
+    def test_acquire_waits(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=1)
+        token = limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        time.sleep(0.05)
+        assert_true(not acquired.is_set())
+
+        limiter.release(token, 0.1)
+        thread.join(1)
+        assert_true(acquired.is_set())
+
+
+class ConcurrencyLimitedHttpClientTest(unittest.TestCase):
+
+    def test_request(self):
+        http_client = Mock()
+        http_client.request.return_value = Mock(status_code=200)
+        limiter = AdaptiveConcurrencyLimiter(initial=2)
+        client = ConcurrencyLimitedHttpClient(http_client, limiter)
+
+        resp = client.request("GET", URL, auth=("AC123", "token"))
+
+        assert_equal(resp, http_client.request.return_value)
+        http_client.request.assert_called_with(
+            "GET", URL, body=None, headers=None, auth=("AC123", "token"),
+            timeout=None, allow_redirects=False,
+        )
+        assert_equal(limiter.stats()['increases'], 1)
+
+    def test_overloaded_status(self):
+        http_client = Mock()
+        http_client.request.return_value = Mock(status_code=429)
+        limiter = AdaptiveConcurrencyLimiter(initial=4)
+        client = ConcurrencyLimitedHttpClient(http_client, limiter)
+
+        client.request("POST", URL)
+
+        assert_equal(limiter.stats()['limit'], 2)
+
+    @raises(IOError)
+    def test_connection_error(self):
+        http_client = Mock()
+        http_client.request.side_effect = IOError
+        limiter = AdaptiveConcurrencyLimiter(initial=4)
+        client = ConcurrencyLimitedHttpClient(http_client, limiter)
+
+        try:
+            client.request("GET", URL)
+        finally:
+            assert_equal(limiter.stats()['limit'], 2)
+            assert_equal(limiter.stats()['in_flight'], 0)
+
+    def test_error_not_measured(self):
+        http_client = Mock()
+        http_client.request.return_value = Mock(status_code=404)
+        limiter = AdaptiveConcurrencyLimiter(initial=4)
+        client = ConcurrencyLimitedHttpClient(http_client, limiter)
+
+        client.request("GET", URL)
+
+        assert_equal(limiter.baselines, {})
+        assert_equal(limiter.stats()['increases'], 1)
+
+    @patch("twilio.rest.resources.concurrency.time")
+    def test_slow_response(self, mock_time):
+        mock_time.time.side_effect = [10.0, 13.0]
+        http_client = Mock()
+        http_client.request.return_value = Mock(status_code=200)
+        limiter = AdaptiveConcurrencyLimiter(initial=4, latency_target=2)
+        client = ConcurrencyLimitedHttpClient(http_client, limiter)
+
+        client.request("GET", URL)
+
+        assert_equal(limiter.stats()['limit'], 2)
+
+    def test_request_kind(self):
+        url = ("https://api.twilio.com/2010-04-01/Accounts/"
+               "AC0123456789abcdef0123456789abcdef/Calls/"
+               "CAfedcba9876543210fedcba9876543210.json")
+
+        assert_equal(request_kind("GET", url),
+                     ("GET", "/2010-04-01/Accounts/{sid}/Calls/{sid}.json"))
+        assert_equal(request_kind("GET", URL + "?PageSize=1000"),
+                     ("GET", "/2010-04-01/Accounts/AC123/Messages.json"))
+
+    def test_client(self):
+        limiter = AdaptiveConcurrencyLimiter()
+        client = TwilioRestClient("AC123", "token",
+                                  rate_limiter=RateLimiter(account_rate=10),
+                                  concurrency_limiter=limiter)
+
+        # Requests wait for a rate limit token before taking a slot
+        assert_true(isinstance(client.http_client, RateLimitedHttpClient))
+        limited = client.http_client.http_client
+        assert_true(isinstance(limited, ConcurrencyLimitedHttpClient))
+        assert_true(limited.concurrency_limiter is limiter)
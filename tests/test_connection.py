@@ -0,0 +1,98 @@
+import unittest
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest.resources.connection import ConnectionPool
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ConnectionPool(max_size=2, idle_timeout=30)
+        self.factory = Mock(side_effect=lambda: Mock(connections={}))
+
+    def test_reuses_idle_connection(self):
+        with self.pool.connection('api', self.factory) as first:
+            pass
+        with self.pool.connection('api', self.factory) as second:
+            pass
+
+        assert_true(first is second)
+        assert_equal(self.factory.call_count, 1)
+        stats = self.pool.stats()
+        assert_equal(stats['created'], 1)
+        assert_equal(stats['reused'], 1)
+        assert_equal(stats['idle'], 1)
+
+    def test_connections_are_per_key(self):
+        with self.pool.connection('api', self.factory) as first:
+            pass
+        with self.pool.connection('lookups', self.factory) as second:
+            pass
+
+        assert_true(first is not second)
+        assert_equal(self.pool.stats()['created'], 2)
+
+    def test_concurrent_checkouts_get_distinct_connections(self):
+        with self.pool.connection('api', self.factory) as first:
+            with self.pool.connection('api', self.factory) as second:
+                assert_true(first is not second)
+
+        assert_equal(self.pool.stats()['idle'], 2)
+
+    def test_full_pool_discards_extra_connections(self):
+        conn = Mock()
+        with self.pool.connection('api', self.factory) as first:
+            first.connections['api'] = conn
+            with self.pool.connection('api', self.factory):
+                with self.pool.connection('api', self.factory):
+                    pass
+
+        conn.close.assert_called_with()
+        stats = self.pool.stats()
+        assert_equal(stats['idle'], 2)
+        assert_equal(stats['discarded'], 1)
+
+    def test_error_discards_connection(self):
+        try:
+            with self.pool.connection('api', self.factory):
+                raise IOError()
+        except IOError:
+            pass
+
+        stats = self.pool.stats()
+        assert_equal(stats['idle'], 0)
+        assert_equal(stats['discarded'], 1)
+
+    def test_interrupt_discards_connection(self):
+        try:
+            with self.pool.connection('api', self.factory):
+                raise KeyboardInterrupt()
+        except KeyboardInterrupt:
+            pass
+
+        stats = self.pool.stats()
+        assert_equal(stats['idle'], 0)
+        assert_equal(stats['discarded'], 1)
+
+    @patch('twilio.rest.resources.connection.time')
+    def test_idle_connections_are_evicted(self, mock_time):
+        mock_time.time.return_value = 100
+        with self.pool.connection('api', self.factory) as first:
+            pass
+
+        mock_time.time.return_value = 131
+        with self.pool.connection('api', self.factory) as second:
+            pass
+
+        assert_true(first is not second)
+        stats = self.pool.stats()
+        assert_equal(stats['evicted'], 1)
+        assert_equal(stats['created'], 2)
+
+    def test_clear(self):
+        with self.pool.connection('api', self.factory):
+            pass
+        self.pool.clear()
+        assert_equal(self.pool.stats()['idle'], 0)
@@ -1,7 +1,9 @@
 from datetime import datetime
 from datetime import date
 
-from nose.tools import assert_equal
+import pytz
+
+from nose.tools import assert_equal, assert_true, raises
 
 from twilio.rest.resources import parse_date
 from twilio.rest.resources import transform_params
@@ -9,6 +11,12 @@ from twilio.rest.resources import convert_keys
 from twilio.rest.resources import convert_case
 from twilio.rest.resources import convert_boolean
 from twilio.rest.resources import normalize_dates
+from twilio.rest.resources.util import (
+    merge_iter,
+    parse_iso_date,
+    parse_rfc2822_date,
+    split_dates,
+)
 
 
 def test_date():
@@ -100,3 +108,68 @@ def test_convert_keys():
     }
 
     assert_equal(ed, convert_keys(d))
+
+
+def test_split_dates():
+    ranges = split_dates(date(2016, 1, 1), datetime(2016, 1, 10, 12), 3)
+    assert_equal(ranges, [
+        (date(2016, 1, 7), date(2016, 1, 10)),
+        (date(2016, 1, 4), date(2016, 1, 6)),
+        (date(2016, 1, 1), date(2016, 1, 3)),
+    ])
+
+
+def test_split_dates_more_shards_than_days():
+    ranges = split_dates(date(2016, 1, 1), date(2016, 1, 2), 5)
+    assert_equal(ranges, [
+        (date(2016, 1, 2), date(2016, 1, 2)),
+        (date(2016, 1, 1), date(2016, 1, 1)),
+    ])
+
+
+def test_merge_iter_ordered():
+    merged = merge_iter([iter([1, 2, 3]), iter([]), iter([4, 5])], size=1,
+                        ordered=True)
+    assert_equal(list(merged), [1, 2, 3, 4, 5])
+
+
+def test_merge_iter_unordered():
+    merged = merge_iter([iter([1, 2, 3]), iter([4, 5])], size=1)
+    assert_equal(sorted(merged), [1, 2, 3, 4, 5])
+
+
+@raises(ValueError)
+def test_merge_iter_error():
+    def fail():
+        yield 1
+        raise ValueError("boom")
+
+    list(merge_iter([fail(), iter([2])]))
+
+
+def test_parse_rfc2822_date():
+    assert_equal(parse_rfc2822_date("Tue, 15 Feb 2011 04:21:00 +0000"),
+                 datetime(2011, 2, 15, 4, 21))
+
+
+def test_parse_rfc2822_date_other_formats():
+    assert_equal(parse_rfc2822_date("15 Feb 2011 04:21:00 GMT"),
+                 datetime(2011, 2, 15, 4, 21))
+    assert_equal(parse_rfc2822_date("Tue, 15 Xyz 2011 04:21:00 +0000"), None)
+
+
+def test_parse_iso_date():
+    assert_equal(parse_iso_date("2015-07-30T20:00:01Z"),
+                 datetime(2015, 7, 30, 20, 0, 1, tzinfo=pytz.utc))
+
+
+def test_parse_iso_date_invalid():
+    assert_equal(parse_iso_date("2015-07-30T25:00:00Z"),
+                 "2015-07-30T25:00:00Z")
+    assert_equal(parse_iso_date("not a date"), "not a date")
+
+
+def test_parse_date_cached():
+    s = "Wed, 16 Feb 2011 04:21:00 +0000"
+    assert_true(parse_rfc2822_date(s) is parse_rfc2822_date(s))
+    assert_true(s in parse_rfc2822_date.cache)
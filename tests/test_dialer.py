@@ -0,0 +1,143 @@
+import threading
+import unittest
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Call, Dialer
+
+
+class FakeCalls(object):
+    """Calls which stay active until they've been checked `rings` times"""
+
+    uri = "https://api.twilio.com/2010-04-01/Accounts/AC123/Calls"
+
+    def __init__(self, rings=1, errors=()):
+        self.rings = rings
+        self.errors = list(errors)
+        self.checks = {}
+        self.headers = []
+        self.created = []
+        self.lock = threading.Lock()
+        self.max_active = 0
+
+    def active(self):
+        return sum(1 for n in self.checks.values() if n < self.rings)
+
+    def create(self, to, **kwargs):
+        if to == "bad":
+            raise TwilioRestException(400, "/Calls", "Invalid To")
+        with self.lock:
+            sid = "CA%d" % len(self.created)
+            self.created.append(dict(kwargs, to=to))
+            self.checks[sid] = 0
+            self.max_active = max(self.max_active, self.active())
+        return Mock(sid=sid, status=Call.QUEUED)
+
+    def request(self, method, uri, headers=None):
+        sid = uri.rsplit("/", 1)[1]
+        with self.lock:
+            self.headers.append(headers)
+            if self.errors:
+                raise self.errors.pop(0)
+            self.checks[sid] += 1
+            ended = self.checks[sid] >= self.rings
+        status = Call.COMPLETED if ended else Call.IN_PROGRESS
+        return Mock(), {"sid": sid, "status": status}
+
+
+class DialerTest(unittest.TestCase):
+
+    def test_run(self):
+        calls = FakeCalls(rings=2)
+        dialer = Dialer(calls, cps=1000, max_active=3, poll_interval=0.001,
+                        from_="+15555555555", url="http://example.com")
+
+        stats = dialer.run(["+1%d" % i for i in range(10)])
+
+        assert_equal(len(calls.created), 10)
+        assert_equal(calls.created[0], {"to": "+10", "from_": "+15555555555",
+                                        "url": "http://example.com"})
+        assert_true(calls.max_active <= 3)
+        assert_equal(stats['dialed'], 10)
+        assert_equal(stats['active'], 0)
+        assert_equal(stats['ended'], 10)
+        assert_equal(stats['statuses'], {Call.COMPLETED: 10})
+
+    def test_recipient_arguments(self):
+        calls = FakeCalls()
+        dialer = Dialer(calls, cps=1000, poll_interval=0.001, url="a")
+
+        dialer.run([{"to": "+1", "url": "b"}])
+
+        assert_equal(calls.created, [{"to": "+1", "url": "b"}])
+
+    def test_failed(self):
+        calls = FakeCalls()
+        dialer = Dialer(calls, cps=1000, poll_interval=0.001)
+
+        stats = dialer.run(["+1", "bad"])
+
+        assert_equal(stats['dialed'], 1)
+        assert_equal(stats['failed'], 1)
+        assert_equal(dialer.errors[0][0], {"to": "bad"})
+        assert_true(isinstance(dialer.errors[0][1], TwilioRestException))
+
+    def test_cps(self):
+        calls = FakeCalls()
+        dialer = Dialer(calls, cps=1000, max_active=100, poll_interval=0.001)
+        dialer.bucket = Mock()
+        dialer.bucket.take.return_value = 0
+
+        dialer.run(["+1", "+2", "+3"])
+
+        assert_equal(dialer.bucket.take.call_count, 3)
+
+    def test_update_status(self):
+        calls = FakeCalls()
+        dialer = Dialer(calls, cps=1000, poll_interval=None)
+        dialer.active["CA1"] = Call.QUEUED
+
+        dialer.update_status("CA1", Call.RINGING)
+        assert_equal(dialer.stats()['active'], 1)
+
+        dialer.update_status("CA1", Call.NO_ANSWER)
+        dialer.update_status("CA2", Call.COMPLETED)
+        stats = dialer.stats()
+        assert_equal(stats['active'], 0)
+        assert_equal(stats['ended'], 1)
+        assert_equal(stats['statuses'], {Call.NO_ANSWER: 1})
+
+    def test_poll_skips_cache(self):
+        calls = FakeCalls()
+        dialer = Dialer(calls, cps=1000, poll_interval=0.001)
+
+        dialer.run(["+1"])
+
+        assert_equal(calls.headers, [{"Cache-Control": "no-cache"}])
+
+    def test_poll_errors_retried(self):
+        calls = FakeCalls(errors=[
+            TwilioRestException(503, "/Calls/CA0", "Unavailable"),
+            IOError("Connection reset"),
+        ])
+        dialer = Dialer(calls, cps=1000, poll_interval=0.001)
+
+        stats = dialer.run(["+1", "+2"])
+
+        assert_equal(stats['ended'], 2)
+        assert_equal(stats['statuses'], {Call.COMPLETED: 2})
+        assert_equal(dialer.poll_errors, {})
+
+    def test_poll_errors_give_up(self):
+        calls = FakeCalls(errors=[
+            TwilioRestException(404, "/Calls/CA0", "Not found"),
+        ] * 3)
+        dialer = Dialer(calls, cps=1000, poll_interval=0.001,
+                        max_poll_errors=3)
+
+        stats = dialer.run(["+1"])
+
+        assert_equal(stats['active'], 0)
+        assert_equal(stats['statuses'], {'unknown': 1})
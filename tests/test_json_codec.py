@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio import jwt
+from twilio import json_codec
+from twilio.exceptions import TwilioException
+from twilio.json_codec import JsonCodec, OrjsonCodec, UjsonCodec, get_codec
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import (
+    HttpClient,
+    JsonCodecHttpClient,
+    Response,
+)
+
+
+class JsonCodecTest(unittest.TestCase):
+
+    def test_loads(self):
+        codec = JsonCodec()
+        expected = {"body": u"héllo"}
+        assert_equal(codec.loads(u'{"body": "héllo"}'), expected)
+        assert_equal(codec.loads(u'{"body": "héllo"}'.encode('utf-8')),
+                     expected)
+
+    def test_dumps(self):
+        assert_equal(JsonCodec().loads(JsonCodec().dumps({"a": [1]})),
+                     {"a": [1]})
+
+    def test_orjson_decodes_bytes(self):
+        with patch.object(json_codec, 'orjson') as orjson:
+            orjson.dumps.return_value = b'{"a":1}'
+            codec = OrjsonCodec()
+            codec.loads(b'{"a":1}')
+            assert_equal(codec.dumps({"a": 1}), u'{"a":1}')
+
+        orjson.loads.assert_called_with(b'{"a":1}')
+
+    def test_ujson_decodes_bytes(self):
+        with patch.object(json_codec, 'ujson') as ujson:
+            UjsonCodec().loads(b'{"a":1}')
+
+        ujson.loads.assert_called_with(b'{"a":1}')
+
+
+class GetCodecTest(unittest.TestCase):
+
+    def test_default(self):
+        assert_true(get_codec() is json_codec.DEFAULT_CODEC)
+        codec = JsonCodec()
+        assert_true(get_codec(codec) is codec)
+
+    def test_named(self):
+        assert_true(isinstance(get_codec("json"), JsonCodec))
+
+    @raises(TwilioException)
+    def test_unknown(self):
+        get_codec("yaml")
+
+    def test_not_installed(self):
+        installed = dict(json_codec.INSTALLED, orjson=False)
+        with patch.object(json_codec, 'INSTALLED', installed):
+            self.assertRaises(TwilioException, get_codec, "orjson")
+
+    def test_default_codec_prefers_fast_libraries(self):
+        for orjson, ujson, expected in [(True, True, OrjsonCodec),
+                                        (False, True, UjsonCodec),
+                                        (False, False, JsonCodec)]:
+            installed = {"json": True, "orjson": orjson, "ujson": ujson}
+            with patch.object(json_codec, 'INSTALLED', installed):
+                assert_equal(type(json_codec.default_codec()), expected)
+
+
+class JsonCodecHttpClientTest(unittest.TestCase):
+
+    def test_sets_codec(self):
+        codec = Mock()
+        http_client = Mock(spec=HttpClient)
+        http_client.request.return_value = Response(Mock(status=200),
+                                                    b'{}', "")
+        client = JsonCodecHttpClient(http_client, codec)
+
+        resp = client.request("GET", "https://api.twilio.com/")
+        resp.json()
+        codec.loads.assert_called_once_with(b'{}')
+
+    def test_client(self):
+        client = TwilioRestClient("AC123", "token", json_codec="json")
+        assert_true(isinstance(client.http_client, JsonCodecHttpClient))
+        assert_true(isinstance(client.http_client.codec, JsonCodec))
+
+
+def test_jwt_codec():
+    codec = Mock(wraps=JsonCodec())
+    token = jwt.encode({"sub": "AC123"}, "secret", json_codec=codec)
+    assert_equal(jwt.decode(token, "secret", json_codec=codec),
+                 {"sub": "AC123"})
+    assert_equal(codec.dumps.call_count, 2)
+    assert_equal(codec.loads.call_count, 2)
+
+
+def test_jwt_default_codec():
+    payload = {"sub": "AC123", "scope": "scope:client:incoming"}
+    expected = jwt.encode(payload, "secret", json_codec=JsonCodec())
+
+    # The auto-selected codec doesn't change the bytes of a token
+    fast = Mock(wraps=JsonCodec())
+    fast.dumps.side_effect = lambda obj: JsonCodec().dumps(obj).replace(
+        ", ", ",")
+    with patch.object(json_codec, 'DEFAULT_CODEC', fast):
+        token = jwt.encode(payload, "secret")
+        assert_equal(jwt.decode(token, "secret"), payload)
+
+    assert_equal(token, expected)
+    assert_true(not fast.dumps.called)
+    assert_true(not fast.loads.called)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from nose.tools import assert_equal
+
+from twilio.rest.resources.json_stream import StreamedPage
+
+PAGE = {
+    "page": 0,
+    "page_size": 3,
+    "calls": [
+        {"sid": "CA1", "duration": 12345, "to": u"+1 éè中"},
+        {"sid": "CA2", "price": -0.25, "answered_by": None,
+         "subresource_uris": {"calls": "/Calls/CA2/Calls.json"}},
+        {"sid": "CA3", "tags": [1, 2.5, True, "x"]},
+    ],
+    "next_page_uri": "/Calls.json?Page=1",
+}
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class StreamedPageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.body = json.dumps(PAGE, indent=1).encode('utf-8')
+
+    def assertDecodes(self, chunks):
+        page = StreamedPage(chunks, "calls")
+        assert_equal(list(page.records()), PAGE["calls"])
+        assert_equal(page.page, dict(PAGE, calls=[]))
+
+    def test_one_chunk(self):
+        self.assertDecodes([self.body])
+
+    def test_byte_chunks(self):
+        # Splits numbers and multibyte characters between chunks
+        self.assertDecodes(chunked(self.body, 1))
+
+    def test_odd_chunks(self):
+        for size in (2, 3, 7, 64):
+            self.assertDecodes(chunked(self.body, size))
+
+    def test_text_chunks(self):
+        self.assertDecodes(chunked(self.body.decode('utf-8'), 5))
+
+    def test_records_decoded_as_read(self):
+        chunks = iter(chunked(self.body, 4))
+        records = StreamedPage(chunks, "calls").records()
+
+        assert_equal(next(records)["sid"], "CA1")
+        # The rest of the page is still unread
+        assert_equal(len(list(chunks)) > 0, True)
+
+    def test_empty_records(self):
+        page = StreamedPage([b'{"calls": [ ], "next_page_uri": null}'],
+                            "calls")
+        assert_equal(list(page.records()), [])
+        assert_equal(page.page, {"calls": [], "next_page_uri": None})
+
+    def test_missing_key(self):
+        page = StreamedPage([b'{"messages": [{"sid": "SM1"}]}'], "calls")
+        assert_equal(list(page.records()), [])
+        assert_equal(page.page, {"messages": [{"sid": "SM1"}]})
+
+    def test_empty_object(self):
+        page = StreamedPage([b' {}'], "calls")
+        assert_equal(list(page.records()), [])
+        assert_equal(page.page, {})
+
+    def test_truncated(self):
+        page = StreamedPage(chunked(self.body[:-20], 8), "calls")
+        self.assertRaises(ValueError, list, page.records())
+
+    def test_not_an_object(self):
+        page = StreamedPage([b'[{"sid": "CA1"}]'], "calls")
+        self.assertRaises(ValueError, list, page.records())
+
+    def test_bad_separator(self):
+        page = StreamedPage([b'{"calls": [{"sid": "CA1"} {"sid": "CA2"}]}'],
+                            "calls")
+        self.assertRaises(ValueError, list, page.records())
@@ -6,11 +6,14 @@ Uses the awesome httpbin.org to validate responses
 import platform
 
 import twilio
-from nose.tools import assert_equal, raises
+from nose.tools import assert_equal, assert_true, raises
 from mock import patch, Mock, ANY
+from twilio.exceptions import TwilioException
 from twilio.rest.exceptions import TwilioRestException
 from twilio.rest.resources.base import make_request, make_twilio_request
-from twilio.rest.resources.connection import Connection
+from twilio.rest.resources.base import Httplib2Client, Urllib3Client
+from twilio.rest.resources.base import StreamingResponse, stream_body
+from twilio.rest.resources.connection import Connection, ConnectionPool
 from twilio.rest.resources.connection import PROXY_TYPE_SOCKS5
 
 get_headers = {
@@ -30,7 +33,7 @@ post_headers["Content-Type"] = "application/x-www-form-urlencoded"
 @patch('httplib2.Http')
 def test_get_params(http_mock, response_mock):
     http = Mock()
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
     http_mock.return_value = http
     make_request("GET", "http://httpbin.org/get", params={"hey": "you"})
     http.request.assert_called_with("http://httpbin.org/get?hey=you", "GET",
@@ -41,7 +44,7 @@ def test_get_params(http_mock, response_mock):
 @patch('httplib2.Http')
 def test_get_extra_params(http_mock, response_mock):
     http = Mock()
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
     http_mock.return_value = http
     make_request("GET", "http://httpbin.org/get?foo=bar", params={"hey": "you"})
     http.request.assert_called_with("http://httpbin.org/get?foo=bar&hey=you", "GET",
@@ -52,7 +55,7 @@ def test_get_extra_params(http_mock, response_mock):
 @patch('httplib2.Http')
 def test_resp_uri(http_mock, response_mock):
     http = Mock()
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
     http_mock.return_value = http
     make_request("GET", "http://httpbin.org/get")
     http.request.assert_called_with("http://httpbin.org/get", "GET",
@@ -63,7 +66,7 @@ def test_resp_uri(http_mock, response_mock):
 @patch('httplib2.Http')
 def test_sequence_data(http_mock, response_mock):
     http = Mock()
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
     http_mock.return_value = http
     make_request(
         "POST",
@@ -78,6 +81,121 @@ def test_sequence_data(http_mock, response_mock):
     )
 
 
+@patch('twilio.rest.resources.base.Response')
+@patch('httplib2.Http')
+def test_connection_pool(http_mock, response_mock):
+    http = Mock()
+    http.request.return_value = ({}, b"")
+    http_mock.return_value = http
+    pool = ConnectionPool()
+    client = Httplib2Client(connection_pool=pool)
+
+    make_request("GET", "https://api.twilio.com/", auth=("AC123", "token"),
+                 http_client=client)
+    make_request("GET", "https://api.twilio.com/", auth=("AC123", "token"),
+                 http_client=client)
+
+    assert_equal(http_mock.call_count, 1)
+    assert_equal(pool.stats()['reused'], 1)
+    http.request.assert_called_with(
+        "https://api.twilio.com/", "GET", body=None,
+        headers={"Authorization": "Basic QUMxMjM6dG9rZW4="},
+    )
+    assert_equal(http.add_credentials.call_count, 0)
+
+
+def test_http_client():
+    client = Mock()
+    make_request("POST", "http://httpbin.org/post", params={"hey": "you"},
+                 data={"a": "b"}, auth=("AC123", "token"), timeout=5,
+                 http_client=client)
+    client.request.assert_called_with(
+        "POST", "http://httpbin.org/post?hey=you", body="a=b", headers=None,
+        auth=("AC123", "token"), timeout=5, allow_redirects=False,
+    )
+
+
+@patch('twilio.rest.resources.base.Response')
+def test_urllib3_client(response_mock):
+    pool_manager = Mock()
+    pool_manager.urlopen.return_value.headers = {}
+    pool_manager.urlopen.return_value.data = b''
+    client = Urllib3Client(pool_manager=pool_manager)
+    make_request("GET", "https://api.twilio.com/", auth=("AC123", "token"),
+                 timeout=5, http_client=client)
+    pool_manager.urlopen.assert_called_with(
+        "GET", "https://api.twilio.com/", body=None,
+        headers={"Authorization": "Basic QUMxMjM6dG9rZW4=",
+                 "Accept-Encoding": "gzip, deflate"},
+        redirect=False, decode_content=False, timeout=5,
+    )
+
+
+def test_urllib3_client_stream():
+    pool_manager = Mock()
+    resp = pool_manager.urlopen.return_value
+    resp.status = 200
+    resp.headers = {}
+    resp.stream.return_value = iter([b'{"sid": ', b'"CA123"}'])
+    client = Urllib3Client(pool_manager=pool_manager, stream=True)
+
+    streamed = client.request("GET", "https://api.twilio.com/")
+    pool_manager.urlopen.assert_called_with(
+        "GET", "https://api.twilio.com/", body=None,
+        headers={"Accept-Encoding": "gzip, deflate"},
+        redirect=False, decode_content=False, preload_content=False,
+    )
+    assert_true(isinstance(streamed, StreamingResponse))
+    assert_equal(resp.release_conn.called, False)
+
+    assert_equal(list(streamed.iter_content()), [b'{"sid": ', b'"CA123"}'])
+    assert_equal(resp.release_conn.called, True)
+    assert_equal(resp.close.called, False)
+
+
+def test_urllib3_client_stream_error():
+    pool_manager = Mock()
+    resp = pool_manager.urlopen.return_value
+    resp.status = 404
+    resp.headers = {}
+    resp.data = b'{"message": "Not found"}'
+    client = Urllib3Client(pool_manager=pool_manager, stream=True)
+
+    response = client.request("GET", "https://api.twilio.com/")
+    assert_equal(response.streaming, False)
+    assert_equal(response.content, u'{"message": "Not found"}')
+    assert_true(resp.release_conn.called)
+
+
+def test_urllib3_client_stream_closed_early():
+    resp = Mock()
+    resp.stream.return_value = iter([b'{"sid": ', b'"CA123"}'])
+    body = stream_body(resp)
+
+    next(body)
+    body.close()
+    assert_true(resp.close.called)
+    assert_true(resp.release_conn.called)
+
+
+def test_streaming_response_read_once():
+    resp = StreamingResponse(Mock(status=200), iter([b'{"a": ', b'1}']),
+                             "https://api.twilio.com/")
+    assert_equal(resp.json(), {"a": 1})
+    assert_equal(resp.content, u'{"a": 1}')
+    assert_equal(list(resp.iter_content(4)), [b'{"a"', b': 1}'])
+
+    resp = StreamingResponse(Mock(status=200), iter([b'{}']),
+                             "https://api.twilio.com/")
+    list(resp.iter_content())
+    try:
+        resp.content
+    except TwilioException:
+        pass
+    else:
+        raise AssertionError("The body was read twice")
+
+
 @patch('twilio.rest.resources.base.make_request')
 def test_make_twilio_request_headers(mock):
     url = "http://random/url"
@@ -104,7 +222,7 @@ def test_make_twilio_request_bad_data(mock):
 @patch('httplib2.Http')
 def test_proxy_info(http_mock, resp_mock):
     http = Mock()
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
     http_mock.return_value = http
     Connection.set_proxy_info(
         'example.com',
@@ -2,10 +2,12 @@ from datetime import date
 import unittest
 
 from mock import patch
+from nose.tools import assert_equal
 from six import u
 
 from twilio.rest.resources import Messages
 from twilio.rest.resources import ListResource
+from twilio.rest.resources import MediaList
 
 DEFAULT = {
     'From': None,
@@ -49,6 +51,36 @@ class MessageTest(unittest.TestCase):
             self.params['From'] = "+15005559999"
             mock.assert_called_with(**self.params)
 
+    def test_parallel_iter(self):
+        pages = {
+            "2016-01-03": [3],
+            "2016-01-02": [2],
+            "2016-01-01": [1],
+        }
+        with patch.object(ListResource, 'iter') as mock:
+            mock.side_effect = lambda **kw: iter(pages[kw['DateSent>']])
+            messages = self.resource.parallel_iter(
+                date(2016, 1, 1), date(2016, 1, 3), shards=3, ordered=True,
+                to="+15005551212",
+            )
+            assert_equal(list(messages), [3, 2, 1])
+            self.params['DateSent<'] = "2016-01-01"
+            self.params['DateSent>'] = "2016-01-01"
+            self.params['To'] = "+15005551212"
+            mock.assert_any_call(**self.params)
+
+    def test_iter_expand(self):
+        records = [{"sid": "MM1"}, {"sid": "MM2"}]
+        with patch.object(ListResource, 'iter_pages') as pages, \
+                patch.object(MediaList, 'get_instances') as media:
+            pages.return_value = iter([records])
+            media.return_value = ["ME1"]
+            messages = list(self.resource.iter(expand=["media_list"]))
+
+        assert_equal(len(media.call_args_list), 2)
+        for message in messages:
+            assert_equal(message.media_list.expanded, ["ME1"])
+
     def test_create(self):
         with patch.object(self.resource, 'create_instance') as mock:
             self.resource.create(
@@ -3,6 +3,7 @@ import json
 import unittest
 
 from mock import Mock
+from nose.tools import assert_equal
 
 from twilio.rest.resources import PhoneNumbers
 from twilio.rest.resources import PhoneNumber
@@ -128,3 +129,16 @@ class IncomingPhoneNumbersTest(unittest.TestCase):
 
         uri = "http://api.twilio.com/IncomingPhoneNumbers/TollFree"
         request.assert_called_with("GET", uri, params={})
+
+    def test_list_raw(self):
+        request = Mock()
+        request.return_value = (Mock(), {"incoming_phone_numbers": [
+            {"sid": "PN123", "phone_number": "+15555555555"},
+        ]})
+        self.resource.request = request
+
+        numbers = self.resource.list_raw(type='local', fields=['sid'])
+
+        assert_equal(numbers, [{"sid": "PN123"}])
+        uri = "http://api.twilio.com/IncomingPhoneNumbers/Local"
+        request.assert_called_with("GET", uri, params={})
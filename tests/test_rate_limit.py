@@ -0,0 +1,145 @@
+import unittest
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRateLimitException
+from twilio.rest.resources import (
+    RateLimitedHttpClient,
+    RateLimiter,
+    RetryHttpClient,
+    RetryPolicy,
+    TokenBucket,
+)
+from twilio.rest.resources.rate_limit import request_target
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.patcher = patch("twilio.rest.resources.rate_limit.time",
+                             self.clock)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_bucket(self):
+        bucket = TokenBucket(2)
+
+        assert_equal([bucket.take(), bucket.take()], [0, 0])
+        assert_equal(bucket.take(), 0.5)
+        self.clock.sleep(0.5)
+        assert_equal(bucket.take(), 0)
+
+    def test_slow_bucket_holds_a_token(self):
+        bucket = TokenBucket(0.5)
+
+        assert_equal(bucket.take(), 0)
+        assert_equal(bucket.take(), 2)
+
+    def test_blocking(self):
+        limiter = RateLimiter(account_rate=1)
+
+        limiter.acquire("AC123", "Calls")
+        waited = limiter.acquire("AC123", "Calls")
+
+        assert_equal(waited, 1)
+        assert_equal(self.clock.now, 1001)
+        assert_equal(limiter.stats(), {
+            'acquired': 2,
+            'waits': 1,
+            'wait_time': 1,
+            'rejected': 0,
+        })
+
+    def test_accounts_are_separate(self):
+        limiter = RateLimiter(account_rate=1)
+
+        limiter.acquire("AC123", "Calls")
+        assert_equal(limiter.acquire("AC456", "Calls"), 0)
+
+    def test_resources(self):
+        limiter = RateLimiter(resource_rates={"Messages": 1})
+
+        limiter.acquire("AC123", "Messages")
+        assert_equal(limiter.acquire("AC123", "Calls"), 0)
+        assert_equal(limiter.acquire("AC123", "Messages"), 1)
+
+    def test_non_blocking(self):
+        limiter = RateLimiter(account_rate=10,
+                              resource_rates={"Messages": 1},
+                              blocking=False)
+        limiter.acquire("AC123", "Messages")
+
+        try:
+            limiter.acquire("AC123", "Messages")
+        except TwilioRateLimitException as e:
+            assert_equal(e.retry_after, 1)
+        else:
+            raise AssertionError("TwilioRateLimitException not raised")
+
+        assert_equal(limiter.stats()['rejected'], 1)
+        # The account token taken for the rejected request is given back
+        assert_equal(limiter.buckets[("AC123",)].tokens, 9)
+
+    def test_request_target(self):
+        assert_equal(request_target("%s/Messages.json" % BASE_URI),
+                     ("AC123", "Messages"))
+        assert_equal(request_target("%s/Calls/CA456.json" % BASE_URI),
+                     ("AC123", "Calls"))
+        assert_equal(
+            request_target("%s/Calls/CA456/Recordings.json" % BASE_URI),
+            ("AC123", "Recordings"),
+        )
+        assert_equal(
+            request_target("https://taskrouter.twilio.com/v1/Workspaces/WS1",
+                           ("AC789", "token")),
+            ("AC789", "Workspaces"),
+        )
+
+
+class RateLimitedHttpClientTest(unittest.TestCase):
+
+    def test_request(self):
+        http_client = Mock()
+        limiter = Mock()
+        client = RateLimitedHttpClient(http_client, limiter)
+
+        resp = client.request("POST", "%s/Messages.json" % BASE_URI,
+                              body="Body=hi", auth=("AC123", "token"))
+
+        limiter.acquire.assert_called_with("AC123", "Messages")
+        http_client.request.assert_called_with(
+            "POST", "%s/Messages.json" % BASE_URI, body="Body=hi",
+            headers=None, auth=("AC123", "token"), timeout=None,
+            allow_redirects=False,
+        )
+        assert_equal(resp, http_client.request.return_value)
+
+    def test_client(self):
+        limiter = RateLimiter(account_rate=1)
+        client = TwilioRestClient("AC123", "token", rate_limiter=limiter,
+                                  retry_policy=RetryPolicy())
+
+        # Each retry is paced by the limiter as well
+        assert_true(isinstance(client.http_client, RetryHttpClient))
+        limited = client.http_client.http_client
+        assert_true(isinstance(limited, RateLimitedHttpClient))
+        assert_true(limited.rate_limiter is limiter)
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import (
+    MmapRecordStore,
+    RecordStoreHttpClient,
+    SqliteRecordStore,
+    StreamingResponse,
+)
+from tests.tools import FakeHttpClient
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+PATH = "/2010-04-01/Accounts/AC123"
+
+
+class StoreTests(object):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "records")
+        self.store = self.open()
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.dir)
+
+    def reopen(self):
+        self.store.close()
+        self.store = self.open()
+
+    def test_put(self):
+        self.store.put("/Calls/CA1.json", '{"sid": "CA1"}')
+        self.store.put("/Calls/CA1.json", '{"sid": "changed"}')
+
+        assert_equal(self.store.get("/Calls/CA1.json"), '{"sid": "CA1"}')
+        assert_equal(self.store.get("/Calls/CA2.json"), None)
+
+    def test_persistent(self):
+        self.store.put("/Calls/CA1.json", u'{"sid": "CA1", "to": "é"}')
+        self.reopen()
+
+        assert_equal(self.store.get("/Calls/CA1.json"),
+                     u'{"sid": "CA1", "to": "é"}')
+
+    def test_delete(self):
+        self.store.put("/Calls/CA1.json", '{"sid": "CA1"}')
+        self.store.delete("/Calls/CA1.json")
+        self.reopen()
+
+        assert_equal(self.store.get("/Calls/CA1.json"), None)
+
+    def test_many(self):
+        for i in range(100):
+            self.store.put("/Calls/CA%d.json" % i, '{"sid": "CA%d"}' % i)
+            assert_equal(self.store.get("/Calls/CA%d.json" % i),
+                         '{"sid": "CA%d"}' % i)
+
+        assert_equal(self.store.get("/Calls/CA42.json"), '{"sid": "CA42"}')
+
+
+class SqliteRecordStoreTest(StoreTests, unittest.TestCase):
+
+    def open(self):
+        return SqliteRecordStore(self.path)
+
+
+class MmapRecordStoreTest(StoreTests, unittest.TestCase):
+
+    def open(self):
+        return MmapRecordStore(self.path)
+
+    def test_incomplete_entry(self):
+        self.store.put("/Calls/CA1.json", '{"sid": "CA1"}')
+        self.store.close()
+        with open(self.path, "ab") as f:
+            f.write(b"\x00\x00\x00\x10\x00")
+
+        self.store = self.open()
+        self.store.put("/Calls/CA2.json", '{"sid": "CA2"}')
+        self.reopen()
+
+        assert_equal(self.store.get("/Calls/CA1.json"), '{"sid": "CA1"}')
+        assert_equal(self.store.get("/Calls/CA2.json"), '{"sid": "CA2"}')
+
+
+class RecordStoreHttpClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = Mock()
+        self.store.get.return_value = None
+
+    def client(self, *contents):
+        self.http_client = FakeHttpClient(*contents)
+        return RecordStoreHttpClient(self.http_client, self.store)
+
+    def test_store_terminal_instance(self):
+        client = self.client('{"sid": "CA1", "status": "completed"}')
+
+        client.request("GET", "%s/Calls/CA1.json" % BASE_URI)
+
+        self.store.put.assert_called_with(
+            "%s/Calls/CA1.json" % PATH, '{"sid": "CA1", "status": "completed"}')
+
+    def test_skip_active_instance(self):
+        client = self.client('{"sid": "CA1", "status": "in-progress"}')
+
+        client.request("GET", "%s/Calls/CA1.json" % BASE_URI)
+
+        assert_true(not self.store.put.called)
+
+    def test_store_page(self):
+        client = self.client(
+            '{"messages": ['
+            '{"sid": "SM1", "status": "delivered",'
+            ' "uri": "%s/Messages/SM1.json"},'
+            '{"sid": "SM2", "status": "sending",'
+            ' "uri": "%s/Messages/SM2.json"}]}' % (PATH, PATH))
+
+        client.request("GET", "%s/Messages.json?Page=1" % BASE_URI)
+
+        assert_equal(self.store.put.call_count, 1)
+        assert_equal(self.store.put.call_args[0][0],
+                     "%s/Messages/SM1.json" % PATH)
+
+    def test_skip_streaming_page(self):
+        url = "%s/Messages.json?Page=1" % BASE_URI
+        streamed = StreamingResponse(Mock(status=200), iter([
+            b'{"messages": [{"sid": "SM1", "status": "delivered",',
+            b' "uri": "/Messages/SM1.json"}]}',
+        ]), url)
+        http_client = Mock()
+        http_client.request.return_value = streamed
+        client = RecordStoreHttpClient(http_client, self.store)
+
+        resp = client.request("GET", url)
+
+        assert_true(resp is streamed)
+        assert_true(not streamed.consumed)
+        assert_true(not self.store.put.called)
+
+    def test_serve_stored(self):
+        self.store.get.return_value = '{"sid": "CA1", "status": "busy"}'
+        client = self.client()
+
+        resp = client.request("GET", "%s/Calls/CA1.json" % BASE_URI)
+
+        assert_equal(resp.content, '{"sid": "CA1", "status": "busy"}')
+        assert_equal(resp.status_code, 200)
+        assert_true(resp.cached)
+        assert_equal(self.http_client.requests, [])
+
+    def test_other_resources(self):
+        client = self.client('{"sid": "QU1", "status": "completed"}')
+
+        client.request("GET", "%s/Queues/QU1.json" % BASE_URI)
+
+        assert_true(not self.store.get.called)
+        assert_true(not self.store.put.called)
+
+    def test_update_removes(self):
+        client = self.client('{"sid": "SM1", "status": "delivered"}')
+
+        client.request("POST", "%s/Messages/SM1.json" % BASE_URI, body="")
+
+        self.store.delete.assert_called_with("%s/Messages/SM1.json" % PATH)
+
+    def test_client(self):
+        dir = tempfile.mkdtemp()
+        try:
+            store = SqliteRecordStore(os.path.join(dir, "records.db"))
+            http_client = FakeHttpClient(
+                '{"sid": "CA1", "status": "completed", "duration": "10"}')
+            client = TwilioRestClient("AC123", "token",
+                                      http_client=http_client,
+                                      record_store=store)
+
+            client.calls.get("CA1")
+            call = client.calls.get("CA1")
+
+            assert_equal(call.duration, "10")
+            assert_equal(len(http_client.requests), 1)
+            store.close()
+        finally:
+            shutil.rmtree(dir)
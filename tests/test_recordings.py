@@ -35,12 +35,12 @@ def test_paging_iter(mock):
     uri = "%s/Recordings" % (BASE_URI)
 
     next(recordings.iter(before=date(2010, 12, 5)))
-    exp_params = {'DateCreated<': '2010-12-05'}
+    exp_params = {'DateCreated<': '2010-12-05', 'PageSize': 1000}
     mock.assert_called_with("GET", uri, params=exp_params, auth=AUTH,
                             use_json_extension=True)
 
     next(recordings.iter(after=date(2012, 12, 7)))
-    exp_params = {'DateCreated>': '2012-12-07'}
+    exp_params = {'DateCreated>': '2012-12-07', 'PageSize': 1000}
     mock.assert_called_with("GET", uri, params=exp_params, auth=AUTH,
                             use_json_extension=True)
 
@@ -0,0 +1,120 @@
+import unittest
+
+from mock import Mock, patch
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import RetryHttpClient, RetryPolicy
+from twilio.rest.resources.base import Response
+from twilio.rest.resources.retry import parse_retry_after
+
+URL = "https://api.twilio.com/2010-04-01/Accounts/AC123/Calls.json"
+
+
+def response(status, headers=None):
+    return Response(Mock(status=status), "{}", URL, headers=headers)
+
+
+def test_parse_retry_after_seconds():
+    assert_equal(parse_retry_after("3"), 3.0)
+    assert_equal(parse_retry_after(None), None)
+    assert_equal(parse_retry_after("soon"), None)
+
+
+@patch("twilio.rest.resources.retry.time")
+def test_parse_retry_after_date(time_mock):
+    time_mock.time.return_value = 1445412480.0
+    assert_equal(parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT"), 10.0)
+
+
+@patch("twilio.rest.resources.retry.random.uniform", lambda a, b: b)
+class RetryPolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = RetryPolicy(max_retries=3, backoff=1, max_backoff=3,
+                                  max_total=10)
+
+    def test_exponential_backoff(self):
+        delays = [self.policy.delay("GET", n, 0, response(503))
+                  for n in range(4)]
+        assert_equal(delays, [1, 2, 3, None])
+
+    def test_retry_after(self):
+        delay = self.policy.delay("GET", 0, 0,
+                                  response(429, {"Retry-After": "5"}))
+        assert_equal(delay, 6)
+
+    def test_post_only_retried_on_429(self):
+        assert_equal(self.policy.delay("POST", 0, 0, response(503)), None)
+        assert_equal(self.policy.delay("POST", 0, 0, response(429)), 1)
+
+    def test_connection_errors(self):
+        assert_equal(self.policy.delay("DELETE", 0, 0), 1)
+        assert_equal(self.policy.delay("POST", 0, 0), None)
+
+    def test_client_errors_not_retried(self):
+        assert_equal(self.policy.delay("GET", 0, 0, response(404)), None)
+
+    def test_max_total(self):
+        assert_equal(self.policy.delay("GET", 2, 7, response(503)), 3)
+        assert_equal(self.policy.delay("GET", 2, 8, response(503)), None)
+
+
+@patch("twilio.rest.resources.retry.time.sleep")
+class RetryHttpClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.http_client = Mock()
+        self.policy = Mock()
+        self.policy.delay.return_value = 0.5
+        self.client = RetryHttpClient(self.http_client, self.policy)
+
+    def test_success(self, sleep):
+        self.http_client.request.return_value = response(200)
+
+        resp = self.client.request("GET", URL, auth=("AC123", "token"))
+
+        assert_equal(resp.status_code, 200)
+        self.http_client.request.assert_called_once_with(
+            "GET", URL, body=None, headers=None, auth=("AC123", "token"),
+            timeout=None, allow_redirects=False,
+        )
+        assert_true(not sleep.called)
+
+    def test_retries_until_success(self, sleep):
+        self.http_client.request.side_effect = [response(503), response(429),
+                                                response(200)]
+
+        resp = self.client.request("GET", URL)
+
+        assert_equal(resp.status_code, 200)
+        assert_equal(sleep.call_count, 2)
+        sleep.assert_called_with(0.5)
+        assert_equal(self.client.retries, 2)
+
+    def test_gives_up(self, sleep):
+        self.http_client.request.side_effect = [response(503), response(503)]
+        self.policy.delay.side_effect = [0.5, None]
+
+        resp = self.client.request("GET", URL)
+
+        assert_equal(resp.status_code, 503)
+        assert_equal(sleep.call_count, 1)
+
+    @raises(IOError)
+    def test_connection_error(self, sleep):
+        self.http_client.request.side_effect = IOError("reset")
+        self.policy.delay.side_effect = [0.5, None]
+
+        self.client.request("GET", URL)
+
+
+class RetryClientTest(unittest.TestCase):
+
+    def test_retry_policy(self):
+        policy = RetryPolicy()
+        client = TwilioRestClient("AC123", "token", retry_policy=policy)
+
+        assert_true(isinstance(client.http_client, RetryHttpClient))
+        assert_true(client.http_client.policy is policy)
+        assert_true(client.calls.http_client is client.http_client)
@@ -0,0 +1,176 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import RetryPolicy, SendQueue
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+
+
+class SendQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "outbox.db")
+        self.messages = Mock(uri="%s/Messages" % BASE_URI,
+                             auth=("AC123", "token"))
+        self.messages.create.side_effect = \
+            lambda **kw: Mock(sid="SM" + kw['to'])
+        self.queue = self.make_queue()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def make_queue(self, **kwargs):
+        kwargs.setdefault('retry_policy', RetryPolicy(backoff=0))
+        return SendQueue(self.messages, self.path, poll_interval=0.01,
+                         **kwargs)
+
+    def test_drain(self):
+        ids = self.queue.put_many({"to": str(i), "body": "hi"}
+                                  for i in range(10))
+
+        counts = self.queue.drain(workers=3)
+
+        assert_equal(counts['sent'], 10)
+        assert_equal(self.messages.create.call_count, 10)
+        self.messages.create.assert_any_call(to="3", body="hi")
+        row = self.queue.get(ids[3])
+        assert_equal(row['status'], 'sent')
+        assert_equal(row['sid'], "SM3")
+        assert_equal(row['params'], {"to": "3", "body": "hi"})
+
+    def test_retry_rejected(self):
+        self.messages.create.side_effect = [
+            TwilioRestException(429, BASE_URI, "Too many requests"),
+            Mock(sid="SM1"),
+        ]
+        row_id = self.queue.put(to="1", body="hi")
+
+        self.queue.drain(workers=1)
+
+        row = self.queue.get(row_id)
+        assert_equal(row['status'], 'sent')
+        assert_equal(row['attempts'], 2)
+
+    def test_give_up_retrying(self):
+        self.messages.create.side_effect = TwilioRestException(
+            429, BASE_URI, "Too many requests")
+        self.queue = self.make_queue(
+            retry_policy=RetryPolicy(max_retries=1, backoff=0))
+        row_id = self.queue.put(to="1", body="hi")
+
+        self.queue.drain(workers=1)
+
+        row = self.queue.get(row_id)
+        assert_equal(row['status'], 'failed')
+        assert_equal(row['attempts'], 2)
+
+    def test_failed(self):
+        self.messages.create.side_effect = TwilioRestException(
+            400, BASE_URI, "Invalid To")
+        row_id = self.queue.put(to="x", body="hi")
+
+        counts = self.queue.drain(workers=1)
+
+        assert_equal(counts['failed'], 1)
+        assert_true("Invalid To" in self.queue.get(row_id)['error'])
+
+    def test_unexpected_success_status(self):
+        self.messages.create.side_effect = TwilioRestException(
+            202, BASE_URI, "Accepted")
+        row_id = self.queue.put(to="1", body="hi")
+
+        counts = self.queue.drain(workers=1)
+
+        assert_equal(counts['unknown'], 1)
+        assert_equal(self.queue.get(row_id)['status'], 'unknown')
+
+    def test_database_errors_retried(self):
+        finish = self.queue._finish
+        errors = [sqlite3.OperationalError("database is locked")]
+
+        def flaky_finish(*args, **kwargs):
+            if errors:
+                raise errors.pop()
+            return finish(*args, **kwargs)
+
+        self.queue._finish = Mock(side_effect=flaky_finish)
+        ids = self.queue.put_many({"to": str(i), "body": "hi"}
+                                  for i in range(3))
+
+        counts = self.queue.drain(workers=1)
+
+        assert_equal(counts['sent'], 3)
+        assert_equal(self.messages.create.call_count, 3)
+        assert_equal(self.queue.get(ids[0])['sid'], "SM0")
+
+    def test_worker_survives_errors(self):
+        send = self.queue.send
+        errors = [ValueError("boom")]
+
+        def flaky_send(*row):
+            if errors:
+                raise errors.pop()
+            return send(*row)
+
+        self.queue.send = Mock(side_effect=flaky_send)
+        first, second = self.queue.put_many([{"to": "1"}, {"to": "2"}])
+
+        counts = self.queue.drain(workers=1)
+
+        assert_equal(self.queue.send.call_count, 2)
+        assert_equal(self.queue.get(first)['status'], 'unknown')
+        assert_equal(self.queue.get(second)['status'], 'sent')
+        assert_equal(counts['sent'], 1)
+
+    def test_unknown_outcome_not_resent(self):
+        self.messages.create.side_effect = [
+            TwilioRestException(500, BASE_URI, "Server error"),
+            IOError("Connection reset"),
+        ]
+        self.queue.put_many([{"to": "1"}, {"to": "2"}])
+
+        counts = self.queue.drain(workers=1)
+
+        assert_equal(counts['unknown'], 2)
+        assert_equal(self.messages.create.call_count, 2)
+
+    def test_requeue_unknown(self):
+        self.messages.create.side_effect = [
+            IOError("Connection reset"),
+            Mock(sid="SM1"),
+        ]
+        row_id = self.queue.put(to="1")
+        self.queue.drain(workers=1)
+
+        assert_equal(self.queue.requeue_unknown(), 1)
+        self.queue.drain(workers=1)
+
+        assert_equal(self.queue.get(row_id)['sid'], "SM1")
+
+    def test_recover(self):
+        row_id = self.queue.put(to="1")
+        assert_equal(self.queue.claim()[0], row_id)
+
+        # A new process finds the row it was sending when it stopped
+        queue = self.make_queue()
+        counts = queue.drain(workers=1)
+
+        assert_equal(counts['unknown'], 1)
+        assert_equal(self.messages.create.call_count, 0)
+
+    def test_rate_limiter(self):
+        rate_limiter = Mock()
+        self.queue = self.make_queue(rate_limiter=rate_limiter)
+        self.queue.put(to="1")
+
+        self.queue.drain(workers=1)
+
+        rate_limiter.acquire.assert_called_with("AC123", "Messages")
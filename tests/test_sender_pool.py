@@ -0,0 +1,86 @@
+import unittest
+
+from mock import Mock, patch
+from nose.tools import assert_equal, raises
+
+from twilio.exceptions import TwilioException
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import SenderPool
+
+
+class SenderPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.messages = Mock()
+        self.messages.create.side_effect = \
+            lambda to, from_, **kw: Mock(sid="SM" + to, from_=from_)
+        self.pool = SenderPool(self.messages, ["+1", "+2", "+3"], rate=100)
+
+    def test_spreads_recipients(self):
+        senders = [self.pool.submit("+9%d" % i, body="hi").from_
+                   for i in range(6)]
+
+        assert_equal(senders, ["+1", "+2", "+3", "+1", "+2", "+3"])
+        assert_equal(self.pool.depths(), {"+1": 2, "+2": 2, "+3": 2})
+
+    def test_sticky_sender(self):
+        first = self.pool.submit("+91", body="hi")
+        self.pool.submit("+92", body="hi")
+        again = self.pool.submit("+91", body="hi again")
+
+        assert_equal(again.from_, first.from_)
+        assert_equal(self.pool.depths()[first.from_], 2)
+
+    def test_phone_numbers(self):
+        numbers = [Mock(phone_number="+1"), Mock(phone_number="+2")]
+
+        pool = SenderPool(self.messages, numbers)
+
+        assert_equal(pool.numbers, ["+1", "+2"])
+
+    @raises(TwilioException)
+    def test_no_numbers(self):
+        SenderPool(self.messages, [])
+
+    def test_send(self):
+        pending = [self.pool.submit("+9%d" % i, body="hi") for i in range(6)]
+        self.pool.start()
+        self.pool.join()
+        self.pool.stop()
+
+        message = pending[4].result(1)
+        assert_equal(message.sid, "SM+94")
+        assert_equal(message.from_, "+2")
+        self.messages.create.assert_any_call(to="+94", from_="+2", body="hi")
+        assert_equal(self.pool.stats()["+2"], {'sent': 2, 'queued': 0})
+
+    @raises(TwilioRestException)
+    def test_error(self):
+        self.messages.create.side_effect = TwilioRestException(
+            400, "/Messages", "Invalid To")
+        self.pool.start()
+
+        pending = self.pool.submit("x", body="hi")
+        self.pool.stop()
+
+        pending.result(1)
+
+    @raises(TwilioException)
+    def test_result_timeout(self):
+        pending = self.pool.submit("+91", body="hi")
+
+        pending.result(0.01)
+
+    @patch("twilio.rest.resources.sender_pool.time")
+    def test_pacing(self, mock_time):
+        pool = SenderPool(self.messages, ["+1"], rate=1)
+        bucket = pool.buckets["+1"]
+        bucket.take = Mock(side_effect=[0, 0.5, 0])
+        pool.start()
+
+        pool.submit("+91", body="hi")
+        pool.submit("+92", body="hi")
+        pool.stop()
+
+        mock_time.sleep.assert_called_once_with(0.5)
+        assert_equal(self.messages.create.call_count, 2)
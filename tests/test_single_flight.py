@@ -0,0 +1,120 @@
+import threading
+import time
+import unittest
+
+from mock import Mock
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import (
+    HttpClient,
+    RetryHttpClient,
+    RetryPolicy,
+    SingleFlightHttpClient,
+    StreamingResponse,
+)
+
+URL = "https://api.twilio.com/2010-04-01/Accounts/AC123/Calls/CA123.json"
+AUTH = ("AC123", "token")
+
+
+class SlowHttpClient(HttpClient):
+
+    def __init__(self, error=None, stream=False):
+        self.error = error
+        self.stream = stream
+        self.released = threading.Event()
+        self.requests = []
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        self.requests.append((method, url))
+        self.released.wait(1)
+        if self.error is not None:
+            raise self.error
+        if self.stream:
+            return StreamingResponse(Mock(status=200), iter([b'{}']), url)
+        return Mock(url=url)
+
+
+class SingleFlightHttpClientTest(unittest.TestCase):
+
+    def send_concurrently(self, client, requests):
+        results = [None] * len(requests)
+
+        def send(i, method, url, auth):
+            try:
+                results[i] = client.request(method, url, auth=auth)
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=send, args=(i,) + r)
+                   for i, r in enumerate(requests)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        client.http_client.released.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_coalesce(self):
+        client = SingleFlightHttpClient(SlowHttpClient())
+
+        results = self.send_concurrently(client, [("GET", URL, AUTH)] * 5)
+
+        assert_equal(len(client.http_client.requests), 1)
+        assert_true(all(r is results[0] for r in results))
+        assert_equal(client.coalesced, 4)
+        assert_equal(client.flights, {})
+
+    def test_coalesce_streaming(self):
+        client = SingleFlightHttpClient(SlowHttpClient(stream=True))
+
+        results = self.send_concurrently(client, [("GET", URL, AUTH)] * 3)
+
+        assert_true(all(r is results[0] for r in results))
+        assert_true(results[0].consumed)
+        assert_equal([list(r.iter_content()) for r in results],
+                     [[b'{}']] * 3)
+
+    def test_different_requests(self):
+        client = SingleFlightHttpClient(SlowHttpClient())
+
+        self.send_concurrently(client, [
+            ("GET", URL, AUTH),
+            ("GET", URL + "?Page=1", AUTH),
+            ("GET", URL, ("AC456", "token")),
+            ("POST", URL, AUTH),
+            ("POST", URL, AUTH),
+        ])
+
+        assert_equal(len(client.http_client.requests), 5)
+        assert_equal(client.coalesced, 0)
+
+    def test_shared_error(self):
+        error = IOError("Connection reset")
+        client = SingleFlightHttpClient(SlowHttpClient(error))
+
+        results = self.send_concurrently(client, [("GET", URL, AUTH)] * 3)
+
+        assert_equal(len(client.http_client.requests), 1)
+        assert_true(all(r is error for r in results))
+
+    def test_sequential_requests(self):
+        http_client = SlowHttpClient()
+        http_client.released.set()
+        client = SingleFlightHttpClient(http_client)
+
+        client.request("GET", URL, auth=AUTH)
+        client.request("GET", URL, auth=AUTH)
+
+        assert_equal(len(http_client.requests), 2)
+
+    def test_client(self):
+        client = TwilioRestClient("AC123", "token", coalesce_requests=True,
+                                  retry_policy=RetryPolicy())
+
+        assert_true(isinstance(client.http_client, SingleFlightHttpClient))
+        assert_true(isinstance(client.http_client.http_client,
+                               RetryHttpClient))
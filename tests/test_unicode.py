@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from mock import patch, Mock
+from mock import patch
 from six import u
 from twilio.rest import resources
 
@@ -8,7 +8,7 @@ from twilio.rest import resources
 @patch("twilio.rest.resources.base.Response")
 def test_ascii_encode(resp_mock, mock):
     http = mock.return_value
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
 
     data = {
         "body": "HeyHey".encode('utf-8')
@@ -24,7 +24,7 @@ def test_ascii_encode(resp_mock, mock):
 @patch("twilio.rest.resources.base.Response")
 def test_ascii(resp_mock, mock):
     http = mock.return_value
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
 
     data = {
         "body": "HeyHey"
@@ -40,7 +40,7 @@ def test_ascii(resp_mock, mock):
 @patch("twilio.rest.resources.base.Response")
 def test_double_encoding(resp_mock, mock):
     http = mock.return_value
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
 
     body = u('Chlo\xe9\xf1')
 
@@ -58,7 +58,7 @@ def test_double_encoding(resp_mock, mock):
 @patch("twilio.rest.resources.base.Response")
 def test_paging(resp_mock, mock):
     http = mock.return_value
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
 
     data = {
         "body": u('Chlo\xe9\xf1'),
@@ -74,7 +74,7 @@ def test_paging(resp_mock, mock):
 @patch("twilio.rest.resources.base.Response")
 def test_unicode_sequence_form_value(resp_mock, mock):
     http = mock.return_value
-    http.request.return_value = (Mock(), Mock())
+    http.request.return_value = ({}, b"")
 
     data = {
         "body": [u('\xe5'), u('\xe7')],
@@ -1,9 +1,34 @@
 from __future__ import with_statement
 from mock import Mock
 
+from twilio.rest.resources import HttpClient
+from twilio.rest.resources.base import Response
+
 
 def create_mock_json(path):
     with open(path) as f:
         resp = Mock()
         resp.content = f.read()
         return resp
+
+
+class FakeHttpClient(HttpClient):
+    """
+    An HttpClient answering each request with the next of `contents`, given
+    as a body or as a tuple of a status code and a body, and recording the
+    method, url and body of each request in ``requests``.
+    """
+
+    def __init__(self, *contents, **kwargs):
+        self.contents = list(contents)
+        self.status = kwargs.get('status', 200)
+        self.requests = []
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        self.requests.append((method, url, body))
+        content = self.contents.pop(0)
+        status = self.status
+        if isinstance(content, tuple):
+            status, content = content
+        return Response(Mock(status=status), content, url)
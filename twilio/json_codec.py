@@ -0,0 +1,114 @@
+""" Pluggable JSON encoding and decoding
+
+The fastest JSON library installed is used by default: `orjson
+<https://github.com/ijl/orjson>`_, then `ujson
+<https://github.com/ultrajson/ultrajson>`_, then the standard library.
+"""
+from six import string_types
+
+from .exceptions import TwilioException
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+# orjson and ujson, optional fast codecs
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec(object):
+    """
+    Encode and decode JSON with the standard library's :mod:`json` module.
+    Subclasses use faster libraries.
+    """
+
+    name = "json"
+
+    def loads(self, data):
+        """Decode a JSON document given as UTF-8 encoded bytes or as text"""
+        if not isinstance(data, string_types):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """Encode `obj` as a JSON document, returned as text"""
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JsonCodec):
+    """Encode and decode JSON with orjson, which decodes bytes directly"""
+
+    name = "orjson"
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj):
+        return orjson.dumps(obj).decode('utf-8')
+
+
+class UjsonCodec(JsonCodec):
+    """Encode and decode JSON with ujson, which decodes bytes directly"""
+
+    name = "ujson"
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+    def dumps(self, obj):
+        return ujson.dumps(obj, escape_forward_slashes=False)
+
+
+CODECS = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec,
+}
+
+INSTALLED = {
+    "json": True,
+    "orjson": orjson is not None,
+    "ujson": ujson is not None,
+}
+
+
+def default_codec():
+    """Return a codec for the fastest JSON library installed"""
+    for name in ("orjson", "ujson"):
+        if INSTALLED[name]:
+            return CODECS[name]()
+    return JsonCodec()
+
+
+DEFAULT_CODEC = default_codec()
+
+
+def get_codec(codec=None):
+    """
+    Return the codec called `codec`, such as ``"ujson"``, or `codec` itself
+    if it's already a :class:`JsonCodec`, or the default codec if it's None.
+
+    :raises: a :exc:`~twilio.TwilioException` if the library a codec is
+        named after isn't installed
+    """
+    if codec is None:
+        return DEFAULT_CODEC
+    if not isinstance(codec, string_types):
+        return codec
+
+    if codec not in CODECS:
+        raise TwilioException("Unknown JSON codec %r, pick one of %s" %
+                              (codec, ", ".join(sorted(CODECS))))
+    if not INSTALLED[codec]:
+        raise TwilioException("The %s JSON codec requires the %s package" %
+                              (codec, codec))
+    return CODECS[codec]()
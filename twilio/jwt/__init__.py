@@ -8,16 +8,13 @@ import hashlib
 import hmac
 from six import text_type, b
 
+from ..json_codec import get_codec
+
 
 # default text to binary representation conversion
 def binary(txt):
     return txt.encode('utf-8')
 
-try:
-    import json
-except ImportError:
-    import simplejson as json
-
 
 __all__ = ['encode', 'decode', 'DecodeError']
 
@@ -41,13 +38,16 @@ def base64url_encode(input):
     return base64.urlsafe_b64encode(input).decode('utf-8').replace('=', '')
 
 
-def encode(payload, key, algorithm='HS256', headers=None):
+def encode(payload, key, algorithm='HS256', headers=None, json_codec=None):
+    # Tokens are encoded with the standard library unless asked otherwise,
+    # so they don't depend on which JSON libraries are installed
+    codec = get_codec(json_codec or "json")
     segments = []
     header = {"typ": "JWT", "alg": algorithm}
     if headers:
         header.update(headers)
-    segments.append(base64url_encode(binary(json.dumps(header))))
-    segments.append(base64url_encode(binary(json.dumps(payload))))
+    segments.append(base64url_encode(binary(codec.dumps(header))))
+    segments.append(base64url_encode(binary(codec.dumps(payload))))
     sign_input = '.'.join(segments)
     try:
         signature = signing_methods[algorithm](binary(sign_input), binary(key))
@@ -57,17 +57,16 @@ def encode(payload, key, algorithm='HS256', headers=None):
     return '.'.join(segments)
 
 
-def decode(jwt, key='', verify=True):
+def decode(jwt, key='', verify=True, json_codec=None):
+    codec = get_codec(json_codec or "json")
     try:
         signing_input, crypto_segment = jwt.rsplit('.', 1)
         header_segment, payload_segment = signing_input.split('.', 1)
     except ValueError:
         raise DecodeError("Not enough segments")
     try:
-        header_raw = base64url_decode(binary(header_segment)).decode('utf-8')
-        payload_raw = base64url_decode(binary(payload_segment)).decode('utf-8')
-        header = json.loads(header_raw)
-        payload = json.loads(payload_raw)
+        header = codec.loads(base64url_decode(binary(header_segment)))
+        payload = codec.loads(base64url_decode(binary(payload_segment)))
         signature = base64url_decode(binary(crypto_segment))
     except (ValueError, TypeError):
         raise DecodeError("Invalid segment encoding")
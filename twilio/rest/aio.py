@@ -0,0 +1,82 @@
+"""
+An asyncio client for the Twilio REST API.
+
+This module requires Python 3.5 or later.
+"""
+from twilio.rest.client import TwilioRestClient
+from twilio.rest.resources import UNSET_TIMEOUT
+from twilio.rest.resources.aio import ExecutorHttpClient, make_async
+
+
+class AsyncTwilioRestClient(TwilioRestClient):
+    """
+    A client for accessing the Twilio REST API from asyncio code
+
+    The list resources of this client send their requests with an
+    :class:`~twilio.rest.resources.aio.AsyncHttpClient`, so their methods
+    return awaitables and ``iter`` returns an asynchronous iterator.
+
+    .. code-block:: python
+
+        client = AsyncTwilioRestClient(account, token)
+        message = await client.messages.create(to="+12316851234",
+                                               from_="+15555555555",
+                                               body="Hello there!")
+        async for call in client.calls.iter(status="completed"):
+            print(call.sid)
+
+    :param str account: Your Account SID from `your dashboard
+        <https://twilio.com/user/account>`_
+    :param str token: Your Auth Token from `your dashboard
+        <https://twilio.com/user/account>`_
+    :param float timeout: The socket and read timeout for requests to Twilio
+    :param async_http_client: The
+        :class:`~twilio.rest.resources.aio.AsyncHttpClient` to send requests
+        with. Defaults to running the client's ``http_client`` in the event
+        loop's default executor.
+    """
+
+    def __init__(self, account=None, token=None, base="https://api.twilio.com",
+                 version="2010-04-01", timeout=UNSET_TIMEOUT,
+                 request_account=None, http_client=None,
+                 retry_policy=None, rate_limiter=None,
+                 concurrency_limiter=None, coalesce_requests=False,
+                 instance_cache=None, record_store=None,
+                 json_codec=None, async_http_client=None):
+        super(AsyncTwilioRestClient, self).__init__(account, token, base,
+                                                    version, timeout,
+                                                    request_account,
+                                                    http_client, retry_policy,
+                                                    rate_limiter,
+                                                    concurrency_limiter,
+                                                    coalesce_requests,
+                                                    instance_cache,
+                                                    record_store, json_codec)
+
+        if async_http_client is None:
+            async_http_client = ExecutorHttpClient(self.http_client)
+        self.async_http_client = async_http_client
+
+        memo = {}
+        for name, value in list(vars(self).items()):
+            setattr(self, name, make_async(value, async_http_client, memo))
+
+    def participants(self, conference_sid):
+        return make_async(
+            super(AsyncTwilioRestClient, self).participants(conference_sid),
+            self.async_http_client,
+        )
+
+    def members(self, queue_sid):
+        return make_async(
+            super(AsyncTwilioRestClient, self).members(queue_sid),
+            self.async_http_client,
+        )
+
+    def dependent_phone_numbers(self, address_sid):
+        return make_async(
+            super(AsyncTwilioRestClient, self).dependent_phone_numbers(
+                address_sid,
+            ),
+            self.async_http_client,
+        )
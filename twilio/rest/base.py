@@ -3,7 +3,16 @@ import platform
 import os
 
 from twilio.exceptions import TwilioException
+from twilio.rest.resources import CachingHttpClient
+from twilio.rest.resources import ConcurrencyLimitedHttpClient
 from twilio.rest.resources import Connection
+from twilio.rest.resources import ConnectionPool
+from twilio.rest.resources import Httplib2Client
+from twilio.rest.resources import JsonCodecHttpClient
+from twilio.rest.resources import RateLimitedHttpClient
+from twilio.rest.resources import RecordStoreHttpClient
+from twilio.rest.resources import RetryHttpClient
+from twilio.rest.resources import SingleFlightHttpClient
 from twilio.rest.resources import UNSET_TIMEOUT
 from twilio.rest.resources import make_request
 from twilio.version import __version__ as LIBRARY_VERSION
@@ -31,9 +40,38 @@ def set_twilio_proxy(proxy_url, proxy_port):
 class TwilioClient(object):
     def __init__(self, account=None, token=None, base="https://api.twilio.com",
                  version="2010-04-01", timeout=UNSET_TIMEOUT,
-                 request_account=None):
+                 request_account=None, http_client=None,
+                 retry_policy=None, rate_limiter=None,
+                 concurrency_limiter=None, coalesce_requests=False,
+                 instance_cache=None, record_store=None,
+                 json_codec=None):
         """
         Create a Twilio API client.
+
+        :param http_client: The :class:`~twilio.rest.resources.HttpClient`
+            every request made through this client is sent with. Defaults to
+            an :class:`~twilio.rest.resources.Httplib2Client` with its own
+            :class:`~twilio.rest.resources.ConnectionPool`.
+        :param retry_policy: A :class:`~twilio.rest.resources.RetryPolicy`
+            for retrying failed requests. By default requests are not
+            retried.
+        :param rate_limiter: A :class:`~twilio.rest.resources.RateLimiter`
+            to pace requests with. By default requests are not paced.
+        :param concurrency_limiter: An
+            :class:`~twilio.rest.resources.AdaptiveConcurrencyLimiter` capping
+            the requests in flight. By default there is no cap.
+        :param bool coalesce_requests: Whether identical GET requests made
+            at the same time from several threads share one HTTP request,
+            see :class:`~twilio.rest.resources.SingleFlightHttpClient`
+        :param instance_cache: An :class:`~twilio.rest.resources.InstanceCache`
+            keeping the instance resources read through this client. By
+            default nothing is cached.
+        :param record_store: A :class:`~twilio.rest.resources.RecordStore`
+            permanently keeping the calls and messages read through this
+            client once they reach a terminal status
+        :param json_codec: The :class:`~twilio.json_codec.JsonCodec`, or the
+            name of one such as ``"json"`` or ``"orjson"``, to decode
+            responses with. Defaults to the fastest one installed.
         """
 
         # Get account credentials
@@ -58,6 +96,24 @@ values from your Twilio Account at https://www.twilio.com/user/account.
         self.base = base
         self.auth = (account, token)
         self.timeout = timeout
+        if http_client is None:
+            http_client = Httplib2Client(connection_pool=ConnectionPool())
+        if json_codec is not None:
+            http_client = JsonCodecHttpClient(http_client, json_codec)
+        if concurrency_limiter is not None:
+            http_client = ConcurrencyLimitedHttpClient(http_client,
+                                                       concurrency_limiter)
+        if rate_limiter is not None:
+            http_client = RateLimitedHttpClient(http_client, rate_limiter)
+        if retry_policy is not None:
+            http_client = RetryHttpClient(http_client, retry_policy)
+        if coalesce_requests:
+            http_client = SingleFlightHttpClient(http_client)
+        if instance_cache is not None:
+            http_client = CachingHttpClient(http_client, instance_cache)
+        if record_store is not None:
+            http_client = RecordStoreHttpClient(http_client, record_store)
+        self.http_client = http_client
         req_account = request_account if request_account else account
         self.account_uri = "{0}/{1}/Accounts/{2}".format(base,
                                                          version, req_account)
@@ -112,6 +168,7 @@ values from your Twilio Account at https://www.twilio.com/user/account.
         }
 
         resp = make_request(method, uri, auth=self.auth, data=data,
-                            params=params, headers=headers)
+                            params=params, headers=headers,
+                            http_client=self.http_client)
 
         return resp.content
@@ -43,42 +43,79 @@ class TwilioRestClient(TwilioClient):
 
     def __init__(self, account=None, token=None, base="https://api.twilio.com",
                  version="2010-04-01", timeout=UNSET_TIMEOUT,
-                 request_account=None):
+                 request_account=None, http_client=None,
+                 retry_policy=None, rate_limiter=None,
+                 concurrency_limiter=None, coalesce_requests=False,
+                 instance_cache=None, record_store=None,
+                 json_codec=None):
         """
         Create a Twilio REST API client.
         """
         super(TwilioRestClient, self).__init__(account, token, base, version,
-                                               timeout, request_account)
+                                               timeout, request_account,
+                                               http_client, retry_policy,
+                                               rate_limiter,
+                                               concurrency_limiter,
+                                               coalesce_requests,
+                                               instance_cache,
+                                               record_store, json_codec)
 
         version_uri = "%s/%s" % (base, version)
 
-        self.accounts = Accounts(version_uri, self.auth, timeout)
-        self.applications = Applications(self.account_uri, self.auth, timeout)
+        self.accounts = Accounts(version_uri, self.auth, timeout,
+                                 http_client=self.http_client)
+        self.applications = Applications(self.account_uri, self.auth, timeout,
+                                         http_client=self.http_client)
         self.authorized_connect_apps = AuthorizedConnectApps(
             self.account_uri,
             self.auth,
-            timeout
+            timeout,
+            http_client=self.http_client,
         )
-        self.addresses = Addresses(self.account_uri, self.auth, timeout)
-        self.calls = Calls(self.account_uri, self.auth, timeout)
-        self.caller_ids = CallerIds(self.account_uri, self.auth, timeout)
-        self.connect_apps = ConnectApps(self.account_uri, self.auth, timeout)
-        self.notifications = Notifications(self.account_uri, self.auth,
-                                           timeout)
-        self.recordings = Recordings(self.account_uri, self.auth, timeout)
-        self.transcriptions = Transcriptions(self.account_uri, self.auth,
-                                             timeout)
-        self.sms = Sms(self.account_uri, self.auth, timeout)
-        self.phone_numbers = PhoneNumbers(self.account_uri, self.auth, timeout)
-        self.conferences = Conferences(self.account_uri, self.auth, timeout)
-        self.queues = Queues(self.account_uri, self.auth, timeout)
-        self.sandboxes = Sandboxes(self.account_uri, self.auth, timeout)
-        self.usage = Usage(self.account_uri, self.auth, timeout)
-        self.messages = Messages(self.account_uri, self.auth, timeout)
-        self.media = MediaList(self.account_uri, self.auth, timeout)
-        self.sip = Sip(self.account_uri, self.auth, timeout)
-        self.tokens = Tokens(self.account_uri, self.auth, timeout)
-        self.keys = Keys(self.account_uri, self.auth, timeout)
+        self.addresses = Addresses(self.account_uri, self.auth, timeout,
+                                   http_client=self.http_client)
+        self.calls = Calls(self.account_uri, self.auth, timeout,
+                           http_client=self.http_client)
+        self.caller_ids = CallerIds(self.account_uri, self.auth, timeout,
+                                    http_client=self.http_client)
+        self.connect_apps = ConnectApps(self.account_uri, self.auth, timeout,
+                                        http_client=self.http_client)
+        self.notifications = Notifications(
+            self.account_uri,
+            self.auth,
+            timeout,
+            http_client=self.http_client,
+        )
+        self.recordings = Recordings(self.account_uri, self.auth, timeout,
+                                     http_client=self.http_client)
+        self.transcriptions = Transcriptions(
+            self.account_uri,
+            self.auth,
+            timeout,
+            http_client=self.http_client,
+        )
+        self.sms = Sms(self.account_uri, self.auth, timeout,
+                       http_client=self.http_client)
+        self.phone_numbers = PhoneNumbers(self.account_uri, self.auth, timeout,
+                                          http_client=self.http_client)
+        self.conferences = Conferences(self.account_uri, self.auth, timeout,
+                                       http_client=self.http_client)
+        self.queues = Queues(self.account_uri, self.auth, timeout,
+                             http_client=self.http_client)
+        self.sandboxes = Sandboxes(self.account_uri, self.auth, timeout,
+                                   http_client=self.http_client)
+        self.usage = Usage(self.account_uri, self.auth, timeout,
+                           http_client=self.http_client)
+        self.messages = Messages(self.account_uri, self.auth, timeout,
+                                 http_client=self.http_client)
+        self.media = MediaList(self.account_uri, self.auth, timeout,
+                               http_client=self.http_client)
+        self.sip = Sip(self.account_uri, self.auth, timeout,
+                       http_client=self.http_client)
+        self.tokens = Tokens(self.account_uri, self.auth, timeout,
+                             http_client=self.http_client)
+        self.keys = Keys(self.account_uri, self.auth, timeout,
+                         http_client=self.http_client)
 
     def participants(self, conference_sid):
         """
@@ -86,7 +123,8 @@ class TwilioRestClient(TwilioClient):
         :class:`~twilio.rest.resources.Conference` with given conference_sid
         """
         base_uri = "%s/Conferences/%s" % (self.account_uri, conference_sid)
-        return Participants(base_uri, self.auth, self.timeout)
+        return Participants(base_uri, self.auth, self.timeout,
+                            http_client=self.http_client)
 
     def members(self, queue_sid):
         """
@@ -95,7 +133,8 @@ class TwilioRestClient(TwilioClient):
         given queue_sid
         """
         base_uri = "%s/Queues/%s" % (self.account_uri, queue_sid)
-        return Members(base_uri, self.auth, self.timeout)
+        return Members(base_uri, self.auth, self.timeout,
+                       http_client=self.http_client)
 
     def feedback(self, call_sid):
         """
@@ -107,7 +146,8 @@ class TwilioRestClient(TwilioClient):
         call_feedback_list = CallFeedbackFactory(
             base_uri,
             self.auth,
-            self.timeout
+            self.timeout,
+            http_client=self.http_client,
         )
         return CallFeedback(call_feedback_list)
 
@@ -119,4 +159,5 @@ class TwilioRestClient(TwilioClient):
         address_sid
         """
         base_uri = "%s/Addresses/%s" % (self.account_uri, address_sid)
-        return DependentPhoneNumbers(base_uri, self.auth, self.timeout)
+        return DependentPhoneNumbers(base_uri, self.auth, self.timeout,
+                                     http_client=self.http_client)
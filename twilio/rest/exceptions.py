@@ -67,3 +67,21 @@ class TwilioRestException(TwilioException):
             return msg
         else:
             return "HTTP {0} error: {1}".format(self.status, self.msg)
+
+
+class TwilioRateLimitException(TwilioException):
+    """ Raised when a client-side rate limit has no room for a request
+
+    :param str account: The account SID the request was for
+    :param str resource: The name of the resource requested
+    :param float retry_after: The number of seconds until the request
+        could be sent
+    """
+
+    def __init__(self, account, resource, retry_after):
+        super(TwilioRateLimitException, self).__init__(
+            "Rate limit reached for %s %s, retry in %.3f seconds" %
+            (account, resource, retry_after))
+        self.account = account
+        self.resource = resource
+        self.retry_after = retry_after
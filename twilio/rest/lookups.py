@@ -20,11 +20,22 @@ class TwilioLookupsClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://lookups.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 http_client=None, retry_policy=None, rate_limiter=None,
+                 concurrency_limiter=None, coalesce_requests=False,
+                 instance_cache=None, record_store=None,
+                 json_codec=None):
 
         super(TwilioLookupsClient, self).__init__(account, token, base,
                                                   version, timeout,
-                                                  request_account)
+                                                  request_account,
+                                                  http_client, retry_policy,
+                                                  rate_limiter,
+                                                  concurrency_limiter,
+                                                  coalesce_requests,
+                                                  instance_cache,
+                                                  record_store, json_codec)
 
         self.version_uri = "%s/%s" % (base, version)
-        self.phone_numbers = PhoneNumbers(self.version_uri, self.auth, timeout)
+        self.phone_numbers = PhoneNumbers(self.version_uri, self.auth, timeout,
+                                          http_client=self.http_client)
@@ -21,16 +21,28 @@ class TwilioPricingClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://pricing.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 http_client=None, retry_policy=None, rate_limiter=None,
+                 concurrency_limiter=None, coalesce_requests=False,
+                 instance_cache=None, record_store=None,
+                 json_codec=None):
         super(TwilioPricingClient, self).__init__(account, token, base,
                                                   version, timeout,
-                                                  request_account)
+                                                  request_account,
+                                                  http_client, retry_policy,
+                                                  rate_limiter,
+                                                  concurrency_limiter,
+                                                  coalesce_requests,
+                                                  instance_cache,
+                                                  record_store, json_codec)
 
         self.uri_base = "{}/{}".format(base, version)
 
-        self.voice = Voice(self.uri_base, self.auth, self.timeout)
+        self.voice = Voice(self.uri_base, self.auth, self.timeout,
+                           http_client=self.http_client)
         self.phone_numbers = PhoneNumbers(self.uri_base, self.auth,
-                                          self.timeout)
+                                          self.timeout,
+                                          http_client=self.http_client)
 
     def messaging_countries(self):
         """
@@ -40,4 +52,5 @@ class TwilioPricingClient(TwilioClient):
         messaging_countries_uri = "{0}/Messaging".format(
             self.uri_base)
         return MessagingCountries(messaging_countries_uri, self.auth,
-                                  self.timeout)
+                                  self.timeout,
+                                  http_client=self.http_client)
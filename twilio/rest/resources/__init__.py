@@ -3,8 +3,9 @@ from .util import (
     convert_keys, normalize_dates, UNSET_TIMEOUT
 )
 from .base import (
-    Response, Resource, InstanceResource, ListResource,
+    Response, StreamingResponse, Resource, InstanceResource, ListResource,
     NextGenInstanceResource, NextGenListResource,
+    HttpClient, Httplib2Client, Urllib3Client, JsonCodecHttpClient,
     make_request, make_twilio_request
 )
 from .phone_numbers import (
@@ -18,12 +19,26 @@ from .connect_apps import (
     ConnectApp, ConnectApps, AuthorizedConnectApp, AuthorizedConnectApps
 )
 from .calls import Call, Calls
+from .dialer import Dialer
 from .caller_ids import CallerIds, CallerId
 from .call_feedback import (
     CallFeedbackFactory, CallFeedback, CallFeedbackSummary,
     CallFeedbackSummaryInstance
 )
-from .connection import Connection
+from .cache import CachingHttpClient, InstanceCache
+from .compression import TransferStats
+from .connection import Connection, ConnectionPool
+from .concurrency import (
+    AdaptiveConcurrencyLimiter, ConcurrencyLimitedHttpClient
+)
+from .rate_limit import RateLimitedHttpClient, RateLimiter, TokenBucket
+from .record_store import (
+    MmapRecordStore, RecordStore, RecordStoreHttpClient, SqliteRecordStore
+)
+from .retry import RetryHttpClient, RetryPolicy
+from .send_queue import SendQueue
+from .single_flight import SingleFlightHttpClient
+from .sender_pool import PendingMessage, SenderPool
 from .sandboxes import Sandbox, Sandboxes
 from .sms_messages import (
     Sms, SmsMessage, SmsMessages, ShortCode, ShortCodes)
@@ -92,6 +92,22 @@ class Addresses(ListResource):
         }
         return self.get_instances(kwargs)
 
+    def list_raw(self, customer_name=None, friendly_name=None,
+                 iso_country=None, fields=None):
+        """Query the list of addresses for a list of records as dicts.
+
+        :param list fields: The fields to keep in each record. By default,
+            records are returned whole.
+        """
+        kwargs = {
+            'customer_name': customer_name,
+            'friendly_name': friendly_name,
+            'iso_country': iso_country,
+            'raw': True,
+            'fields': fields,
+        }
+        return self.get_instances(kwargs)
+
     def create(self, customer_name, street, city, region, postal_code,
                iso_country, friendly_name=None):
         """Create an :class:`Address`.
@@ -0,0 +1,525 @@
+"""
+asyncio support for the resources in :mod:`twilio.rest.resources`.
+
+This module requires Python 3.5 or later.
+"""
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+import inspect
+import threading
+
+from ...exceptions import TwilioException
+from ..exceptions import TwilioRestException
+from .base import (
+    basic_auth_header,
+    check_twilio_response,
+    encode_request,
+    Httplib2Client,
+    ListResource,
+    NextGenListResource,
+    prepare_twilio_request,
+    Resource,
+    Response,
+)
+from .imports import aiohttp
+from .util import transform_params, UNSET_TIMEOUT
+
+
+class AsyncHttpClient(object):
+    """
+    The asyncio counterpart of :class:`HttpClient`. Subclasses implement
+    :meth:`request` as a coroutine.
+    """
+
+    async def request(self, method, url, body=None, headers=None, auth=None,
+                      timeout=None, allow_redirects=False):
+        """
+        Send an HTTP request
+
+        :param str method: The HTTP method to use
+        :param str url: The URL to request, including the query string
+        :param body: The encoded body of the request, or None
+        :param dict headers: HTTP Headers to send with the request
+        :param tuple auth: A (username, password) tuple for basic auth
+        :param float timeout: Socket/Read timeout for the request
+
+        :return: An http response
+        :rtype: A :class:`Response <models.Response>` object
+        """
+        raise NotImplementedError
+
+
+class ExecutorHttpClient(AsyncHttpClient):
+    """
+    Send requests with a blocking :class:`HttpClient` in an executor, so they
+    don't block the event loop.
+
+    :param http_client: The :class:`HttpClient` to send requests with.
+        Defaults to an :class:`Httplib2Client` without a connection pool.
+    :param executor: The :class:`concurrent.futures.Executor` to run requests
+        in. Defaults to the event loop's default executor.
+    """
+
+    def __init__(self, http_client=None, executor=None):
+        if http_client is None:
+            http_client = Httplib2Client()
+        self.http_client = http_client
+        self.executor = executor
+
+    async def request(self, method, url, body=None, headers=None, auth=None,
+                      timeout=None, allow_redirects=False):
+        loop = asyncio.get_event_loop()
+        send = partial(self.http_client.request, method, url, body=body,
+                       headers=headers, auth=auth, timeout=timeout,
+                       allow_redirects=allow_redirects)
+        return await loop.run_in_executor(self.executor, send)
+
+
+class AiohttpClient(AsyncHttpClient):
+    """
+    Send requests with `aiohttp <https://aiohttp.readthedocs.io>`_.
+
+    :param session: The :class:`aiohttp.ClientSession` to send requests with.
+        By default a session is created on the first request.
+    """
+
+    def __init__(self, session=None):
+        if aiohttp is None:
+            raise TwilioException("AiohttpClient requires aiohttp")
+        self.session = session
+
+    async def request(self, method, url, body=None, headers=None, auth=None,
+                      timeout=None, allow_redirects=False):
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+
+        headers = dict(headers or {})
+        if auth is not None:
+            headers['Authorization'] = basic_auth_header(auth)
+
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        async with self.session.request(method, url, data=body,
+                                        headers=headers,
+                                        allow_redirects=allow_redirects,
+                                        **kwargs) as resp:
+            content = await resp.read()
+
+        return Response(resp, content, url, headers=resp.headers)
+
+    async def close(self):
+        """Close the underlying session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+async def make_async_twilio_request(method, uri, http_client, params=None,
+                                    data=None, headers=None, auth=None,
+                                    timeout=None, **kwargs):
+    """
+    Make a request to Twilio with an :class:`AsyncHttpClient`
+
+    :return: a requests-like HTTP response
+    :raises TwilioRestException: if the response is a 400
+        or 500-level response.
+    """
+    uri, kwargs = prepare_twilio_request(method, uri, headers=headers or {},
+                                         **kwargs)
+    url, body = encode_request(uri, params, data)
+    resp = await http_client.request(method, url, body=body,
+                                     headers=kwargs['headers'], auth=auth,
+                                     timeout=timeout)
+    return check_twilio_response(method, resp)
+
+
+class AsyncPageIterator(object):
+    """
+    Iterate over every instance of an :class:`AsyncListResource` with
+    ``async for``, fetching a page of results at a time.
+
+    :param int prefetch: The number of pages to fetch ahead of the consumer
+        in a background task
+    :param int limit: The largest number of records to yield, or None
+    """
+
+    def __init__(self, resource, params, prefetch=0, load=None, limit=None):
+        self.resource = resource
+        self.load = load or resource.sync.load_instance
+        self.page_request = resource.first_page(transform_params(params))
+        self.records = deque()
+        self.prefetch = prefetch
+        self.limit = limit
+        self.fetched = 0
+        self.pages = None
+        self.producer = None
+        if limit is not None and limit <= 0:
+            self.page_request = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.records:
+            records = await self.next_records()
+            if records is None:
+                raise StopAsyncIteration
+
+            self.records.extend(records)
+
+        return self.load(self.records.popleft())
+
+    async def next_records(self):
+        if not self.prefetch:
+            return await self.fetch_page()
+
+        if self.producer is None:
+            self.pages = asyncio.Queue(maxsize=self.prefetch)
+            self.producer = asyncio.ensure_future(self.produce())
+
+        records = await self.pages.get()
+        if isinstance(records, Exception):
+            raise records
+        return records
+
+    async def produce(self):
+        try:
+            while True:
+                records = await self.fetch_page()
+                await self.pages.put(records)
+                if records is None:
+                    return
+        except Exception as e:
+            await self.pages.put(e)
+
+    async def fetch_page(self):
+        """Return the records of the next page, or None after the last"""
+        if self.page_request is None:
+            return None
+
+        uri, request_args = self.page_request
+        resp, page = await self.resource.async_request("GET", uri,
+                                                       **request_args)
+
+        key = self.resource.page_key(page)
+        if key is None or key not in page:
+            self.page_request = None
+            return None
+
+        records = page[key]
+        next_page = self.resource.next_page(page, uri, request_args)
+        if self.limit is not None:
+            records = records[:self.limit - self.fetched]
+            self.fetched += len(records)
+            if self.fetched >= self.limit:
+                next_page = None
+            elif next_page is not None:
+                next_page = self.resource.shrink_page(
+                    next_page[0], next_page[1], self.limit - self.fetched)
+
+        self.page_request = next_page
+        return records
+
+    def close(self):
+        """Stop fetching pages in the background"""
+        if self.producer is not None:
+            self.producer.cancel()
+
+
+# Options of ListResource.iter built on threads, which the asynchronous
+# iterator doesn't support
+SYNC_ONLY_OPTIONS = ('workers', 'expand', 'stream')
+
+
+class AsyncListResource(ListResource):
+    """
+    Replaces the requests a :class:`ListResource` makes with coroutines.
+
+    Don't use this class directly, use :func:`make_async` to get an asyncio
+    version of a list resource. The asyncio version keeps all the methods of
+    the original, so ``create``, ``get``, ``list``, ``update`` and ``delete``
+    return awaitables and ``iter`` returns an asynchronous iterator. Methods
+    specific to one resource, like ``phone_numbers.purchase``, return
+    awaitables too: they run in a background thread, and the requests they
+    make are sent with the async http client. The instances they return are
+    loaded by the original list resource, so their own methods block.
+    """
+
+    async def async_request(self, method, uri, **kwargs):
+        """
+        Send an HTTP request to the resource with the async http client.
+
+        :raises: a :exc:`~twilio.TwilioRestException`
+        """
+        resp = await self.async_send(method, uri, **kwargs)
+        return self.load_response(method, resp)
+
+    async def async_send(self, method, uri, **kwargs):
+        """
+        Send an HTTP request to the resource with the async http client, and
+        return the response without decoding its body.
+
+        :raises: a :exc:`~twilio.TwilioRestException`
+        """
+        if 'timeout' not in kwargs and self.timeout is not UNSET_TIMEOUT:
+            kwargs['timeout'] = self.timeout
+
+        kwargs['use_json_extension'] = self.use_json_extension
+        return await make_async_twilio_request(
+            method,
+            uri,
+            self.async_http_client,
+            auth=self.auth,
+            **kwargs
+        )
+
+    async def get_instance(self, sid):
+        uri = "%s/%s" % (self.uri, sid)
+        resp, item = await self.async_request("GET", uri)
+        return self.sync.load_instance(item)
+
+    async def get_instances(self, params):
+        load = self.sync.record_loader(params.pop('raw', False),
+                                       params.pop('fields', None))
+        params = transform_params(params)
+
+        resp, page = await self.async_request("GET", self.uri, params=params)
+        return [load(ir) for ir in self.page_records(page)]
+
+    async def create_instance(self, body):
+        resp, instance = await self.async_request(
+            "POST",
+            self.uri,
+            data=transform_params(body),
+        )
+
+        if resp.status_code not in (200, 201):
+            raise TwilioRestException(resp.status_code,
+                                      self.uri, "Resource not created")
+
+        return self.sync.load_instance(instance)
+
+    async def delete_instance(self, sid):
+        uri = "%s/%s" % (self.uri, sid)
+        resp, instance = await self.async_request("DELETE", uri)
+        return resp.status_code == 204
+
+    async def update_instance(self, sid, body):
+        uri = "%s/%s" % (self.uri, sid)
+        resp, entry = await self.async_request("POST", uri,
+                                               data=transform_params(body))
+        return self.sync.load_instance(entry)
+
+    async def create_many(self, items, concurrency=4):
+        """
+        Create many instance resources at once, with at most `concurrency`
+        requests in flight, and return the results in the order of `items`.
+        An item which can't be created is replaced by the exception raised
+        creating it. See :meth:`ListResource.create_many`.
+        """
+        create = getattr(self, 'create', None)
+
+        async def create_one(item):
+            try:
+                if create is None:
+                    return await self.create_instance(item)
+                return await create(**item)
+            except Exception as e:
+                return e
+
+        results = []
+        pending = deque()
+        for item in items:
+            pending.append(asyncio.ensure_future(create_one(item)))
+            if len(pending) >= concurrency:
+                results.append(await pending.popleft())
+
+        while pending:
+            results.append(await pending.popleft())
+        return results
+
+    def iter(self, prefetch=0, raw=False, fields=None, limit=None, **kwargs):
+        """
+        Return all instance resources using an asynchronous iterator
+
+        Example usage:
+
+        .. code-block:: python
+
+            async for message in client.messages.iter(prefetch=2):
+                print(message.sid)
+
+        Unless ``page_size`` is given, pages are as large as the API allows.
+        Pass ``limit`` to stop after that many records, requesting pages no
+        larger than needed, as :meth:`ListResource.iter` does.
+
+        :param int prefetch: The number of pages to fetch ahead of the consumer
+        :param bool raw: Yield the decoded JSON records instead of instance
+            resources
+        :param list fields: With `raw`, the fields to keep in each record
+        :param int limit: The largest number of instances to yield
+        :raises: a :exc:`TypeError` if given ``workers``, ``expand`` or
+            ``stream``, which only the blocking ``iter`` supports
+        """
+        unsupported = [name for name in SYNC_ONLY_OPTIONS
+                       if kwargs.pop(name, None)]
+        if unsupported:
+            raise TypeError("The asynchronous iter() doesn't support %s" %
+                            ", ".join(unsupported))
+
+        if 'page_size' not in kwargs and 'PageSize' not in kwargs:
+            kwargs['page_size'] = self.sync.max_page_size
+            if limit is not None and limit > 0:
+                kwargs['page_size'] = min(limit, self.sync.max_page_size)
+        return AsyncPageIterator(self, kwargs, prefetch,
+                                 self.sync.record_loader(raw, fields), limit)
+
+
+class AsyncNamespace(object):
+    """
+    Wraps an object that groups several resources, like ``client.sip``, so
+    the resources it holds or returns are asyncio versions.
+    """
+
+    def __init__(self, target, async_http_client, memo):
+        memo[id(target)] = self
+        self._target = target
+        self._async_http_client = async_http_client
+        for name, value in vars(target).items():
+            setattr(self, name, make_async(value, async_http_client, memo))
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if not inspect.ismethod(value):
+            return value
+
+        @wraps(value)
+        def method(*args, **kwargs):
+            return make_async(value(*args, **kwargs),
+                              self._async_http_client)
+        return method
+
+
+# The event loop a background thread running a resource-specific method
+# sends its requests with, see _blocking_method
+_bridge = threading.local()
+
+# Runs resource-specific methods. It is separate from the event loop's
+# default executor, which ExecutorHttpClient sends their requests in.
+_bridge_executor = None
+
+# Methods of list resources which don't make requests, or which the
+# asynchronous versions already replace
+SYNC_HELPERS = ('iter', 'parallel_iter', 'load_instance', 'record_loader')
+
+
+def _get_bridge_executor():
+    global _bridge_executor
+    if _bridge_executor is None:
+        _bridge_executor = ThreadPoolExecutor()
+    return _bridge_executor
+
+
+def _bridged_send(resource, twin):
+    """
+    Return a ``send`` for `resource` which, in a thread running one of its
+    methods for `twin`, sends the request with the async http client on the
+    event loop instead of blocking on the resource's own http client.
+    """
+    send = resource.send
+
+    @wraps(send)
+    def bridged(method, uri, **kwargs):
+        loop = getattr(_bridge, 'loop', None)
+        if loop is None:
+            return send(method, uri, **kwargs)
+        future = asyncio.run_coroutine_threadsafe(
+            twin.async_send(method, uri, **kwargs), loop)
+        return future.result()
+    return bridged
+
+
+def _blocking_method(name, func):
+    """
+    Return a coroutine function running the method `name` of the original
+    list resource in a background thread, where its requests are bridged to
+    the event loop.
+    """
+    @wraps(func)
+    async def method(self, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        run = partial(getattr(self.sync, name), *args, **kwargs)
+
+        def bridge():
+            _bridge.loop = loop
+            try:
+                return run()
+            finally:
+                _bridge.loop = None
+
+        return await loop.run_in_executor(_get_bridge_executor(), bridge)
+    return method
+
+
+_async_classes = {}
+
+
+def _async_class(cls):
+    if cls not in _async_classes:
+        methods = {}
+        for klass in cls.__mro__:
+            if issubclass(NextGenListResource, klass):
+                continue
+            for name, value in vars(klass).items():
+                if (name.startswith('_') or name in SYNC_HELPERS or
+                        name in methods or not inspect.isfunction(value)):
+                    continue
+                methods[name] = _blocking_method(name, value)
+
+        _async_classes[cls] = type("Async%s" % cls.__name__,
+                                   (cls, AsyncListResource), methods)
+    return _async_classes[cls]
+
+
+def _holds_resources(obj):
+    return (not isinstance(obj, type) and
+            any(isinstance(v, Resource)
+                for v in getattr(obj, '__dict__', {}).values()))
+
+
+def make_async(obj, async_http_client, memo=None):
+    """
+    Return an asyncio version of a list resource, or of an object holding list
+    resources. Anything else is returned unchanged.
+
+    :param obj: The resource to convert
+    :param async_http_client: The :class:`AsyncHttpClient` to send requests
+        with
+    :param dict memo: Objects converted so far, for resources which refer to
+        each other
+    """
+    if memo is None:
+        memo = {}
+
+    if id(obj) in memo:
+        return memo[id(obj)]
+
+    if isinstance(obj, ListResource):
+        cls = _async_class(type(obj))
+        twin = cls.__new__(cls)
+        memo[id(obj)] = twin
+        for name, value in vars(obj).items():
+            setattr(twin, name, make_async(value, async_http_client, memo))
+        twin.sync = obj
+        twin.async_http_client = async_http_client
+        obj.send = _bridged_send(obj, twin)
+        return twin
+
+    if not isinstance(obj, Resource) and _holds_resources(obj):
+        return AsyncNamespace(obj, async_http_client, memo)
+
+    return obj
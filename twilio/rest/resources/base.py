@@ -1,6 +1,9 @@
+import base64
+from functools import partial
 import logging
 import os
 import platform
+import threading
 
 from six import (
     integer_types,
@@ -14,29 +17,157 @@ from ...compat import urlunparse
 
 from ... import __version__
 from ...exceptions import TwilioException
+from ...json_codec import get_codec
 from ..exceptions import TwilioRestException
+from .compression import (
+    TransferStats,
+    accept_encoding,
+    content_encoding,
+    decompress_body,
+    decompress_stream,
+)
 from .connection import Connection
-from .imports import parse_qs, httplib2, json
+from .imports import parse_qs, httplib2, json, urllib3
+from .json_stream import StreamedPage
 from .util import (
     parse_iso_date,
+    parallel_map,
     parse_rfc2822_date,
+    prefetch_iter,
     transform_params,
     UNSET_TIMEOUT,
 )
 
 logger = logging.getLogger('twilio')
 
+CHUNK_SIZE = 64 * 1024
+
+_MISSING = object()
+
 
 class Response(object):
     """
     Take a httplib2 response and turn it into a requests response
+
+    :param content: The body, as bytes encoded in UTF-8 or as text
+    :param dict headers: The response headers. Their names are lowercased.
     """
-    def __init__(self, httplib_resp, content, url):
+    streaming = False
+    codec = None
+
+    def __init__(self, httplib_resp, content, url, headers=None):
         self.content = content
         self.cached = False
         self.status_code = int(httplib_resp.status)
         self.ok = self.status_code < 400
         self.url = url
+        self.headers = dict((k.lower(), v)
+                            for k, v in iteritems(dict(headers or {})))
+        self._json = None
+
+    @property
+    def content(self):
+        """The body, decoded to text the first time it's read"""
+        if self._text is None:
+            body = self.body
+            if isinstance(body, binary_type):
+                body = body.decode('utf-8')
+            self._text = body
+        return self._text
+
+    @content.setter
+    def content(self, content):
+        self.body = content
+        self._text = None
+
+    def json(self):
+        """
+        Return the decoded JSON body. It's decoded on the first call only, so
+        a cached response isn't decoded again each time it's served.
+
+        The body is decoded with the response's `codec`, or the default
+        :class:`~twilio.json_codec.JsonCodec`, straight from bytes when the
+        codec can.
+        """
+        if self._json is None:
+            self._json = get_codec(self.codec).loads(self.body)
+        return self._json
+
+    def iter_content(self, chunk_size=CHUNK_SIZE):
+        """Yield the body in chunks of at most `chunk_size` bytes"""
+        body = self.body
+        for start in range(0, len(body), chunk_size):
+            yield body[start:start + chunk_size]
+
+
+class StreamingResponse(Response):
+    """
+    A response whose body is read from the connection as it's consumed,
+    rather than before the response is returned.
+
+    The body can be read once, either whole from :attr:`body` or
+    :attr:`content`, which keep it, or in chunks from :meth:`iter_content`,
+    which doesn't.
+
+    :param chunks: An iterable over the body, as bytes encoded in UTF-8
+    """
+
+    streaming = True
+
+    def __init__(self, httplib_resp, chunks, url, headers=None):
+        self.chunks = chunks
+        self.consumed = False
+        self.lock = threading.RLock()
+        super(StreamingResponse, self).__init__(httplib_resp, None, url,
+                                                headers=headers)
+
+    @property
+    def body(self):
+        with self.lock:
+            if self._body is None:
+                self._check_unread()
+                self._body = b"".join(self.chunks)
+            return self._body
+
+    @body.setter
+    def body(self, body):
+        self._body = body
+
+    def iter_content(self, chunk_size=CHUNK_SIZE):
+        """
+        Yield the body as it's read from the connection, in chunks of
+        bytes, or in chunks of at most `chunk_size` bytes if it was already
+        read whole.
+        """
+        with self.lock:
+            if self._body is None:
+                self._check_unread()
+                return self.chunks
+        return super(StreamingResponse, self).iter_content(chunk_size)
+
+    def _check_unread(self):
+        if self.consumed:
+            raise TwilioException("The body of %s was already read" %
+                                  self.url)
+        self.consumed = True
+
+
+def stream_body(resp, chunk_size=CHUNK_SIZE):
+    """
+    Yield the body of a urllib3 response read without preloading its
+    content, as it was received, then give its connection back to the
+    pool. A connection whose body wasn't read to the end is closed instead
+    of being reused.
+    """
+    done = False
+    try:
+        for chunk in resp.stream(chunk_size, decode_content=False):
+            yield chunk
+        done = True
+    finally:
+        if not done:
+            resp.close()
+        resp.release_conn()
 
 
 def get_cert_file():
@@ -56,43 +187,213 @@ def get_cert_file():
         return None
 
 
-def make_request(method, url, params=None, data=None, headers=None,
-                 cookies=None, files=None, auth=None, timeout=None,
-                 allow_redirects=False, proxies=None):
-    """Sends an HTTP request
+def new_http(timeout=None):
+    """ Create an :class:`httplib2.Http` object for talking to Twilio """
+    return httplib2.Http(
+        timeout=timeout,
+        ca_certs=get_cert_file(),
+        proxy_info=Connection.proxy_info(),
+    )
 
-    :param str method: The HTTP method to use
-    :param str url: The URL to request
-    :param dict params: Query parameters to append to the URL
-    :param dict data: Parameters to go in the body of the HTTP request
-    :param dict headers: HTTP Headers to send with the request
-    :param float timeout: Socket/Read timeout for the request
 
-    :return: An http response
-    :rtype: A :class:`Response <models.Response>` object
+def basic_auth_header(auth):
+    """ Build the value of an Authorization header for HTTP basic auth """
+    credentials = base64.b64encode(("%s:%s" % auth).encode('utf-8'))
+    if not isinstance(credentials, str):
+        credentials = credentials.decode('ascii')
+    return "Basic %s" % credentials
 
-    See the requests documentation for explanation of all these parameters
 
-    Currently proxies, files, and cookies are all ignored
+class HttpClient(object):
     """
-    http = httplib2.Http(
-        timeout=timeout,
-        ca_certs=get_cert_file(),
-        proxy_info=Connection.proxy_info(),
-    )
-    http.follow_redirects = allow_redirects
+    The transport used to send requests to Twilio.
+
+    Pass an instance as ``http_client`` to a client or resource to change
+    how requests go over the wire, for example to record them or to serve
+    canned responses. Subclasses implement :meth:`request`.
+    """
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        """Sends an HTTP request
+
+        :param str method: The HTTP method to use
+        :param str url: The URL to request, including any query string
+        :param str body: The urlencoded body of the request
+        :param dict headers: HTTP Headers to send with the request
+        :param tuple auth: A (username, password) pair for basic auth
+        :param float timeout: Socket/Read timeout for the request
+        :param bool allow_redirects: Whether to follow redirects
+
+        :rtype: A :class:`Response` object
+        """
+        raise NotImplementedError
+
+
+class Httplib2Client(HttpClient):
+    """
+    An :class:`HttpClient` built on httplib2.
+
+    httplib2 asks for gzip or deflate compressed responses on its own, and
+    decompresses them before they can be measured, so they're counted as
+    unmeasured in :attr:`transfer_stats`.
+
+    :param connection_pool: A :class:`ConnectionPool` to borrow persistent
+        connections from. Without one, every request opens a new connection.
+    :param transfer_stats: The :class:`TransferStats` to count responses in
+    """
+
+    def __init__(self, connection_pool=None, transfer_stats=None):
+        self.connection_pool = connection_pool
+        if transfer_stats is None:
+            transfer_stats = TransferStats()
+        self.transfer_stats = transfer_stats
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        if self.connection_pool is None:
+            http = new_http(timeout)
+            http.follow_redirects = allow_redirects
+
+            if auth is not None:
+                http.add_credentials(auth[0], auth[1])
+
+            resp, content = http.request(url, method, headers=headers,
+                                         body=body)
+        else:
+            # Pooled connections are shared between accounts, so credentials
+            # are sent up front rather than registered on the connection.
+            # This also saves the round trip httplib2 spends on the 401
+            # challenge.
+            if auth is not None:
+                headers = dict(headers or {})
+                headers["Authorization"] = basic_auth_header(auth)
+
+            parsed = urlparse(url)
+            key = (parsed.scheme, parsed.netloc, timeout,
+                   Connection.proxy_info())
+            factory = partial(new_http, timeout)
+            with self.connection_pool.connection(key, factory) as http:
+                http.follow_redirects = allow_redirects
+                resp, content = http.request(url, method, headers=headers,
+                                             body=body)
+
+        if "-content-encoding" in resp:
+            self.transfer_stats.response(compressed=True, measured=False)
+        else:
+            self.transfer_stats.response()
+            self.transfer_stats.read(len(content), len(content))
+
+        # Format httplib2 request as requests object
+        return Response(resp, content, url, headers=resp)
 
-    if auth is not None:
-        http.add_credentials(auth[0], auth[1])
 
+class Urllib3Client(HttpClient):
+    """
+    An :class:`HttpClient` built on urllib3, which pools connections on its
+    own. Requires the ``urllib3`` package.
+
+    Requests ask for responses compressed with gzip or deflate, unless they
+    have an Accept-Encoding header of their own. Compressed responses are
+    decompressed as they're read, and counted in :attr:`transfer_stats`.
+
+    :param pool_manager: The :class:`urllib3.PoolManager` to send requests
+        with. By default one is created with the Twilio CA bundle; any extra
+        keyword arguments, such as ``maxsize``, are passed to it.
+    :param bool stream: Whether to return the successful responses to GET
+        requests as :class:`StreamingResponse` objects, whose body is read
+        as it's consumed
+    :param transfer_stats: The :class:`TransferStats` to count responses in
+    """
+
+    def __init__(self, pool_manager=None, stream=False, transfer_stats=None,
+                 **kwargs):
+        if pool_manager is None:
+            if urllib3 is None:
+                raise TwilioException("Urllib3Client requires urllib3")
+            pool_manager = urllib3.PoolManager(
+                cert_reqs="CERT_REQUIRED",
+                ca_certs=get_cert_file(),
+                **kwargs
+            )
+        self.pool_manager = pool_manager
+        self.stream = stream
+        if transfer_stats is None:
+            transfer_stats = TransferStats()
+        self.transfer_stats = transfer_stats
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        headers = accept_encoding(headers)
+        if auth is not None:
+            headers["Authorization"] = basic_auth_header(auth)
+
+        kwargs = {}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        stream = self.stream and method == "GET"
+        if stream:
+            kwargs["preload_content"] = False
+
+        resp = self.pool_manager.urlopen(method, url, body=body,
+                                         headers=headers,
+                                         redirect=allow_redirects,
+                                         decode_content=False, **kwargs)
+        encoding = content_encoding(resp.headers)
+        if stream and resp.status == 200:
+            chunks = decompress_stream(stream_body(resp), encoding,
+                                       self.transfer_stats)
+            return StreamingResponse(resp, chunks, url, headers=resp.headers)
+
+        content = decompress_body(resp.data, encoding, self.transfer_stats)
+        if stream:
+            resp.release_conn()
+        return Response(resp, content, url, headers=resp.headers)
+
+
+class JsonCodecHttpClient(HttpClient):
+    """
+    An :class:`HttpClient` decoding the JSON bodies of its responses with
+    a given :class:`~twilio.json_codec.JsonCodec`.
+
+    :param http_client: The :class:`HttpClient` to send requests with
+    :param codec: The :class:`~twilio.json_codec.JsonCodec`, or the name of
+        one such as ``"orjson"``
+    """
+
+    def __init__(self, http_client, codec):
+        self.http_client = http_client
+        self.codec = get_codec(codec)
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        resp = self.http_client.request(method, url, body=body,
+                                        headers=headers, auth=auth,
+                                        timeout=timeout,
+                                        allow_redirects=allow_redirects)
+        if isinstance(resp, Response):
+            resp.codec = self.codec
+        return resp
+
+
+def encode_request(url, params=None, data=None):
+    """Encode query parameters into the url and form data into a body
+
+    :param str url: The URL to request
+    :param dict params: Query parameters to append to the URL
+    :param dict data: Parameters to go in the body of the HTTP request
+
+    :return: a tuple of the url and the encoded body, or None
+    """
     def encode_atom(atom):
-            if isinstance(atom, (integer_types, binary_type)):
-                return atom
-            elif isinstance(atom, string_types):
-                return atom.encode('utf-8')
-            else:
-                raise ValueError('list elements should be an integer, '
-                                 'binary, or string')
+        if isinstance(atom, (integer_types, binary_type)):
+            return atom
+        elif isinstance(atom, string_types):
+            return atom.encode('utf-8')
+        else:
+            raise ValueError('list elements should be an integer, '
+                             'binary, or string')
 
     if data is not None:
         udata = {}
@@ -114,20 +415,45 @@ def make_request(method, url, params=None, data=None, headers=None,
         else:
             url = '%s?%s' % (url, enc_params)
 
-    resp, content = http.request(url, method, headers=headers, body=data)
+    return url, data
 
-    # Format httplib2 request as requests object
-    return Response(resp, content.decode('utf-8'), url)
 
+def make_request(method, url, params=None, data=None, headers=None,
+                 cookies=None, files=None, auth=None, timeout=None,
+                 allow_redirects=False, proxies=None, http_client=None):
+    """Sends an HTTP request
 
-def make_twilio_request(method, uri, **kwargs):
+    :param str method: The HTTP method to use
+    :param str url: The URL to request
+    :param dict params: Query parameters to append to the URL
+    :param dict data: Parameters to go in the body of the HTTP request
+    :param dict headers: HTTP Headers to send with the request
+    :param float timeout: Socket/Read timeout for the request
+    :param http_client: The :class:`HttpClient` to send the request with.
+        Defaults to an :class:`Httplib2Client` without a connection pool.
+
+    :return: An http response
+    :rtype: A :class:`Response <models.Response>` object
+
+    See the requests documentation for explanation of all these parameters
+
+    Currently proxies, files, and cookies are all ignored
     """
-    Make a request to Twilio. Throws an error
+    url, data = encode_request(url, params, data)
 
-    :return: a requests-like HTTP response
-    :rtype: :class:`RequestsResponse`
-    :raises TwilioRestException: if the response is a 400
-        or 500-level response.
+    if http_client is None:
+        http_client = Httplib2Client()
+
+    return http_client.request(method, url, body=data, headers=headers,
+                               auth=auth, timeout=timeout,
+                               allow_redirects=allow_redirects)
+
+
+def prepare_twilio_request(method, uri, **kwargs):
+    """
+    Add the headers and uri suffix every request to Twilio needs
+
+    :return: a tuple of the uri and the remaining request arguments
     """
     headers = kwargs.get("headers", {})
 
@@ -149,8 +475,15 @@ def make_twilio_request(method, uri, **kwargs):
     if kwargs.pop('use_json_extension', False):
         uri += ".json"
 
-    resp = make_request(method, uri, **kwargs)
+    return uri, kwargs
+
 
+def check_twilio_response(method, resp):
+    """
+    Raise a :exc:`TwilioRestException` if the response is an error
+
+    :return: the response, unchanged
+    """
     if not resp.ok:
         try:
             error = json.loads(resp.content)
@@ -166,16 +499,43 @@ def make_twilio_request(method, uri, **kwargs):
     return resp
 
 
+def make_twilio_request(method, uri, **kwargs):
+    """
+    Make a request to Twilio. Throws an error
+
+    :return: a requests-like HTTP response
+    :rtype: :class:`RequestsResponse`
+    :raises TwilioRestException: if the response is a 400
+        or 500-level response.
+    """
+    uri, kwargs = prepare_twilio_request(method, uri, **kwargs)
+    resp = make_request(method, uri, **kwargs)
+    return check_twilio_response(method, resp)
+
+
+def subresource_key(resource):
+    """
+    Return the attribute name of a list resource class when it is the
+    subresource of an instance, as :class:`ListResource` sets its `key`
+    """
+    try:
+        return resource.key
+    except AttributeError:
+        return resource.name.lower()
+
+
 class Resource(object):
     """A REST Resource"""
 
     name = "Resource"
     use_json_extension = False
 
-    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT):
+    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT,
+                 http_client=None):
         self.base_uri = base_uri
         self.auth = auth
         self.timeout = timeout
+        self.http_client = http_client
 
     def __eq__(self, other):
         return (isinstance(other, self.__class__) and
@@ -191,18 +551,36 @@ class Resource(object):
         """
         Send an HTTP request to the resource.
 
+        :raises: a :exc:`~twilio.TwilioRestException`
+        """
+        resp = self.send(method, uri, **kwargs)
+        return self.load_response(method, resp)
+
+    def send(self, method, uri, **kwargs):
+        """
+        Send an HTTP request to the resource, and return the response
+        without decoding its body.
+
         :raises: a :exc:`~twilio.TwilioRestException`
         """
         if 'timeout' not in kwargs and self.timeout is not UNSET_TIMEOUT:
             kwargs['timeout'] = self.timeout
 
+        if self.http_client is not None:
+            kwargs['http_client'] = self.http_client
+
         kwargs['use_json_extension'] = self.use_json_extension
-        resp = make_twilio_request(method, uri, auth=self.auth, **kwargs)
+        return make_twilio_request(method, uri, auth=self.auth, **kwargs)
 
-        logger.debug(resp.content)
+    def load_response(self, method, resp):
+        """Return the response along with its decoded body"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(resp.content)
 
         if method == "DELETE":
             return resp, {}
+        elif isinstance(resp, Response):
+            return resp, resp.json()
         else:
             return resp, json.loads(resp.content)
 
@@ -232,10 +610,19 @@ class InstanceResource(Resource):
         super(InstanceResource, self).__init__(
             parent.uri,
             parent.auth,
-            parent.timeout
+            parent.timeout,
+            http_client=parent.http_client,
         )
 
     def load(self, entries):
+        """
+        Set the instance's attributes from the fields of a record.
+
+        Dates are parsed the first time their attribute is read, so until
+        then they are absent from the instance's ``__dict__``. `entries` is
+        left unchanged, so a decoded response can be loaded again.
+        """
+        entries = dict(entries)
         if "from" in entries.keys():
             entries["from_"] = entries["from"]
             del entries["from"]
@@ -243,24 +630,61 @@ class InstanceResource(Resource):
         if "uri" in entries.keys():
             del entries["uri"]
 
-        for key in entries.keys():
+        dates = dict(entries.pop("_unparsed_dates", {}))
+        for key in list(entries.keys()):
             if (key.startswith("date_") and
                     isinstance(entries[key], string_types)):
-                entries[key] = self._parse_date(entries[key])
+                dates[key] = entries.pop(key)
 
         self.__dict__.update(entries)
 
+        if dates:
+            for key in dates:
+                self.__dict__.pop(key, None)
+            self.__dict__.setdefault("_unparsed_dates", {}).update(dates)
+
     def load_subresources(self):
         """
         Load all subresources
+
+        Subresources are built the first time they are accessed, so this
+        only removes any loaded fields which share a subresource's name.
         """
         for resource in self.subresources:
-            list_resource = resource(
-                self.uri,
-                self.parent.auth,
-                self.parent.timeout
-            )
-            self.__dict__[list_resource.key] = list_resource
+            self.__dict__.pop(subresource_key(resource), None)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        dates = self.__dict__.get("_unparsed_dates")
+        if dates:
+            raw = dates.get(name, _MISSING)
+            if raw is not _MISSING:
+                value = self._parse_date(raw)
+                self.__dict__[name] = value
+                dates.pop(name, None)
+                return value
+
+        # The parsed date is stored before the raw one is removed, so a
+        # thread which missed the attribute and then finds the raw date gone
+        # finds the parsed one instead
+        if name in self.__dict__:
+            return self.__dict__[name]
+
+        for resource in self.subresources:
+            if subresource_key(resource) == name:
+                list_resource = resource(
+                    self.uri,
+                    self.parent.auth,
+                    self.parent.timeout,
+                    http_client=self.parent.http_client,
+                )
+                self.__dict__[name] = list_resource
+                return list_resource
+
+        raise AttributeError("%r object has no attribute %r" %
+                             (self.__class__.__name__, name))
 
     def update_instance(self, **kwargs):
         """ Make a POST request to the API to update an object's properties
@@ -302,6 +726,9 @@ class ListResource(Resource):
     name = "Resources"
     instance = InstanceResource
     use_json_extension = True
+    expandable = True
+    expanded = None
+    max_page_size = 1000
 
     def __init__(self, *args, **kwargs):
         super(ListResource, self).__init__(*args, **kwargs)
@@ -346,14 +773,14 @@ class ListResource(Resource):
 
         :returns: -- the list of resources
         """
+        raw = params.pop('raw', False)
+        load = self.record_loader(raw, params.pop('fields', None))
         params = transform_params(params)
+        if self.expanded is not None and not raw and not params:
+            return list(self.expanded)
 
         resp, page = self.request("GET", self.uri, params=params)
-
-        if self.key not in page:
-            raise TwilioException("Key %s not present in response" % self.key)
-
-        return [self.load_instance(ir) for ir in page[self.key]]
+        return [load(ir) for ir in self.page_records(page)]
 
     def create_instance(self, body):
         """
@@ -391,15 +818,75 @@ class ListResource(Resource):
         resp, entry = self.request("POST", uri, data=transform_params(body))
         return self.load_instance(entry)
 
-    def iter(self, **kwargs):
+    def create_many(self, items, concurrency=4):
+        """ Create many instance resources at once
+
+        Each item is a dict of the keyword arguments to pass to ``create``,
+        or the POST data for :meth:`create_instance` if the resource has no
+        ``create`` method. Items are created from a pool of `concurrency`
+        threads sharing the resource's http client, and with it the client's
+        connection pool, rate limiter and retry policy.
+
+        `items` is read as results are consumed, so it can be a generator
+        over more items than fit in memory: at most `concurrency` items are
+        being created or waiting to be consumed at once.
+
+        Results are yielded in the order of `items`. An item which can't be
+        created doesn't stop the others: the exception raised creating it is
+        yielded in its place.
+
+        Example usage:
+
+        .. code-block:: python
+
+            items = ({"to": to, "from_": "+15555555555", "body": "Hi!"}
+                     for to in recipients)
+            for to, result in zip(recipients,
+                                  client.messages.create_many(items, 16)):
+                if isinstance(result, Exception):
+                    print to, result
+
+        :param items: An iterable of dicts, one per instance to create
+        :param int concurrency: The number of instances to create at once
+        """
+        create = getattr(self, 'create', None)
+
+        def create_one(item):
+            try:
+                if create is None:
+                    return self.create_instance(item)
+                return create(**item)
+            except Exception as e:
+                return e
+
+        return parallel_map(create_one, items, concurrency)
+
+    def iter(self, prefetch=0, workers=0, raw=False, fields=None, expand=None,
+             stream=False, limit=None, **kwargs):
         """ Return all instance resources using an iterator
 
         This will fetch a page of resources from the API and yield them in
         turn. When the page is exhausted, this will make a request to the API
         to retrieve the next page. Hence you may notice a pattern - the library
-        will loop through 50 objects very quickly, but there will be a delay
-        retrieving the 51st as the library must make another request to the API
-        for resources.
+        will loop through a page of objects very quickly, but there will be a
+        delay retrieving the first object of the next page as the library must
+        make another request to the API for resources.
+
+        Unless ``page_size`` is given, pages are as large as the API allows,
+        :attr:`max_page_size` records, so iterating over every record takes
+        as few requests as possible. Pass ``limit`` to stop after that many
+        records: no more pages are requested once they're fetched, the pages
+        requested are no larger than ``limit``, and the last one is shrunk to
+        the number of records still needed where the API allows it, see
+        :meth:`shrink_page`.
+
+        To avoid the delay, pass ``prefetch``: the following pages are then
+        requested in a background thread while the current one is consumed,
+        holding at most ``prefetch`` pages in memory.
+
+        For resources whose first page says how many pages there are, pass
+        ``workers`` to request the remaining pages by number from that many
+        threads at once. Instances are still yielded in order.
 
         Example usage:
 
@@ -407,104 +894,364 @@ class ListResource(Resource):
 
             for message in client.messages:
                 print message.sid
+
+            for call in client.calls.iter(prefetch=2):
+                print call.sid
+
+            for recording in client.recordings.iter(workers=8):
+                print recording.sid
+
+        To also fetch some of the subresources of each instance, pass their
+        names as ``expand``. They're requested for a whole page of instances
+        at once, from ``workers`` threads or 4 by default, before the page's
+        instances are yielded. See :meth:`expand_instances`.
+
+        .. code-block:: python
+
+            for call in client.calls.iter(expand=["recordings"]):
+                for recording in call.recordings.list():  # No request
+                    print recording.duration
+
+        Pass ``stream`` to decode each record as soon as it's read rather
+        than once its whole page is, see :meth:`iter_pages_streamed`. This
+        can't be combined with ``prefetch`` or ``workers``.
+
+        :param int prefetch: The number of pages to fetch ahead of the consumer
+        :param int workers: The number of pages to request at once
+        :param bool raw: Yield the decoded JSON records instead of instance
+            resources, see :meth:`iter_raw`
+        :param list fields: With `raw`, the fields to keep in each record
+        :param list expand: The names of the subresources to fetch along
+            with each instance
+        :param bool stream: Whether to decode pages as they're read
+        :param int limit: The largest number of instances to yield
+        :raises: a :exc:`~twilio.TwilioException` if `expand` names something
+            which isn't a subresource, or is given with `raw`, or if `stream`
+            is given with `prefetch` or `workers`
         """
+        if expand and raw:
+            raise TwilioException("Raw records can't be expanded")
+        if expand:
+            self._check_expand(expand)
+
+        if limit is not None and limit <= 0:
+            return
+
+        load = self.record_loader(raw, fields)
         params = transform_params(kwargs)
+        if 'PageSize' not in params:
+            params['PageSize'] = self.max_page_size
+            if limit is not None:
+                params['PageSize'] = min(limit, self.max_page_size)
+
+        if stream:
+            if prefetch or workers > 1:
+                raise TwilioException("Streamed pages can't be fetched "
+                                      "ahead or in parallel")
+            pages = self.iter_pages_streamed(params, limit)
+        elif workers > 1:
+            pages = self.iter_pages_parallel(params, workers, limit)
+        else:
+            pages = self.iter_pages(params, limit)
+
+        pages = ((load(ir) for ir in records) for records in pages)
+        if expand:
+            concurrency = workers if workers > 1 else 4
+            pages = (self.expand_instances(list(items), expand, concurrency)
+                     for items in pages)
+
+        if prefetch:
+            pages = prefetch_iter(pages, prefetch)
+
+        count = 0
+        for items in pages:
+            for item in items:
+                yield item
+                count += 1
+                if count == limit:
+                    return
+
+    def expand_instances(self, instances, names, concurrency=4):
+        """
+        Fetch the subresources called `names` of each of `instances`, such
+        as the ``recordings`` of a list of calls, from a pool of
+        `concurrency` threads, and return `instances`.
+
+        Each subresource keeps the first page of its results, which it then
+        returns from ``list`` called without any argument rather than
+        requesting it again.
+
+        :param list instances: The instance resources to expand
+        :param list names: The names of the subresources to fetch
+        :param int concurrency: The number of subresources to fetch at once
+        :raises: a :exc:`~twilio.TwilioException` if a name isn't the name
+            of a subresource which can be listed
+        """
+        self._check_expand(names)
+
+        def fetch(resource):
+            resource.expanded = resource.get_instances({})
+
+        resources = [getattr(instance, name)
+                     for instance in instances for name in names]
+        for _ in parallel_map(fetch, resources, concurrency):
+            pass
+        return instances
+
+    def _check_expand(self, names):
+        expandable = set(subresource_key(resource)
+                         for resource in self.instance.subresources
+                         if resource.expandable)
+        unknown = [name for name in names if name not in expandable]
+        if unknown:
+            raise TwilioException(
+                "%s can't expand %s" % (self.instance.__name__,
+                                        ", ".join(sorted(unknown))))
 
-        while True:
-            resp, page = self.request("GET", self.uri, params=params)
+    def iter_raw(self, fields=None, **kwargs):
+        """ Return all records as dicts using an iterator
 
-            if self.key not in page:
-                raise StopIteration()
+        This works like :meth:`iter`, and takes the same arguments, but
+        yields the records as decoded from the API's JSON rather than
+        building an instance resource for each one. This is much cheaper
+        when iterating over many records.
 
-            for ir in page[self.key]:
-                yield self.load_instance(ir)
+        Example usage:
 
-            if not page.get('next_page_uri', ''):
-                raise StopIteration()
+        .. code-block:: python
 
-            o = urlparse(page['next_page_uri'])
-            params.update(parse_qs(o.query))
+            for call in client.calls.iter_raw(fields=["sid", "duration"]):
+                print call["sid"], call["duration"]
 
-    def load_instance(self, data):
-        instance = self.instance(self, data[self.instance.id_key])
-        instance.load(data)
-        instance.load_subresources()
-        return instance
+        :param list fields: The fields to keep in each record. By default,
+            records are yielded whole.
+        """
+        return self.iter(raw=True, fields=fields, **kwargs)
 
-    def __str__(self):
-        return '<%s>' % (self.__class__.__name__)
+    def list_raw(self, fields=None, **kwargs):
+        """Query the list resource for a list of records as dicts.
 
-    def list(self, **kw):
-        """Query the list resource for a list of InstanceResources.
+        This works like :meth:`list`, and takes the same arguments, but
+        returns the records as decoded from the API's JSON.
 
-        :param int page: The page of results to retrieve (most recent at 0)
-        :param int page_size: The number of results to be returned.
+        :param list fields: The fields to keep in each record. By default,
+            records are returned whole.
         """
-        return self.get_instances(kw)
+        return self.list(raw=True, fields=fields, **kwargs)
 
+    def record_loader(self, raw=False, fields=None):
+        """
+        Return the function turning a record of a page of results into what
+        the list and iteration methods return: an instance resource or, if
+        `raw`, the record itself, limited to `fields` if given.
+        """
+        if not raw:
+            return self.load_instance
 
-class NextGenListResource(ListResource):
+        if fields is None:
+            return dict
 
-    name = "Resources"
-    instance = NextGenInstanceResource
-    use_json_extension = False
-
-    def __init__(self, *args, **kwargs):
-        super(NextGenListResource, self).__init__(*args, **kwargs)
+        return lambda record: dict((f, record.get(f)) for f in fields)
 
-    def iter(self, **kwargs):
-        """ Return all instance resources using an iterator
+    def iter_pages(self, params, limit=None):
+        """
+        Yield the list of records in each page of results, following the
+        links from one page to the next
 
-        This will fetch a page of resources from the API and yield them in
-        turn. When the page is exhausted, this will make a request to the API
-        to retrieve the next page. Hence you may notice a pattern - the library
-        will loop through 50 objects very quickly, but there will be a delay
-        retrieving the 51st as the library must make another request to the API
-        for resources.
+        :param dict params: URL parameters to be included in the request
+        :param int limit: The number of records after which to stop
+            requesting pages
+        """
+        uri, request_args = self.first_page(params)
+        return self._follow_pages(uri, request_args, limit)
 
-        Example usage:
+    def iter_pages_parallel(self, params, workers, limit=None):
+        """
+        Yield the list of records in each page of results, requesting the
+        pages after the first by number from a pool of `workers` threads.
 
-        .. code-block:: python
+        Resources whose first page doesn't say how many pages there are are
+        paged through in turn, as with :meth:`iter_pages`.
 
-            for message in client.messages:
-                print message.sid
+        :param dict params: URL parameters to be included in the request
+        :param int workers: The number of pages to request at once
+        :param int limit: The number of records after which to stop
+            requesting pages
         """
-        params = urlencode(transform_params(kwargs))
-        parsed = urlparse(self.uri)
-        url = urlunparse(parsed[:4] + (params, ) + (parsed[5], ))
+        uri, request_args = self.first_page(params)
+        resp, page = self.request("GET", uri, **request_args)
+
+        key = self.page_key(page)
+        if key is None or key not in page:
+            return
+
+        yield page[key]
+
+        remaining = None
+        if limit is not None:
+            remaining = limit - len(page[key])
+            if remaining <= 0:
+                return
+
+        num_pages = page.get('num_pages')
+        if num_pages is None and page.get('total') is not None:
+            page_size = page.get('page_size') or len(page[key]) or 1
+            num_pages = (page['total'] + page_size - 1) // page_size
+
+        if num_pages is None:
+            next_page = self.next_page(page, uri, request_args)
+            if next_page is not None:
+                if remaining is not None:
+                    next_page = self.shrink_page(next_page[0], next_page[1],
+                                                 remaining)
+                for records in self._follow_pages(next_page[0], next_page[1],
+                                                  remaining):
+                    yield records
+            return
+
+        first = page.get('page', 0)
+        page_size = page.get('page_size', len(page[key]))
+        if remaining is not None and page_size:
+            needed = (remaining + page_size - 1) // page_size
+            num_pages = min(num_pages, first + 1 + needed)
+
+        def fetch(number):
+            page_params = dict(request_args.get('params', {}))
+            page_params.update(Page=number, PageSize=page_size)
+            kwargs = dict(request_args, params=page_params)
+            resp, numbered_page = self.request("GET", uri, **kwargs)
+            return numbered_page.get(key, [])
+
+        numbers = range(first + 1, num_pages)
+        for records in parallel_map(fetch, numbers, workers):
+            yield records
+
+    def iter_pages_streamed(self, params, limit=None):
+        """
+        Yield an iterator over the records of each page of results, which
+        decodes them one at a time as the page's body is read. With an
+        :class:`HttpClient` returning a :class:`StreamingResponse`, such as
+        ``Urllib3Client(stream=True)``, only one record of a page is held in
+        memory at once.
+
+        The next page is requested once the records of the current one are
+        exhausted. Resources whose pages name their list of records, and so
+        can't be decoded before they're read, are paged through as with
+        :meth:`iter_pages`.
+
+        :param dict params: URL parameters to be included in the request
+        :param int limit: The number of records after which to stop
+            requesting pages
+        """
+        key = self.page_key({})
+        if key is None:
+            for records in self.iter_pages(params, limit):
+                yield records
+            return
 
+        count = 0
+        uri, request_args = self.first_page(params)
         while True:
-            resp, page = self.request("GET", url)
+            resp = self.send("GET", uri, **request_args)
+            if isinstance(resp, Response):
+                chunks = resp.iter_content()
+            else:
+                chunks = [resp.content]
+
+            page = StreamedPage(chunks, key)
+            records = page.records()
+            yield records
 
-            key = page.get('meta', {}).get('key')
+            for _ in records:
+                pass
 
+            count += page.count
+            if limit is not None and count >= limit:
+                return
+
+            next_page = self.next_page(page.page, uri, request_args)
+            if next_page is None:
+                return
+
+            uri, request_args = next_page
+            if limit is not None:
+                uri, request_args = self.shrink_page(uri, request_args,
+                                                     limit - count)
+
+    def _follow_pages(self, uri, request_args, limit=None):
+        count = 0
+        while True:
+            resp, page = self.request("GET", uri, **request_args)
+
+            key = self.page_key(page)
             if key is None or key not in page:
-                raise StopIteration()
+                return
 
-            for ir in page[key]:
-                yield self.load_instance(ir)
+            yield page[key]
 
-            url = page.get('meta', {}).get('next_page_url')
-            if not url:
-                raise StopIteration()
+            count += len(page[key])
+            if limit is not None and count >= limit:
+                return
 
-    def get_instances(self, params):
+            next_page = self.next_page(page, uri, request_args)
+            if next_page is None:
+                return
+
+            uri, request_args = next_page
+            if limit is not None:
+                uri, request_args = self.shrink_page(uri, request_args,
+                                                     limit - count)
+
+    def first_page(self, params):
         """
-        Query the list resource for a list of InstanceResources.
+        Return the uri and request arguments for the first page of results
 
-        Raises a :exc:`~twilio.TwilioRestException` if requesting a page of
-        results that does not exist.
+        :param dict params: URL parameters to be included in the request
+        """
+        return self.uri, {'params': params}
 
-        :param dict params: List of URL parameters to be included in request
-        :param int page: The page of results to retrieve (most recent at 0)
-        :param int page_size: The number of results to be returned.
+    def next_page(self, page, uri, request_args):
+        """
+        Return the uri and request arguments for the page following `page`,
+        or None if `page` is the last page of results
+        """
+        if not page.get('next_page_uri', ''):
+            return None
 
-        :returns: -- the list of resources
+        o = urlparse(page['next_page_uri'])
+        request_args['params'].update(parse_qs(o.query))
+        return uri, request_args
+
+    def shrink_page(self, uri, request_args, size):
         """
-        params = transform_params(params)
+        Return the uri and request arguments for a page of results with at
+        most `size` records, given those for the next page.
 
-        resp, page = self.request("GET", self.uri, params=params)
-        key = page.get('meta', {}).get('key')
+        Only pages found by their PageToken are shrunk: shrinking a page
+        found by its number would move it.
+        """
+        params = request_args['params']
+        if 'PageToken' not in params:
+            return uri, request_args
+
+        page_size = params.get('PageSize')
+        if isinstance(page_size, list):
+            page_size = page_size[0]
+        if page_size is None or int(page_size) > size:
+            params['PageSize'] = size
+        return uri, request_args
+
+    def page_key(self, page):
+        """Return the key of the list of records in a page of results"""
+        return self.key
+
+    def page_records(self, page):
+        """
+        Return the list of records in a page of results
+
+        :raises: a :exc:`~twilio.TwilioException` if the page has no records
+        """
+        key = self.page_key(page)
 
         if key is None:
             raise TwilioException(
@@ -514,4 +1261,60 @@ class NextGenListResource(ListResource):
         if key not in page:
             raise TwilioException("Key %s not present in response" % key)
 
-        return [self.load_instance(ir) for ir in page[key]]
+        return page[key]
+
+    def load_instance(self, data):
+        instance = self.instance(self, data[self.instance.id_key])
+        instance.load(data)
+        instance.load_subresources()
+        return instance
+
+    def __str__(self):
+        return '<%s>' % (self.__class__.__name__)
+
+    def list(self, **kw):
+        """Query the list resource for a list of InstanceResources.
+
+        :param int page: The page of results to retrieve (most recent at 0)
+        :param int page_size: The number of results to be returned.
+        """
+        return self.get_instances(kw)
+
+
+class NextGenListResource(ListResource):
+
+    name = "Resources"
+    instance = NextGenInstanceResource
+    use_json_extension = False
+
+    def __init__(self, *args, **kwargs):
+        super(NextGenListResource, self).__init__(*args, **kwargs)
+
+    def first_page(self, params):
+        params = urlencode(params)
+        parsed = urlparse(self.uri)
+        url = urlunparse(parsed[:4] + (params, ) + (parsed[5], ))
+        return url, {}
+
+    def next_page(self, page, uri, request_args):
+        url = page.get('meta', {}).get('next_page_url')
+        if not url:
+            return None
+
+        return url, request_args
+
+    def shrink_page(self, uri, request_args, size):
+        parsed = urlparse(uri)
+        query = parse_qs(parsed.query)
+        if 'PageToken' not in query:
+            return uri, request_args
+
+        page_size = query.get('PageSize', [None])[0]
+        if page_size is None or int(page_size) > size:
+            query['PageSize'] = [size]
+            params = urlencode(query, doseq=True)
+            uri = urlunparse(parsed[:4] + (params, ) + (parsed[5], ))
+        return uri, request_args
+
+    def page_key(self, page):
+        return page.get('meta', {}).get('key')
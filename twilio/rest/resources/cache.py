@@ -0,0 +1,218 @@
+from collections import OrderedDict
+import threading
+import time
+
+from ...compat import urlparse
+from .base import HttpClient
+from .rate_limit import RESOURCE_PATTERN
+
+DEFAULT_TTL = object()
+
+
+class InstanceCache(object):
+    """A least recently used cache whose entries expire after `ttl` seconds.
+
+    Expired entries are kept until they are evicted, so they can be
+    revalidated with a conditional request rather than fetched again.
+
+    :param int max_size: The number of entries kept. Adding an entry to a
+        full cache evicts the least recently used one.
+    :param float ttl: The number of seconds an entry is kept, or None to
+        keep entries until they are evicted or invalidated
+    """
+
+    def __init__(self, max_size=1024, ttl=60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = {
+            'hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'evicted': 0,
+            'invalidated': 0,
+            'revalidated': 0,
+        }
+
+    def get(self, key):
+        """Return the value cached for `key`, or None if it expired"""
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                self.counters['misses'] += 1
+                return None
+
+            self.entries[key] = entry
+            expires, value = entry
+            if expires is not None and expires <= time.time():
+                self.counters['expired'] += 1
+                self.counters['misses'] += 1
+                return None
+
+            self.counters['hits'] += 1
+            return value
+
+    def stale(self, key):
+        """Return the value cached for `key`, even if it expired, or None"""
+        with self.lock:
+            entry = self.entries.get(key)
+            return None if entry is None else entry[1]
+
+    def set(self, key, value, ttl=DEFAULT_TTL):
+        """
+        Cache `value` for `key`, for `ttl` seconds if given, or else for the
+        cache's `ttl`.
+        """
+        if ttl is DEFAULT_TTL:
+            ttl = self.ttl
+        expires = None if ttl is None else time.time() + ttl
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (expires, value)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.counters['evicted'] += 1
+
+    def invalidate(self, key):
+        """Remove the value cached for `key`, if any"""
+        with self.lock:
+            if self.entries.pop(key, None) is not None:
+                self.counters['invalidated'] += 1
+
+    def revalidated(self, key, ttl=DEFAULT_TTL):
+        """
+        Keep the value cached for `key` for another `ttl` seconds, once a
+        conditional request showed it hasn't changed.
+        """
+        value = self.stale(key)
+        if value is not None:
+            self.set(key, value, ttl)
+            with self.lock:
+                self.counters['revalidated'] += 1
+
+    def clear(self):
+        """Remove every cached value"""
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        """
+        Return the cache's counters: lookups which found a value and which
+        didn't, how many of those found an expired value, and how many
+        values were evicted, invalidated and revalidated. ``size`` is the
+        number of values cached.
+        """
+        with self.lock:
+            stats = dict(self.counters)
+            stats['size'] = len(self.entries)
+        return stats
+
+
+def instance_url(url):
+    """
+    Whether `url` is the url of an instance resource, such as
+    ``/Accounts/AC123/Queues/QU123.json``, rather than of a list resource or
+    of a page of results.
+    """
+    parts = urlparse(url)
+    if parts.query:
+        return False
+
+    last = parts.path.rstrip("/").rsplit("/", 1)[-1]
+    if last.endswith(".json"):
+        last = last[:-len(".json")]
+    return not RESOURCE_PATTERN.match(last)
+
+
+def no_cache(headers):
+    """
+    Whether the Cache-Control header of a request asks for a response which
+    wasn't served from the cache without being revalidated
+    """
+    for name, value in (headers or {}).items():
+        if name.lower() == "cache-control" and "no-cache" in value.lower():
+            return True
+    return False
+
+
+def validators(resp):
+    """Return the ETag and Last-Modified headers of a response"""
+    return dict((name, resp.headers[name])
+                for name in ('etag', 'last-modified') if name in resp.headers)
+
+
+def conditional_headers(resp, headers=None):
+    """
+    Return `headers` with the conditional headers revalidating a cached
+    response added.
+    """
+    headers = dict(headers or {})
+    found = validators(resp)
+    if 'etag' in found:
+        headers['If-None-Match'] = found['etag']
+    if 'last-modified' in found:
+        headers['If-Modified-Since'] = found['last-modified']
+    return headers
+
+
+class CachingHttpClient(HttpClient):
+    """
+    An :class:`HttpClient` keeping the responses to GET requests for
+    instance resources in an :class:`InstanceCache`, so reading the same
+    instance again doesn't go over the network.
+
+    A POST or DELETE request to an instance, such as the ones sent by
+    ``update`` and ``delete``, removes it from the cache.
+
+    If `conditional`, the ETag and Last-Modified headers of cached responses
+    are sent back as If-None-Match and If-Modified-Since once they expire.
+    When the API answers 304 Not Modified, the cached response, already
+    decoded, is served again. Instances requested with a
+    ``Cache-Control: no-cache`` header are always revalidated before being
+    served. Responses to other GET requests, such as pages of results, are
+    never kept, since a cache of whole pages would hold far more records
+    than its size suggests.
+
+    :param http_client: The :class:`HttpClient` to send requests with
+    :param cache: The :class:`InstanceCache` to keep responses in
+    :param bool conditional: Whether to revalidate expired responses
+    """
+
+    def __init__(self, http_client, cache, conditional=True):
+        self.http_client = http_client
+        self.cache = cache
+        self.conditional = conditional
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        cacheable = method == "GET" and instance_url(url)
+        if cacheable and not no_cache(headers):
+            resp = self.cache.get(url)
+            if resp is not None:
+                return resp
+
+        stale = None
+        if cacheable and self.conditional:
+            stale = self.cache.stale(url)
+            if stale is not None and validators(stale):
+                headers = conditional_headers(stale, headers)
+            else:
+                stale = None
+
+        try:
+            resp = self.http_client.request(method, url, body=body,
+                                            headers=headers, auth=auth,
+                                            timeout=timeout,
+                                            allow_redirects=allow_redirects)
+        finally:
+            if method in ("POST", "PUT", "DELETE"):
+                self.cache.invalidate(url)
+
+        if stale is not None and resp.status_code == 304:
+            self.cache.revalidated(url)
+            return stale
+
+        if cacheable and resp.status_code == 200:
+            self.cache.set(url, resp)
+        return resp
@@ -26,6 +26,7 @@ class CallFeedbackFactory(ListResource):
 
     name = "Feedback"
     instance = CallFeedback
+    expandable = False
 
     def create(self, **kwargs):
         """
@@ -4,7 +4,13 @@ from twilio.rest.resources.call_feedback import (
     CallFeedbackFactory,
     CallFeedbackSummary,
 )
-from .util import normalize_dates, parse_date, transform_params
+from .util import (
+    merge_iter,
+    normalize_dates,
+    parse_date,
+    split_dates,
+    transform_params,
+)
 from . import InstanceResource, ListResource
 
 
@@ -94,6 +100,8 @@ class Calls(ListResource):
 
         :param date after: Only list calls started after this datetime
         :param date before: Only list calls started before this datetime
+        :param list expand: The subresources to fetch along with each call,
+            among ``notifications`` and ``recordings``
         """
         kwargs["from"] = from_
         kwargs["StartTime<"] = started_before
@@ -104,6 +112,26 @@ class Calls(ListResource):
         kwargs["EndTime"] = parse_date(ended)
         return super(Calls, self).iter(**kwargs)
 
+    def parallel_iter(self, start, end, shards=4, ordered=False, **kwargs):
+        """
+        Returns an iterator of the :class:`Call` resources started from
+        `start` to `end`, inclusive. The date range is split into `shards`
+        smaller ranges, which are paged through concurrently.
+
+        :param date start: The first day to list calls from
+        :param date end: The last day to list calls from
+        :param int shards: The number of date ranges to fetch at once
+        :param bool ordered: Yield calls most recent first, as :meth:`iter`
+            does, rather than as they arrive
+
+        Any other arguments filter the calls, as for :meth:`iter`.
+        """
+        return merge_iter(
+            [self.iter(started_after=first, started_before=last, **kwargs)
+             for first, last in split_dates(start, end, shards)],
+            ordered=ordered,
+        )
+
     def create(self, to, from_, url, status_method=None, status_events=None,
                **kwargs):
         """
@@ -194,7 +222,8 @@ class Calls(ListResource):
         """
         uri = "%s/%s" % (self.uri, sid)
         call_feedback_factory = CallFeedbackFactory(
-            uri, self.auth, self.timeout
+            uri, self.auth, self.timeout,
+            http_client=self.http_client,
         )
         return call_feedback_factory.create(
             quality_score=quality_score, issue=issue
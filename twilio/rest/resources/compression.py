@@ -0,0 +1,152 @@
+import threading
+import zlib
+
+ACCEPT_ENCODING = "gzip, deflate"
+ENCODINGS = frozenset(["gzip", "deflate"])
+
+
+class TransferStats(object):
+    """
+    Counters of the response bodies read by an :class:`HttpClient`.
+
+    ``compressed_bytes`` counts the bytes of bodies as they were received,
+    and ``uncompressed_bytes`` as they were after being decompressed, so
+    they're equal for responses which weren't compressed. Responses which a
+    transport decompressed before they could be measured, as httplib2 does,
+    are only counted in ``unmeasured_responses``.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {
+            'responses': 0,
+            'compressed_responses': 0,
+            'unmeasured_responses': 0,
+            'compressed_bytes': 0,
+            'uncompressed_bytes': 0,
+        }
+
+    def response(self, compressed=False, measured=True):
+        """Count a response"""
+        with self.lock:
+            self.counters['responses'] += 1
+            if compressed:
+                self.counters['compressed_responses'] += 1
+            if not measured:
+                self.counters['unmeasured_responses'] += 1
+
+    def read(self, compressed, uncompressed):
+        """Count bytes of a body, as received and after decompression"""
+        with self.lock:
+            self.counters['compressed_bytes'] += compressed
+            self.counters['uncompressed_bytes'] += uncompressed
+
+    def stats(self):
+        """
+        Return the counters, and the ``ratio`` of compressed to uncompressed
+        bytes, or None if no bytes were read
+        """
+        with self.lock:
+            stats = dict(self.counters)
+        if stats['uncompressed_bytes']:
+            stats['ratio'] = (float(stats['compressed_bytes']) /
+                              stats['uncompressed_bytes'])
+        else:
+            stats['ratio'] = None
+        return stats
+
+
+class Decompressor(object):
+    """
+    Decompress a body sent with a Content-Encoding of gzip or deflate, one
+    chunk at a time.
+
+    Some servers send deflate bodies without the zlib header the HTTP spec
+    asks for, so those are detected and decompressed too.
+    """
+
+    def __init__(self, encoding):
+        self.encoding = encoding
+        # 32 detects a gzip or zlib header, 16 expects a gzip one
+        wbits = zlib.MAX_WBITS | (16 if encoding == "gzip" else 32)
+        self.decompressor = zlib.decompressobj(wbits)
+        self.started = False
+
+    def decompress(self, chunk):
+        if not chunk:
+            return b""
+
+        if not self.started and self.encoding == "deflate":
+            self.started = True
+            try:
+                return self.decompressor.decompress(chunk)
+            except zlib.error:
+                self.decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+
+        self.started = True
+        return self.decompressor.decompress(chunk)
+
+    def flush(self):
+        return self.decompressor.flush()
+
+
+def content_encoding(headers):
+    """
+    Return the Content-Encoding of a response, if it's one this module can
+    decompress, or None
+    """
+    for name, value in headers.items():
+        if name.lower() == "content-encoding":
+            value = value.strip().lower()
+            return value if value in ENCODINGS else None
+    return None
+
+
+def accept_encoding(headers):
+    """
+    Return `headers` asking for a response compressed with one of the
+    encodings this module can decompress, unless they already name the
+    encodings they accept
+    """
+    headers = dict(headers or {})
+    if not any(name.lower() == "accept-encoding" for name in headers):
+        headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return headers
+
+
+def decompress_body(body, encoding, stats):
+    """
+    Return `body`, decompressed if it has an `encoding`, and count it in
+    `stats`
+    """
+    stats.response(compressed=encoding is not None)
+    if encoding is not None:
+        decompressor = Decompressor(encoding)
+        content = decompressor.decompress(body) + decompressor.flush()
+    else:
+        content = body
+    stats.read(len(body), len(content))
+    return content
+
+
+def decompress_stream(chunks, encoding, stats):
+    """
+    Yield the chunks of a body, decompressed as they're read if it has an
+    `encoding`, and count them in `stats`
+    """
+    stats.response(compressed=encoding is not None)
+    decompressor = Decompressor(encoding) if encoding is not None else None
+    for chunk in chunks:
+        if decompressor is not None:
+            data = decompressor.decompress(chunk)
+        else:
+            data = chunk
+        stats.read(len(chunk), len(data))
+        if data:
+            yield data
+
+    if decompressor is not None:
+        data = decompressor.flush()
+        stats.read(0, len(data))
+        if data:
+            yield data
@@ -0,0 +1,193 @@
+import re
+import threading
+import time
+
+from ...compat import urlparse
+from .base import HttpClient
+
+SID_PATTERN = re.compile(r"/[A-Z]{2}[0-9a-f]{32}")
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """Caps the number of requests in flight, adapting the cap to how the API
+    copes with the load.
+
+    The cap grows additively while requests finish in a healthy time, by
+    about `increase` once a full cap's worth of requests has succeeded. It is
+    cut multiplicatively, by `decrease`, when a request is rejected with one
+    of `statuses`, fails with a connection error or is slow. Requests which
+    were already in flight when the cap was cut don't cut it again, so a
+    burst of rejections only counts once.
+
+    What's slow is measured rather than fixed, since a page of 1000 records
+    takes far longer than a single instance: the limiter keeps a baseline
+    latency for each kind of request, a decaying minimum of the latencies of
+    its successful responses. It follows faster responses at once and slower
+    ones gradually, by `smoothing` of the difference each time, so a fast
+    outlier fades after a few responses. Errors, which the API often answers
+    faster, don't count. A request more than `tolerance` times slower than
+    its baseline is slow, as is one slower than `latency_target` seconds, if
+    given. So steadily slow responses raise the baseline rather than cut the
+    cap, while a sudden slowdown cuts it.
+
+    Requests over the cap wait in :meth:`acquire` until another request
+    finishes.
+
+    :param int initial: The cap to start with
+    :param int minimum: The smallest cap
+    :param int maximum: The largest cap
+    :param float latency_target: The slowest healthy response, in seconds,
+        whatever the baseline, or None
+    :param float tolerance: How many times slower than its baseline a
+        healthy response may be
+    :param float smoothing: How quickly baselines follow slower responses,
+        between 0 and 1
+    :param float increase: How much the cap grows per cap's worth of
+        successful requests
+    :param float decrease: The factor the cap is multiplied by on overload
+    :param statuses: The response statuses showing the API is overloaded
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=64, latency_target=None,
+                 tolerance=2.0, smoothing=0.1, increase=1.0, decrease=0.5,
+                 statuses=(429, 503)):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.increase = increase
+        self.decrease = decrease
+        self.statuses = frozenset(statuses)
+        self.baselines = {}
+        self.in_flight = 0
+        self.epoch = 0
+        self.increases = 0
+        self.decreases = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Wait until there is room for another request under the cap.
+
+        :return: A token to pass to :meth:`release` when the request is done
+        """
+        with self.condition:
+            while self.in_flight >= max(int(self.limit), self.minimum):
+                self.condition.wait()
+            self.in_flight += 1
+            return self.epoch
+
+    def release(self, token, latency, overloaded=False, kind=None,
+                failed=False):
+        """
+        Mark a request as done and adapt the cap to its outcome.
+
+        :param token: The token :meth:`acquire` returned for the request
+        :param float latency: How many seconds the request took
+        :param bool overloaded: Whether the API rejected the request as
+            overloaded
+        :param kind: A hashable naming the kind of request, whose latency is
+            compared to the baseline of its kind
+        :param bool failed: Whether the request failed otherwise, so its
+            latency doesn't update the baseline
+        """
+        with self.condition:
+            self.in_flight -= 1
+
+            slow = self.slow(latency, kind)
+            if not (overloaded or failed):
+                self.measure(latency, kind)
+
+            if overloaded or slow:
+                if token == self.epoch:
+                    self.epoch += 1
+                    self.decreases += 1
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+            elif self.limit < self.maximum:
+                self.increases += 1
+                self.limit = min(self.maximum,
+                                 self.limit + self.increase / self.limit)
+
+            self.condition.notify_all()
+
+    def slow(self, latency, kind=None):
+        """
+        Return whether `latency` is slow for a request of `kind`. Must be
+        called holding the condition.
+        """
+        baseline = self.baselines.get(kind)
+        return ((self.latency_target is not None and
+                 latency > self.latency_target) or
+                (baseline is not None and
+                 latency > baseline * self.tolerance))
+
+    def measure(self, latency, kind=None):
+        """
+        Update the baseline of `kind` with the latency of a successful
+        request. Must be called holding the condition.
+        """
+        baseline = self.baselines.get(kind)
+        if baseline is None or latency < baseline:
+            self.baselines[kind] = latency
+        else:
+            self.baselines[kind] = (baseline +
+                                    self.smoothing * (latency - baseline))
+
+    def stats(self):
+        """
+        Return the current cap and number of requests in flight, and how many
+        times the cap was raised and cut.
+        """
+        with self.condition:
+            return {
+                'limit': int(self.limit),
+                'in_flight': self.in_flight,
+                'increases': self.increases,
+                'decreases': self.decreases,
+            }
+
+
+def request_kind(method, url):
+    """
+    Return the method and path of a request, with any SIDs in the path
+    replaced, so requests for different instances of a resource are alike.
+    """
+    return method, SID_PATTERN.sub("/{sid}", urlparse(url).path)
+
+
+class ConcurrencyLimitedHttpClient(HttpClient):
+    """
+    An :class:`HttpClient` capping the requests another one has in flight
+    with an :class:`AdaptiveConcurrencyLimiter`. Threads sending requests
+    through it, such as the workers of ``iter(workers=...)``, wait for room
+    under the cap before sending.
+
+    :param http_client: The :class:`HttpClient` to send requests with
+    :param concurrency_limiter: The :class:`AdaptiveConcurrencyLimiter` to
+        cap requests with
+    """
+
+    def __init__(self, http_client, concurrency_limiter):
+        self.http_client = http_client
+        self.concurrency_limiter = concurrency_limiter
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        limiter = self.concurrency_limiter
+        token = limiter.acquire()
+        start = time.time()
+        overloaded = True
+        failed = True
+        try:
+            resp = self.http_client.request(method, url, body=body,
+                                            headers=headers, auth=auth,
+                                            timeout=timeout,
+                                            allow_redirects=allow_redirects)
+            overloaded = resp.status_code in limiter.statuses
+            failed = resp.status_code >= 400
+            return resp
+        finally:
+            limiter.release(token, time.time() - start, overloaded,
+                            request_kind(method, url), failed)
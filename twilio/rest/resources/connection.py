@@ -1,3 +1,7 @@
+from contextlib import contextmanager
+import threading
+import time
+
 from .imports import (
     httplib2,
     socks,
@@ -44,6 +48,138 @@ class Connection(object):
         )
 
 
+class ConnectionPool(object):
+    '''A pool of persistent HTTP connection objects, kept per host.
+
+    httplib2 keeps the sockets of an :class:`httplib2.Http` object open
+    between requests, so handing the same object out again lets a request
+    skip the TCP connect and TLS handshake. The pool is owned by a client and
+    is safe to share between threads; a connection is only ever used by one
+    request at a time.
+
+    :param int max_size: The number of idle connections kept for each host.
+        Connections returned to a full pool are closed.
+    :param float idle_timeout: The number of seconds an idle connection is
+        kept before it is closed. ``None`` keeps idle connections forever.
+    '''
+
+    def __init__(self, max_size=10, idle_timeout=60):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._counters = {
+            'created': 0,
+            'reused': 0,
+            'evicted': 0,
+            'discarded': 0,
+        }
+
+    @contextmanager
+    def connection(self, key, factory):
+        '''Check a connection out of the pool for the duration of a block.
+
+        :param key: A hashable identifying the host the connection talks to,
+            for example the scheme and netloc of the request URL.
+        :param factory: A callable returning a new connection, used when
+            there is no idle connection for ``key``.
+
+        A connection is returned to the pool when the block finishes, and
+        closed instead if the block exits any other way, including through a
+        :exc:`KeyboardInterrupt`, since it may be halfway through a response.
+        '''
+        conn = self._checkout(key, factory)
+        finished = False
+        try:
+            yield conn
+            finished = True
+        finally:
+            if finished:
+                self._checkin(key, conn)
+            else:
+                self._discard(conn)
+
+    def stats(self):
+        '''Return a dict of connection counters.
+
+        ``created`` and ``reused`` count checkouts that opened a new
+        connection and that found an idle one, ``evicted`` counts connections
+        closed for sitting idle too long and ``discarded`` counts connections
+        closed because of an error or a full pool. ``idle`` is the number of
+        connections currently waiting in the pool.
+        '''
+        with self._lock:
+            stats = dict(self._counters)
+            stats['idle'] = sum(len(idle) for idle in self._idle.values())
+        return stats
+
+    def clear(self):
+        '''Close every idle connection in the pool.'''
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for entries in idle.values():
+            for _, conn in entries:
+                close_connection(conn)
+
+    def _checkout(self, key, factory):
+        stale = []
+        conn = None
+        with self._lock:
+            entries = self._idle.get(key, [])
+            now = time.time()
+            while entries:
+                last_used, candidate = entries.pop()
+                if self._expired(last_used, now):
+                    stale.append(candidate)
+                else:
+                    conn = candidate
+                    break
+            self._counters['evicted'] += len(stale)
+            self._counters['reused' if conn is not None else 'created'] += 1
+
+        for old in stale:
+            close_connection(old)
+
+        if conn is None:
+            conn = factory()
+        return conn
+
+    def _checkin(self, key, conn):
+        stale = []
+        with self._lock:
+            entries = self._idle.setdefault(key, [])
+            now = time.time()
+            while entries and self._expired(entries[0][0], now):
+                stale.append(entries.pop(0)[1])
+            self._counters['evicted'] += len(stale)
+
+            if len(entries) < self.max_size:
+                entries.append((now, conn))
+            else:
+                stale.append(conn)
+                self._counters['discarded'] += 1
+
+        for old in stale:
+            close_connection(old)
+
+    def _discard(self, conn):
+        with self._lock:
+            self._counters['discarded'] += 1
+        close_connection(conn)
+
+    def _expired(self, last_used, now):
+        return (self.idle_timeout is not None and
+                now - last_used > self.idle_timeout)
+
+
+def close_connection(http):
+    '''Close the sockets held open by an :class:`httplib2.Http` object.'''
+    connections = getattr(http, 'connections', {})
+    for conn in list(connections.values()):
+        conn.close()
+    connections.clear()
+
+
 _hush_pyflakes = [
     socks,
     PROXY_TYPE_SOCKS4,
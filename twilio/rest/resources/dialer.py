@@ -0,0 +1,220 @@
+from multiprocessing.pool import ThreadPool
+import logging
+import threading
+import time
+
+from .calls import Call
+from .rate_limit import TokenBucket
+
+logger = logging.getLogger('twilio')
+
+ACTIVE_STATUSES = frozenset([Call.QUEUED, Call.RINGING, Call.IN_PROGRESS])
+UNKNOWN = 'unknown'
+NO_CACHE = {"Cache-Control": "no-cache"}
+
+
+class Dialer(object):
+    """Places the calls of an outbound campaign.
+
+    Calls are placed at most `cps` a second, from a pool of `workers`
+    threads, and at most `max_active` at a time: a call counts as active
+    from the moment it's placed until its status is no longer
+    ``queued``, ``ringing`` or ``in-progress``.
+
+    The dialer learns that calls ended by polling them every
+    `poll_interval` seconds, when it's waiting for a slot. If your status
+    callback URL receives the calls' status changes, pass them to
+    :meth:`update_status` as well, so slots are freed as soon as calls end.
+    Polls skip any :class:`InstanceCache`, so they see the current status.
+    A call which can't be polled is polled again later, and given up on,
+    with the status ``unknown``, after `max_poll_errors` failures in a row.
+
+    Example usage:
+
+    .. code-block:: python
+
+        dialer = Dialer(client.calls, from_="+15555555555",
+                        url="http://example.com/campaign.xml",
+                        cps=5, max_active=50)
+        dialer.run(recipients)
+
+    :param calls: The :class:`Calls` resource to place calls with
+    :param float cps: The calls placed a second
+    :param int max_active: The calls active at once
+    :param int workers: The calls being placed at once
+    :param float poll_interval: How often an active call's status is
+        checked, in seconds, or None to rely on :meth:`update_status`
+    :param int max_poll_errors: How many polls of a call may fail in a row
+        before it's counted as ended
+    :param kwargs: The arguments of :meth:`Calls.create` shared by every
+        call, such as ``from_`` and ``url``
+    """
+
+    def __init__(self, calls, cps=1.0, max_active=10, workers=4,
+                 poll_interval=1.0, max_poll_errors=5, **kwargs):
+        self.calls = calls
+        self.cps = cps
+        self.max_active = max_active
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.max_poll_errors = max_poll_errors
+        self.kwargs = kwargs
+        self.bucket = TokenBucket(cps, 1)
+        self.lock = threading.Lock()
+        self.active = {}
+        self.checked = {}
+        self.poll_errors = {}
+        self.errors = []
+        self.dialing = 0
+        self.dialed = 0
+        self.failed = 0
+        self.ended = 0
+        self.statuses = {}
+        self.started = None
+
+    def update_status(self, sid, status):
+        """
+        Record the status of a call placed by the dialer, for instance from
+        a status callback request. A call which ended frees its slot.
+        """
+        with self.lock:
+            if sid not in self.active:
+                return
+
+            if status in ACTIVE_STATUSES:
+                self.active[sid] = status
+            else:
+                del self.active[sid]
+                self.checked.pop(sid, None)
+                self.poll_errors.pop(sid, None)
+                self.ended += 1
+                self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def poll(self):
+        """Check the status of the active calls not checked recently"""
+        if self.poll_interval is None:
+            return
+
+        now = time.time()
+        with self.lock:
+            due = [sid for sid in self.active
+                   if now - self.checked.get(sid, 0) >= self.poll_interval]
+            for sid in due:
+                self.checked[sid] = now
+
+        for sid in due:
+            try:
+                status = self.fetch_status(sid)
+            except Exception as e:
+                self.poll_failed(sid, e)
+            else:
+                with self.lock:
+                    self.poll_errors.pop(sid, None)
+                self.update_status(sid, status)
+
+    def fetch_status(self, sid):
+        """Request the current status of a call, skipping any cache"""
+        uri = "%s/%s" % (self.calls.uri, sid)
+        resp, call = self.calls.request("GET", uri, headers=dict(NO_CACHE))
+        return call["status"]
+
+    def poll_failed(self, sid, error):
+        """
+        Count a failed poll of a call, which is polled again later, and give
+        up on it after `max_poll_errors` failures in a row
+        """
+        with self.lock:
+            failures = self.poll_errors.get(sid, 0) + 1
+            self.poll_errors[sid] = failures
+
+        if failures < self.max_poll_errors:
+            logger.warning("Failed to poll call %s, retrying: %s", sid, error)
+            return
+
+        logger.warning("Failed to poll call %s %d times, giving up: %s",
+                       sid, failures, error)
+        self.update_status(sid, UNKNOWN)
+
+    def busy(self):
+        with self.lock:
+            return self.dialing + len(self.active)
+
+    def wait_for_slot(self, limit):
+        while self.busy() > limit:
+            self.poll()
+            if self.busy() > limit:
+                time.sleep(self.poll_interval or 0.1)
+
+    def dial(self, kwargs):
+        """Place a call and track it until it ends"""
+        try:
+            call = self.calls.create(**kwargs)
+        except Exception as e:
+            with self.lock:
+                self.dialing -= 1
+                self.failed += 1
+                self.errors.append((kwargs, e))
+            return
+
+        with self.lock:
+            self.dialing -= 1
+            self.dialed += 1
+            self.active[call.sid] = call.status
+            self.checked[call.sid] = time.time()
+
+        self.update_status(call.sid, call.status)
+
+    def run(self, recipients, wait=True):
+        """
+        Call each recipient.
+
+        :param recipients: An iterable of phone numbers to call, or of dicts
+            of the :meth:`Calls.create` arguments of each call
+        :param bool wait: Whether to wait for the calls to end before
+            returning, rather than only for them to be placed
+        :return: The dialer's :meth:`stats`
+        """
+        self.started = time.time()
+        pool = ThreadPool(self.workers)
+        try:
+            for recipient in recipients:
+                if not isinstance(recipient, dict):
+                    recipient = {'to': recipient}
+                kwargs = dict(self.kwargs, **recipient)
+
+                self.wait_for_slot(self.max_active - 1)
+                delay = self.bucket.take()
+                while delay:
+                    time.sleep(delay)
+                    delay = self.bucket.take()
+
+                with self.lock:
+                    self.dialing += 1
+                pool.apply_async(self.dial, (kwargs,))
+
+            pool.close()
+            pool.join()
+            if wait:
+                self.wait_for_slot(0)
+        finally:
+            pool.terminate()
+
+        return self.stats()
+
+    def stats(self):
+        """
+        Return the live counters of the campaign: the calls being placed,
+        placed, failed to be placed, active and ended, the number of ended
+        calls by status, and the average calls placed a second.
+        """
+        with self.lock:
+            elapsed = time.time() - self.started if self.started else 0
+            return {
+                'dialing': self.dialing,
+                'dialed': self.dialed,
+                'failed': self.failed,
+                'active': len(self.active),
+                'ended': self.ended,
+                'statuses': dict(self.statuses),
+                'cps': self.dialed / elapsed if elapsed else 0.0,
+            }
@@ -16,6 +16,18 @@ except ImportError:
 # httplib2
 import httplib2
 
+# urllib3, optional transport
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+# aiohttp, optional asyncio transport
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 # socks
 try:
     from httplib2 import socks
@@ -0,0 +1,125 @@
+import codecs
+
+from six import binary_type
+
+from .imports import json
+
+WHITESPACE = " \t\n\r"
+DIGITS = "0123456789"
+
+
+class StreamedPage(object):
+    """
+    A page of results decoded as its body arrives, rather than once it has
+    all been read.
+
+    :meth:`records` yields the records of the list called `key` one at a
+    time, each decoded as soon as its last byte is read, so only one record
+    and the unread part of the current chunk are held in memory. Once they
+    are exhausted, :attr:`page` holds the rest of the page, such as
+    ``next_page_uri``, with an empty list in place of the records, and
+    :attr:`count` the number of records.
+
+    :param chunks: An iterable over the body of the page, as bytes encoded
+        in UTF-8 or as text
+    :param str key: The name of the list of records in the page
+    :raises: a :exc:`ValueError` from :meth:`records` if the body isn't a
+        JSON object
+    """
+
+    def __init__(self, chunks, key):
+        self.chunks = iter(chunks)
+        self.key = key
+        self.page = None
+        self.count = 0
+        self.buffer = u""
+        self.offset = 0
+        self.eof = False
+        self.utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.decoder = json.JSONDecoder()
+
+    def fill(self):
+        """Read the next chunk into the buffer, or return False at the end"""
+        if self.eof:
+            return False
+
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.eof = True
+            chunk = self.utf8.decode(b"", True)
+        else:
+            if isinstance(chunk, binary_type):
+                chunk = self.utf8.decode(chunk)
+
+        self.buffer = self.buffer[self.offset:] + chunk
+        self.offset = 0
+        return True
+
+    def peek(self):
+        """Return the next character which isn't whitespace"""
+        while True:
+            while self.offset < len(self.buffer):
+                if self.buffer[self.offset] not in WHITESPACE:
+                    return self.buffer[self.offset]
+                self.offset += 1
+
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON page")
+
+    def expect(self, characters):
+        """Consume the next character, which must be one of `characters`"""
+        found = self.peek()
+        if found not in characters:
+            raise ValueError("Expected %s but found %r in JSON page" %
+                             (" or ".join(repr(c) for c in characters), found))
+        self.offset += 1
+        return found
+
+    def value(self):
+        """Decode the next JSON value, reading chunks until it's complete"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.offset)
+            except ValueError:
+                if not self.fill():
+                    raise
+                continue
+
+            # A number at the end of the buffer may go on in the next chunk
+            if (end < len(self.buffer) or
+                    self.buffer[end - 1] not in DIGITS or not self.fill()):
+                self.offset = end
+                return value
+
+    def records(self):
+        """Yield each record of the page in turn"""
+        page = {}
+        self.expect("{")
+        if self.peek() == "}":
+            self.offset += 1
+            self.page = page
+            return
+
+        while True:
+            name = self.value()
+            self.expect(":")
+            if name == self.key and self.peek() == "[":
+                self.offset += 1
+                if self.peek() == "]":
+                    self.offset += 1
+                else:
+                    while True:
+                        yield self.value()
+                        self.count += 1
+                        if self.expect(",]") == "]":
+                            break
+                page[name] = []
+            else:
+                page[name] = self.value()
+
+            if self.expect(",}") == "}":
+                break
+
+        self.page = page
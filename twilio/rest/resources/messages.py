@@ -1,6 +1,6 @@
 from . import InstanceResource, ListResource
 from .media import MediaList
-from .util import normalize_dates, parse_date
+from .util import merge_iter, normalize_dates, parse_date, split_dates
 
 
 class Message(InstanceResource):
@@ -54,8 +54,8 @@ class Message(InstanceResource):
 
     .. attribute:: status
 
-        The status of this message. Either queued, sending, sent,failed,
-        or received.
+        The status of this message. Either queued, sending, sent,
+        delivered, undelivered, failed, or received.
 
     .. attribute:: direction
 
@@ -84,6 +84,14 @@ class Message(InstanceResource):
 
     """
 
+    DELIVERED = "delivered"
+    FAILED = "failed"
+    QUEUED = "queued"
+    RECEIVED = "received"
+    SENDING = "sending"
+    SENT = "sent"
+    UNDELIVERED = "undelivered"
+
     subresources = [MediaList]
 
     def delete(self):
@@ -150,6 +158,8 @@ class Messages(ListResource):
 
         :param date after: Only list calls started after this datetime
         :param date before: Only list calls started before this datetime
+        :param list expand: The subresources to fetch along with each
+            message: ``["media_list"]`` fetches their media
         """
         kwargs["From"] = from_
         kwargs["To"] = to
@@ -158,6 +168,26 @@ class Messages(ListResource):
         kwargs["DateSent"] = parse_date(date_sent)
         return super(Messages, self).iter(**kwargs)
 
+    def parallel_iter(self, start, end, shards=4, ordered=False, **kwargs):
+        """
+        Returns an iterator of the :class:`Message` resources sent from
+        `start` to `end`, inclusive. The date range is split into `shards`
+        smaller ranges, which are paged through concurrently.
+
+        :param date start: The first day to list messages from
+        :param date end: The last day to list messages from
+        :param int shards: The number of date ranges to fetch at once
+        :param bool ordered: Yield messages most recent first, as
+            :meth:`iter` does, rather than as they arrive
+
+        Any other arguments filter the messages, as for :meth:`iter`.
+        """
+        return merge_iter(
+            [self.iter(after=first, before=last, **kwargs)
+             for first, last in split_dates(start, end, shards)],
+            ordered=ordered,
+        )
+
     def update(self, sid, **kwargs):
         """ Updates the message for the given sid
         :param sid: The sid of the message to update.
@@ -76,8 +76,14 @@ class AvailablePhoneNumbers(ListResource):
     key = "available_phone_numbers"
     instance = AvailablePhoneNumber
 
-    def __init__(self, base_uri, auth, timeout, phone_numbers):
-        super(AvailablePhoneNumbers, self).__init__(base_uri, auth, timeout)
+    def __init__(self, base_uri, auth, timeout, phone_numbers,
+                 http_client=None):
+        super(AvailablePhoneNumbers, self).__init__(
+            base_uri,
+            auth,
+            timeout,
+            http_client=http_client,
+        )
         self.phone_numbers = phone_numbers
 
     def get(self, sid):
@@ -88,6 +94,8 @@ class AvailablePhoneNumbers(ListResource):
         """
         Search for phone numbers
         """
+        load = self.record_loader(kwargs.pop("raw", False),
+                                  kwargs.pop("fields", None))
         kwargs["in_region"] = kwargs.get("in_region", region)
         kwargs["in_postal_code"] = kwargs.get("in_postal_code", postal_code)
         kwargs["in_lata"] = kwargs.get("in_lata", lata)
@@ -97,7 +105,7 @@ class AvailablePhoneNumbers(ListResource):
         uri = "%s/%s/%s" % (self.uri, country, TYPES[type])
         resp, page = self.request("GET", uri, params=params)
 
-        return [self.load_instance(i) for i in page[self.key]]
+        return [load(i) for i in page[self.key]]
 
     def load_instance(self, data):
         instance = self.instance(self.phone_numbers)
@@ -215,7 +223,8 @@ class PhoneNumber(InstanceResource):
             self.parent = PhoneNumbers(
                 uri,
                 self.parent.auth,
-                self.parent.timeout
+                self.parent.timeout,
+                http_client=self.parent.http_client,
             )
             self.base_uri = self.parent.uri
 
@@ -257,10 +266,13 @@ class PhoneNumbers(ListResource):
     key = "incoming_phone_numbers"
     instance = PhoneNumber
 
-    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT):
-        super(PhoneNumbers, self).__init__(base_uri, auth, timeout)
+    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT,
+                 http_client=None):
+        super(PhoneNumbers, self).__init__(base_uri, auth, timeout,
+                                           http_client=http_client)
         self.available_phone_numbers = \
-            AvailablePhoneNumbers(base_uri, auth, timeout, self)
+            AvailablePhoneNumbers(base_uri, auth, timeout, self,
+                                  http_client=http_client)
 
     def delete(self, sid):
         """
@@ -283,6 +295,9 @@ class PhoneNumbers(ListResource):
         You can specify partial numbers and use '*' as a wildcard.
         """
 
+        load = self.record_loader(kwargs.pop("raw", False),
+                                  kwargs.pop("fields", None))
+
         uri = self.uri
         if type:
             uri = "%s/%s" % (self.uri, TYPES[type])
@@ -290,7 +305,7 @@ class PhoneNumbers(ListResource):
         params = transform_params(kwargs)
         resp, page = self.request("GET", uri, params=params)
 
-        return [self.load_instance(i) for i in page[self.key]]
+        return [load(i) for i in page[self.key]]
 
     def purchase(self, status_callback_url=None, **kwargs):
         """
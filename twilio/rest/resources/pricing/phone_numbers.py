@@ -7,9 +7,14 @@ class PhoneNumbers(object):
     name = "Number"
     key = "Number"
 
-    def __init__(self, base_uri, auth, timeout):
+    def __init__(self, base_uri, auth, timeout, http_client=None):
         self.uri = "%s/PhoneNumbers" % base_uri
-        self.countries = PhoneNumberCountries(self.uri, auth, timeout)
+        self.countries = PhoneNumberCountries(
+            self.uri,
+            auth,
+            timeout,
+            http_client=http_client,
+        )
 
 
 class PhoneNumberCountry(NextGenInstanceResource):
@@ -71,3 +76,15 @@ class PhoneNumberCountries(NextGenListResource):
         resp, page = self.request("GET", self.uri)
 
         return [self.load_instance(i) for i in page[self.key]]
+
+    def list_raw(self, fields=None):
+        """Retrieve the list of countries in which Twilio Numbers are
+        available, as dicts.
+
+        :param list fields: The fields to keep in each record. By default,
+            records are returned whole.
+        """
+        load = self.record_loader(raw=True, fields=fields)
+        resp, page = self.request("GET", self.uri)
+
+        return [load(i) for i in page[self.key]]
@@ -7,10 +7,12 @@ class Voice(object):
     name = "Voice"
     key = "voice"
 
-    def __init__(self, base_uri, auth, timeout):
+    def __init__(self, base_uri, auth, timeout, http_client=None):
         self.uri = "%s/Voice" % base_uri
-        self.countries = VoiceCountries(self.uri, auth, timeout)
-        self.numbers = VoiceNumbers(self.uri, auth, timeout)
+        self.countries = VoiceCountries(self.uri, auth, timeout,
+                                        http_client=http_client)
+        self.numbers = VoiceNumbers(self.uri, auth, timeout,
+                                    http_client=http_client)
 
 
 class VoiceCountry(NextGenInstanceResource):
@@ -76,6 +78,18 @@ class VoiceCountries(NextGenListResource):
 
         return [self.load_instance(i) for i in page[self.key]]
 
+    def list_raw(self, fields=None):
+        """Retrieve the list of countries in which Twilio Voice is
+        available, as dicts.
+
+        :param list fields: The fields to keep in each record. By default,
+            records are returned whole.
+        """
+        load = self.record_loader(raw=True, fields=fields)
+        resp, page = self.request("GET", self.uri)
+
+        return [load(i) for i in page[self.key]]
+
 
 class VoiceNumber(NextGenInstanceResource):
     """Pricing information for Twilio Voice services to and from a given
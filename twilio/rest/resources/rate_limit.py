@@ -0,0 +1,205 @@
+import re
+import threading
+import time
+
+from ...compat import urlparse
+from ..exceptions import TwilioRateLimitException
+from .base import HttpClient
+
+ACCOUNT_PATTERN = re.compile(r"/Accounts/([^/.]+)")
+RESOURCE_PATTERN = re.compile(r"^[A-Z][A-Za-z]*$")
+
+
+class TokenBucket(object):
+    """
+    A token bucket refilled with `rate` tokens a second, holding at most
+    `capacity` tokens. Safe to share between threads.
+
+    :param float rate: The number of tokens added each second
+    :param float capacity: The largest burst of tokens. Defaults to `rate`.
+        A bucket always holds at least one token.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = max(float(capacity or rate), 1.0)
+        self.tokens = self.capacity
+        self.updated = time.time()
+        self.lock = threading.Lock()
+
+    def take(self):
+        """
+        Take a token if there is one.
+
+        :return: 0 if a token was taken, or else the number of seconds until
+            the next token is added
+        """
+        with self.lock:
+            now = time.time()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+
+            return (1 - self.tokens) / self.rate
+
+    def give_back(self):
+        """Return a token taken with :meth:`take`"""
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class RateLimiter(object):
+    """Paces requests with token buckets per account and per resource.
+
+    Each account SID gets a bucket allowing `account_rate` requests a
+    second. Each resource of an account named in `resource_rates`, such as
+    ``{"Messages": 10, "Calls": 1}``, gets its own bucket as well. A request
+    needs a token from every bucket it belongs to.
+
+    When a bucket is empty, :meth:`acquire` waits for a token or, if it
+    isn't `blocking`, raises a :exc:`TwilioRateLimitException`.
+
+    :param float account_rate: The requests a second allowed for each
+        account, or None for no limit
+    :param dict resource_rates: The requests a second allowed for each
+        resource name
+    :param float burst: How many seconds' worth of requests may be sent at
+        once after a quiet period
+    :param bool blocking: Whether to wait for a token by default
+    """
+
+    def __init__(self, account_rate=None, resource_rates=None, burst=1,
+                 blocking=True):
+        self.account_rate = account_rate
+        self.resource_rates = resource_rates or {}
+        self.burst = burst
+        self.blocking = blocking
+        self.buckets = {}
+        self.lock = threading.Lock()
+        self.acquired = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.rejected = 0
+
+    def bucket(self, key, rate):
+        with self.lock:
+            if key not in self.buckets:
+                self.buckets[key] = TokenBucket(rate, rate * self.burst)
+            return self.buckets[key]
+
+    def buckets_for(self, account, resource):
+        buckets = []
+        if self.account_rate is not None:
+            buckets.append(self.bucket((account,), self.account_rate))
+        if resource in self.resource_rates:
+            buckets.append(self.bucket((account, resource),
+                                       self.resource_rates[resource]))
+        return buckets
+
+    def acquire(self, account, resource=None, blocking=None):
+        """
+        Take a token for a request to a resource of an account.
+
+        :param str account: The account SID the request is made for
+        :param str resource: The name of the resource requested, such as
+            "Messages"
+        :param bool blocking: Whether to wait for a token. Defaults to the
+            limiter's `blocking` setting.
+        :return: The number of seconds spent waiting
+        :raises: a :exc:`TwilioRateLimitException` if a token isn't available
+            and `blocking` is False
+        """
+        if blocking is None:
+            blocking = self.blocking
+
+        waited = 0.0
+        taken = []
+        for bucket in self.buckets_for(account, resource):
+            delay = bucket.take()
+            while delay:
+                if not blocking:
+                    for other in taken:
+                        other.give_back()
+                    with self.lock:
+                        self.rejected += 1
+                    raise TwilioRateLimitException(account, resource, delay)
+
+                time.sleep(delay)
+                waited += delay
+                delay = bucket.take()
+            taken.append(bucket)
+
+        with self.lock:
+            self.acquired += 1
+            if waited:
+                self.waits += 1
+                self.wait_time += waited
+
+        return waited
+
+    def stats(self):
+        """
+        Return counters of the requests this limiter has paced: how many
+        were let through, how many of those waited and for how many seconds
+        in total, and how many were rejected.
+        """
+        with self.lock:
+            return {
+                'acquired': self.acquired,
+                'waits': self.waits,
+                'wait_time': self.wait_time,
+                'rejected': self.rejected,
+            }
+
+
+def request_target(url, auth=None):
+    """
+    Return the account SID and resource name a request to `url` is for,
+    taking the account from the credentials if the url doesn't name one.
+    """
+    path = urlparse(url).path
+    if path.endswith(".json"):
+        path = path[:-len(".json")]
+
+    match = ACCOUNT_PATTERN.search(path)
+    if match:
+        account = match.group(1)
+    else:
+        account = auth[0] if auth else None
+
+    resource = None
+    for segment in reversed(path.split("/")):
+        if RESOURCE_PATTERN.match(segment):
+            resource = segment
+            break
+
+    return account, resource
+
+
+class RateLimitedHttpClient(HttpClient):
+    """
+    An :class:`HttpClient` pacing the requests of another one with a
+    :class:`RateLimiter`. Each request is counted against the account SID
+    and resource name in its url, such as ``AC123`` and ``Messages`` for
+    ``/2010-04-01/Accounts/AC123/Messages.json``.
+
+    :param http_client: The :class:`HttpClient` to send requests with
+    :param rate_limiter: The :class:`RateLimiter` to pace requests with
+    """
+
+    def __init__(self, http_client, rate_limiter):
+        self.http_client = http_client
+        self.rate_limiter = rate_limiter
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        account, resource = request_target(url, auth)
+        self.rate_limiter.acquire(account, resource)
+        return self.http_client.request(method, url, body=body,
+                                        headers=headers, auth=auth,
+                                        timeout=timeout,
+                                        allow_redirects=allow_redirects)
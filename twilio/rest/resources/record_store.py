@@ -0,0 +1,270 @@
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+
+from ...compat import urlparse
+from .base import HttpClient, Response
+from .cache import instance_url
+from .calls import Call
+from .imports import json
+from .messages import Message
+
+TERMINAL_STATUSES = {
+    "Calls": frozenset([Call.BUSY, Call.CANCELED, Call.COMPLETED,
+                        Call.FAILED, Call.NO_ANSWER]),
+    "Messages": frozenset([Message.DELIVERED, Message.FAILED,
+                           Message.RECEIVED, Message.UNDELIVERED]),
+}
+
+
+class RecordStore(object):
+    """
+    An abstract class for permanent stores of records, as JSON strings keyed
+    by their path, such as ``/2010-04-01/Accounts/AC123/Calls/CA123.json``.
+    """
+
+    def get(self, key):
+        """Return the record stored for `key`, or None"""
+        raise NotImplementedError
+
+    def put(self, key, value):
+        """Store `value` for `key`, unless a record is already stored"""
+        raise NotImplementedError
+
+    def delete(self, key):
+        """Remove the record stored for `key`, if any"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release the resources held by the store"""
+
+
+class SqliteRecordStore(RecordStore):
+    """
+    Keep records in a SQLite database, which several processes may share.
+
+    :param str path: The path of the database file, created if needed
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
+        self.connection().execute(
+            "CREATE TABLE IF NOT EXISTS records "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def connection(self):
+        """Return the database connection of the current thread"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30,
+                                   isolation_level=None)
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+
+    def get(self, key):
+        row = self.connection().execute(
+            "SELECT value FROM records WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, key, value):
+        self.connection().execute(
+            "INSERT OR IGNORE INTO records (key, value) VALUES (?, ?)",
+            (key, value))
+
+    def delete(self, key):
+        self.connection().execute("DELETE FROM records WHERE key = ?",
+                                  (key,))
+
+    def close(self):
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            conn.close()
+
+
+class MmapRecordStore(RecordStore):
+    """
+    Keep records in an append-only file, read through a memory map. An
+    index of where each record is in the file is kept in memory, and built
+    by reading the file when the store is opened.
+
+    Each entry of the file is the length of the key and of the value, as two
+    big-endian unsigned 32 bit integers, then the key and the value, encoded
+    as UTF-8. An entry with an empty value deletes the key. An incomplete
+    entry at the end of the file, left by a crash, is dropped.
+
+    Only one process may open a file at a time. The file isn't locked, so
+    two processes appending to it would interleave their entries, and a
+    process only sees the entries which were in the file when it opened
+    it. Use a :class:`SqliteRecordStore` to share records between
+    processes.
+
+    :param str path: The path of the file, created if needed
+    """
+
+    HEADER = struct.Struct(">II")
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.index = {}
+        self.file = open(path, "a+b")
+        self.map = None
+        self.mapped = 0
+        self.size = self.load()
+
+    def load(self):
+        """Index the entries of the file, and return its valid length"""
+        self.file.seek(0)
+        data = self.file.read()
+        offset = 0
+        while offset + self.HEADER.size <= len(data):
+            key_length, value_length = self.HEADER.unpack_from(data, offset)
+            start = offset + self.HEADER.size
+            end = start + key_length + value_length
+            if end > len(data):
+                break
+
+            key = data[start:start + key_length].decode("utf-8")
+            if value_length:
+                self.index[key] = (start + key_length, value_length)
+            else:
+                self.index.pop(key, None)
+            offset = end
+
+        if offset < len(data):
+            self.file.truncate(offset)
+        return offset
+
+    def append(self, key, value):
+        key = key.encode("utf-8")
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(self.HEADER.pack(len(key), len(value)) + key + value)
+        self.file.flush()
+        start = self.size + self.HEADER.size + len(key)
+        self.size = start + len(value)
+        return start
+
+    def get(self, key):
+        with self.lock:
+            location = self.index.get(key)
+            if location is None:
+                return None
+
+            start, length = location
+            if start + length > self.mapped:
+                if self.map is not None:
+                    self.map.close()
+                self.map = mmap.mmap(self.file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+                self.mapped = self.size
+            return self.map[start:start + length].decode("utf-8")
+
+    def put(self, key, value):
+        with self.lock:
+            if key not in self.index:
+                value = value.encode("utf-8")
+                self.index[key] = (self.append(key, value), len(value))
+
+    def delete(self, key):
+        with self.lock:
+            if self.index.pop(key, None) is not None:
+                self.append(key, b"")
+
+    def close(self):
+        with self.lock:
+            if self.map is not None:
+                self.map.close()
+                self.map = None
+            self.file.close()
+
+
+class StoredStatus(object):
+    status = 200
+
+
+class RecordStoreHttpClient(HttpClient):
+    """
+    An :class:`HttpClient` keeping the records of calls and messages which
+    won't change any more, because they reached a terminal status such as
+    ``completed`` or ``delivered``, in a :class:`RecordStore`.
+
+    Records are stored from the responses to GET requests for an instance
+    or a page of results, so the calls fetched by ``get`` or ``iter`` are
+    kept. A later GET request for a stored instance is served from the
+    store. Updating or deleting an instance, such as redacting a message,
+    removes it from the store. Streamed responses, such as the pages of
+    ``iter(stream=True)``, are passed through unread and aren't stored.
+
+    :param http_client: The :class:`HttpClient` to send requests with
+    :param store: The :class:`RecordStore` to keep records in
+    :param dict terminal_statuses: The statuses after which the records of
+        each resource don't change, by resource name. Defaults to the
+        terminal statuses of calls and messages.
+    """
+
+    def __init__(self, http_client, store, terminal_statuses=None):
+        self.http_client = http_client
+        self.store = store
+        if terminal_statuses is None:
+            terminal_statuses = TERMINAL_STATUSES
+        self.terminal_statuses = terminal_statuses
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        path = urlparse(url).path
+        segments = path.split("/")
+        instance = instance_url(url)
+        resource = segments[-2] if instance else segments[-1]
+        if resource.endswith(".json"):
+            resource = resource[:-len(".json")]
+        stored = resource in self.terminal_statuses
+
+        if stored and instance and method == "GET":
+            content = self.store.get(path)
+            if content is not None:
+                resp = Response(StoredStatus(), content, url)
+                resp.cached = True
+                return resp
+
+        resp = self.http_client.request(method, url, body=body,
+                                        headers=headers, auth=auth,
+                                        timeout=timeout,
+                                        allow_redirects=allow_redirects)
+
+        if stored and instance and method in ("POST", "DELETE"):
+            self.store.delete(path)
+        elif (stored and method == "GET" and resp.status_code == 200 and
+                not resp.streaming):
+            self.remember(resource, path if instance else None, resp)
+        return resp
+
+    def remember(self, resource, path, resp):
+        """
+        Store the terminal records of a response, which is an instance at
+        `path`, or a page of results if `path` is None.
+        """
+        # Responses keep their decoded body, so it's decoded once for both
+        # the store and the resource
+        if isinstance(resp, Response):
+            data = resp.json()
+        else:
+            data = json.loads(resp.content)
+        terminal = self.terminal_statuses[resource]
+
+        if path is not None:
+            if data.get("status") in terminal:
+                self.store.put(path, resp.content)
+            return
+
+        for record in data.get(resource.lower()) or []:
+            if record.get("status") in terminal and record.get("uri"):
+                self.store.put(urlparse(record["uri"]).path,
+                               json.dumps(record))
@@ -0,0 +1,159 @@
+from email.utils import mktime_tz, parsedate_tz
+import random
+import time
+
+from .base import HttpClient
+
+
+def parse_retry_after(value):
+    """
+    Return the number of seconds a Retry-After header asks to wait, or None
+    if it can't be parsed. The header is either a number of seconds or an
+    HTTP date.
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    date_tuple = parsedate_tz(value)
+    if date_tuple is None:
+        return None
+    return max(0.0, mktime_tz(date_tuple) - time.time())
+
+
+class RetryPolicy(object):
+    """Decides which failed requests are retried, and when.
+
+    Idempotent requests are retried when they fail with one of `statuses` or
+    with a connection error. Other requests, such as POSTs creating a
+    message, are only retried on a status in `any_method_statuses`, which
+    the API uses to reject a request without acting on it.
+
+    Retries back off exponentially with full jitter: before the nth retry
+    the client waits a random time of up to ``backoff * 2 ** n`` seconds,
+    capped at `max_backoff`. A Retry-After header from the API is waited
+    for in full, on top of the jitter. A request is not retried if doing so
+    would take longer than `max_total` seconds from the first attempt.
+
+    :param int max_retries: The number of times a request is retried
+    :param float backoff: The base delay, in seconds
+    :param float max_backoff: The longest delay between two attempts
+    :param float max_total: The longest time spent on one request
+    :param methods: The idempotent HTTP methods
+    :param statuses: The statuses on which idempotent requests are retried
+    :param any_method_statuses: The statuses on which any request is retried
+    """
+
+    def __init__(self, max_retries=3, backoff=0.5, max_backoff=30,
+                 max_total=60, methods=("GET", "HEAD", "DELETE"),
+                 statuses=(429, 500, 502, 503, 504),
+                 any_method_statuses=(429,)):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_total = max_total
+        self.methods = frozenset(methods)
+        self.statuses = frozenset(statuses)
+        self.any_method_statuses = frozenset(any_method_statuses)
+
+    def jitter(self, attempt):
+        """
+        Return a random delay before retry number `attempt`, counting from 0,
+        of up to ``backoff * 2 ** attempt`` seconds, capped at `max_backoff`.
+        """
+        limit = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return random.uniform(0, limit)
+
+    def delay(self, method, attempt, elapsed, response=None):
+        """
+        Return how many seconds to wait before retrying a request, or None if
+        it should not be retried.
+
+        :param str method: The HTTP method of the request
+        :param int attempt: The number of retries made so far
+        :param float elapsed: The seconds since the first attempt was made
+        :param response: The :class:`Response` of the failed attempt, or None
+            if it failed with a connection error
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if response is None:
+            retry = method in self.methods
+        else:
+            status = response.status_code
+            retry = (status in self.any_method_statuses or
+                     (status in self.statuses and method in self.methods))
+
+        if not retry:
+            return None
+
+        delay = self.jitter(attempt)
+
+        if response is not None:
+            retry_after = parse_retry_after(
+                response.headers.get('retry-after'))
+            if retry_after is not None:
+                delay += retry_after
+
+        if elapsed + delay > self.max_total:
+            return None
+
+        return delay
+
+
+class RetryHttpClient(HttpClient):
+    """
+    An :class:`HttpClient` retrying the failed requests of another one, as
+    its :class:`RetryPolicy` says.
+
+    Once a request can't be retried any more, the last response is returned,
+    or the last connection error raised, as if it had not been retried.
+
+    :param http_client: The :class:`HttpClient` to send requests with
+    :param policy: The :class:`RetryPolicy` to follow. Defaults to a
+        :class:`RetryPolicy` with its default settings.
+    """
+
+    def __init__(self, http_client, policy=None):
+        self.http_client = http_client
+        self.policy = policy or RetryPolicy()
+        self.retries = 0
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        start = time.time()
+        attempt = 0
+
+        while True:
+            try:
+                resp = self.http_client.request(
+                    method,
+                    url,
+                    body=body,
+                    headers=headers,
+                    auth=auth,
+                    timeout=timeout,
+                    allow_redirects=allow_redirects,
+                )
+            except (IOError, OSError):
+                delay = self.policy.delay(method, attempt,
+                                          time.time() - start)
+                if delay is None:
+                    raise
+            else:
+                if resp.ok:
+                    return resp
+
+                delay = self.policy.delay(method, attempt,
+                                          time.time() - start, resp)
+                if delay is None:
+                    return resp
+
+            time.sleep(delay)
+            attempt += 1
+            self.retries += 1
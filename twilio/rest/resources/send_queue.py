@@ -0,0 +1,322 @@
+from contextlib import contextmanager
+import logging
+import sqlite3
+import threading
+import time
+
+from ..exceptions import TwilioRestException
+from .imports import json
+from .rate_limit import request_target
+from .retry import RetryPolicy
+
+logger = logging.getLogger('twilio')
+
+QUEUED = 'queued'
+SENDING = 'sending'
+SENT = 'sent'
+FAILED = 'failed'
+UNKNOWN = 'unknown'
+STATUSES = (QUEUED, SENDING, SENT, FAILED, UNKNOWN)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    sid TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, available_at);
+"""
+
+
+@contextmanager
+def transaction(conn, mode="DEFERRED"):
+    """Run a block in a transaction, rolled back if the block raises"""
+    conn.execute("BEGIN %s" % mode)
+    try:
+        yield
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+class SendQueue(object):
+    """A durable queue of messages to send, kept in a SQLite database.
+
+    Producers :meth:`put` the arguments of :meth:`Messages.create` in the
+    queue, and a pool of worker threads started with :meth:`start` sends
+    them. Each row goes from ``queued`` to ``sending`` to ``sent``, with the
+    sid of the created message, or ``failed``, with the error Twilio
+    rejected it with. Rows survive a restart of the process, so a blast
+    picks up where it stopped.
+
+    A message is never sent twice. Requests rejected with one of the
+    retry policy's `any_method_statuses`, which Twilio doesn't act on, are
+    queued again after a backoff. When the outcome of a request can't be
+    known, after a connection error, a 5xx or unexpected success status, or
+    because the process stopped while the request was in flight, the row is
+    marked ``unknown`` rather than sent again. Use :meth:`requeue_unknown`
+    to send those rows again once you've checked they weren't delivered.
+    Database errors, such as a locked database, are logged and retried
+    rather than stopping the workers.
+
+    Only one process should run workers for a database at a time.
+
+    :param messages: The :class:`Messages` resource to send with
+    :param str path: The path of the SQLite database file, created if needed
+    :param retry_policy: The :class:`RetryPolicy` deciding how many times
+        and how late a rejected request is retried. Defaults to a
+        :class:`RetryPolicy` with its default settings.
+    :param rate_limiter: A :class:`RateLimiter` pacing the messages sent
+    :param float poll_interval: How many seconds an idle worker waits before
+        looking for new rows
+    """
+
+    def __init__(self, messages, path, retry_policy=None, rate_limiter=None,
+                 poll_interval=0.5):
+        self.messages = messages
+        self.path = path
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.poll_interval = poll_interval
+        self.local = threading.local()
+        self.stopped = threading.Event()
+        self.workers = []
+        self.connection().executescript(SCHEMA)
+
+    def connection(self):
+        """Return the database connection of the current thread"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30,
+                                   isolation_level=None)
+            self.local.conn = conn
+        return conn
+
+    def put(self, **kwargs):
+        """
+        Add a message to the queue.
+
+        :param kwargs: The arguments to pass to :meth:`Messages.create`
+        :return: The id of the queued row
+        """
+        return self.put_many([kwargs])[0]
+
+    def put_many(self, items):
+        """
+        Add several messages to the queue in one transaction.
+
+        :param items: An iterable of dicts of the arguments to pass to
+            :meth:`Messages.create`
+        :return: The ids of the queued rows
+        """
+        now = time.time()
+        conn = self.connection()
+        ids = []
+        with transaction(conn):
+            for item in items:
+                cursor = conn.execute(
+                    "INSERT INTO outbox (params, status, available_at, "
+                    "created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (json.dumps(item), QUEUED, now, now, now),
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def get(self, row_id):
+        """
+        Return a row of the queue as a dict, or None if there is no such row.
+        """
+        cursor = self.connection().execute(
+            "SELECT id, params, status, attempts, sid, error FROM outbox "
+            "WHERE id = ?", (row_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+
+        return {
+            'id': row[0],
+            'params': json.loads(row[1]),
+            'status': row[2],
+            'attempts': row[3],
+            'sid': row[4],
+            'error': row[5],
+        }
+
+    def counts(self):
+        """Return the number of rows in each status"""
+        counts = dict((status, 0) for status in STATUSES)
+        cursor = self.connection().execute(
+            "SELECT status, COUNT(*) FROM outbox GROUP BY status")
+        for status, count in cursor:
+            counts[status] = count
+        return counts
+
+    def recover(self):
+        """
+        Mark the rows left ``sending`` by a previous process as ``unknown``.
+
+        :return: The number of rows marked
+        """
+        return self._update_status(SENDING, UNKNOWN)
+
+    def requeue_unknown(self):
+        """
+        Queue the rows marked ``unknown`` to be sent again.
+
+        :return: The number of rows queued
+        """
+        return self._update_status(UNKNOWN, QUEUED)
+
+    def _update_status(self, old, new):
+        now = time.time()
+        cursor = self.connection().execute(
+            "UPDATE outbox SET status = ?, available_at = ?, updated_at = ? "
+            "WHERE status = ?", (new, now, now, old))
+        return cursor.rowcount
+
+    def claim(self):
+        """
+        Mark the next row ready to send as ``sending``.
+
+        :return: The id, create arguments and number of previous attempts of
+            the row, or None if no row is ready
+        """
+        now = time.time()
+        conn = self.connection()
+        with transaction(conn, "IMMEDIATE"):
+            row = conn.execute(
+                "SELECT id, params, attempts FROM outbox "
+                "WHERE status = ? AND available_at <= ? "
+                "ORDER BY id LIMIT 1", (QUEUED, now)).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                "UPDATE outbox SET status = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE id = ?", (SENDING, now, row[0]))
+
+        return row[0], json.loads(row[1]), row[2]
+
+    def _finish(self, row_id, status, sid=None, error=None, delay=0):
+        now = time.time()
+        self.connection().execute(
+            "UPDATE outbox SET status = ?, sid = ?, error = ?, "
+            "available_at = ?, updated_at = ? WHERE id = ?",
+            (status, sid, error, now + delay, now, row_id))
+
+    def record(self, row_id, status, sid=None, error=None, delay=0):
+        """
+        Record the outcome of a claimed row, retrying while the database
+        fails, for instance because it's locked or the disk is full.
+
+        If the queue is stopped first, the row is left ``sending``, to be
+        marked ``unknown`` by :meth:`recover` when the queue starts again.
+
+        :return: Whether the outcome was recorded
+        """
+        while True:
+            try:
+                self._finish(row_id, status, sid=sid, error=error,
+                             delay=delay)
+                return True
+            except sqlite3.Error as e:
+                logger.warning("Failed to record queued message %s as %s, "
+                               "retrying: %s", row_id, status, e)
+                if self.stopped.wait(self.poll_interval):
+                    return False
+
+    def send(self, row_id, params, attempts):
+        """Send a claimed row and record the outcome"""
+        if self.rate_limiter is not None:
+            account, resource = request_target(self.messages.uri,
+                                               self.messages.auth)
+            self.rate_limiter.acquire(account, resource)
+
+        policy = self.retry_policy
+        try:
+            message = self.messages.create(**params)
+        except TwilioRestException as e:
+            if e.status in policy.any_method_statuses:
+                if attempts < policy.max_retries:
+                    self.record(row_id, QUEUED, error=str(e),
+                                delay=policy.jitter(attempts))
+                else:
+                    self.record(row_id, FAILED, error=str(e))
+            elif 400 <= e.status < 500:
+                self.record(row_id, FAILED, error=str(e))
+            else:
+                # A 5xx, or a success status other than the one expected,
+                # doesn't say whether the message was created
+                self.record(row_id, UNKNOWN, error=str(e))
+        except Exception as e:
+            logger.warning("Outcome of queued message %s unknown: %s",
+                           row_id, e)
+            self.record(row_id, UNKNOWN, error=str(e))
+        else:
+            self.record(row_id, SENT, sid=message.sid)
+
+    def work(self):
+        """
+        Send rows until the queue is stopped. Errors are logged, and don't
+        stop the worker.
+        """
+        while not self.stopped.is_set():
+            try:
+                row = self.claim()
+            except sqlite3.Error as e:
+                logger.warning("Failed to claim a queued message: %s", e)
+                self.stopped.wait(self.poll_interval)
+                continue
+
+            if row is None:
+                self.stopped.wait(self.poll_interval)
+                continue
+
+            try:
+                self.send(*row)
+            except Exception as e:
+                logger.exception("Failed to send queued message %s",
+                                 row[0])
+                self.record(row[0], UNKNOWN, error=str(e))
+
+    def start(self, workers=4):
+        """
+        Recover the rows left in flight by a previous process, then start
+        `workers` threads sending queued rows.
+        """
+        self.recover()
+        self.stopped.clear()
+        for _ in range(workers):
+            thread = threading.Thread(target=self.work)
+            thread.daemon = True
+            thread.start()
+            self.workers.append(thread)
+
+    def stop(self):
+        """Stop the workers once they are done with the rows they hold"""
+        self.stopped.set()
+        for thread in self.workers:
+            thread.join()
+        self.workers = []
+
+    def drain(self, workers=4):
+        """
+        Send every queued row, including the ones retried, with `workers`
+        threads, and return the number of rows in each status.
+        """
+        self.start(workers)
+        try:
+            while True:
+                counts = self.counts()
+                if not counts[QUEUED] and not counts[SENDING]:
+                    return counts
+                time.sleep(self.poll_interval)
+        finally:
+            self.stop()
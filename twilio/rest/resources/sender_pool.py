@@ -0,0 +1,154 @@
+import threading
+import time
+
+from six.moves import queue
+
+from ...exceptions import TwilioException
+from .rate_limit import TokenBucket
+
+_STOP = object()
+
+
+class PendingMessage(object):
+    """A message handed to a :class:`SenderPool`, sent in the background"""
+
+    def __init__(self, to, from_, kwargs):
+        self.to = to
+        self.from_ = from_
+        self.kwargs = kwargs
+        self.message = None
+        self.error = None
+        self.done = threading.Event()
+
+    def result(self, timeout=None):
+        """
+        Wait for the message to be sent and return it.
+
+        :param float timeout: The longest time to wait, in seconds
+        :return: The created :class:`Message`
+        :raises: the exception raised sending the message, or a
+            :exc:`TwilioException` if it wasn't sent in time
+        """
+        if not self.done.wait(timeout):
+            raise TwilioException("Message to %s not sent yet" % self.to)
+        if self.error is not None:
+            raise self.error
+        return self.message
+
+
+class SenderPool(object):
+    """Spreads outgoing messages across a pool of sender numbers.
+
+    Carriers throttle each number to a few messages a second, so a single
+    sender caps a blast's throughput. Each number of the pool gets its own
+    queue, and a worker thread sending from it at most `rate` messages a
+    second, so throughput grows with the size of the pool.
+
+    A recipient is always sent messages from the same number: the first
+    message to a recipient goes to the number with the shortest queue, and
+    later ones follow it.
+
+    :param messages: The :class:`Messages` resource to send with
+    :param numbers: The sender numbers, as strings or
+        :class:`PhoneNumber` instances, for instance
+        ``client.phone_numbers.iter()``
+    :param float rate: The messages a second each number may send
+    :param int burst: The messages a number may send at once after a quiet
+        period
+    """
+
+    def __init__(self, messages, numbers, rate=1.0, burst=1):
+        self.messages = messages
+        self.numbers = [getattr(n, 'phone_number', n) for n in numbers]
+        if not self.numbers:
+            raise TwilioException("A SenderPool needs at least one number")
+
+        self.buckets = dict((n, TokenBucket(rate, burst))
+                            for n in self.numbers)
+        self.queues = dict((n, queue.Queue()) for n in self.numbers)
+        self.sent = dict((n, 0) for n in self.numbers)
+        self.senders = {}
+        self.lock = threading.Lock()
+        self.workers = []
+
+    def sender_for(self, to):
+        """Return the number messages to `to` are sent from"""
+        with self.lock:
+            if to not in self.senders:
+                self.senders[to] = min(self.numbers,
+                                       key=lambda n: self.queues[n].qsize())
+            return self.senders[to]
+
+    def submit(self, to, **kwargs):
+        """
+        Queue a message to be sent from the pool.
+
+        :param str to: The destination phone number
+        :param kwargs: The other arguments of :meth:`Messages.create`
+        :return: A :class:`PendingMessage`
+        """
+        pending = PendingMessage(to, self.sender_for(to), kwargs)
+        self.queues[pending.from_].put(pending)
+        return pending
+
+    def depths(self):
+        """Return the number of messages waiting for each sender number"""
+        return dict((n, q.qsize()) for n, q in self.queues.items())
+
+    def stats(self):
+        """
+        Return the number of messages sent and waiting for each sender
+        number.
+        """
+        with self.lock:
+            sent = dict(self.sent)
+        return dict((n, {'sent': sent[n], 'queued': q.qsize()})
+                    for n, q in self.queues.items())
+
+    def work(self, number):
+        """Send the messages queued for `number`, paced by its bucket"""
+        bucket = self.buckets[number]
+        pending_messages = self.queues[number]
+        while True:
+            pending = pending_messages.get()
+            try:
+                if pending is _STOP:
+                    return
+
+                delay = bucket.take()
+                while delay:
+                    time.sleep(delay)
+                    delay = bucket.take()
+
+                try:
+                    pending.message = self.messages.create(
+                        to=pending.to, from_=number, **pending.kwargs)
+                except Exception as e:
+                    pending.error = e
+                else:
+                    with self.lock:
+                        self.sent[number] += 1
+                pending.done.set()
+            finally:
+                pending_messages.task_done()
+
+    def start(self):
+        """Start a worker thread for each sender number"""
+        for number in self.numbers:
+            thread = threading.Thread(target=self.work, args=(number,))
+            thread.daemon = True
+            thread.start()
+            self.workers.append(thread)
+
+    def join(self):
+        """Wait until every queued message is sent"""
+        for pending_messages in self.queues.values():
+            pending_messages.join()
+
+    def stop(self):
+        """Send the messages already queued, then stop the workers"""
+        for pending_messages in self.queues.values():
+            pending_messages.put(_STOP)
+        for thread in self.workers:
+            thread.join()
+        self.workers = []
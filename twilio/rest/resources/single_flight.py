@@ -0,0 +1,88 @@
+import sys
+import threading
+
+from six import reraise
+
+from .base import HttpClient
+
+
+class Flight(object):
+    """A request in flight, and its outcome once it lands"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlightHttpClient(HttpClient):
+    """
+    An :class:`HttpClient` sending only one of several identical requests
+    made at the same time by different threads. The other threads wait for
+    that request, and get its response, or its exception, as their own.
+
+    Requests are identical when they have the same method, url, including
+    the query string, headers and credentials. Only requests with one of
+    `methods`, which don't change anything, are coalesced. The body of a
+    :class:`StreamingResponse` shared with other threads is read whole
+    before they get it, since it can only be read once.
+
+    :param http_client: The :class:`HttpClient` to send requests with
+    :param methods: The HTTP methods of the requests to coalesce
+    """
+
+    def __init__(self, http_client, methods=("GET", "HEAD")):
+        self.http_client = http_client
+        self.methods = frozenset(methods)
+        self.flights = {}
+        self.lock = threading.Lock()
+        self.coalesced = 0
+
+    def request(self, method, url, body=None, headers=None, auth=None,
+                timeout=None, allow_redirects=False):
+        if method not in self.methods:
+            return self.http_client.request(method, url, body=body,
+                                            headers=headers, auth=auth,
+                                            timeout=timeout,
+                                            allow_redirects=allow_redirects)
+
+        key = (method, url, tuple(sorted((headers or {}).items())),
+               tuple(auth or ()))
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = Flight()
+            else:
+                flight.followers += 1
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                reraise(*flight.error)
+            return flight.response
+
+        try:
+            flight.response = self.http_client.request(
+                method, url, body=body, headers=headers, auth=auth,
+                timeout=timeout, allow_redirects=allow_redirects)
+            return flight.response
+        except Exception:
+            flight.error = sys.exc_info()
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            self.share(flight)
+            flight.done.set()
+
+    def share(self, flight):
+        """Read the body of a streaming response the followers will share"""
+        resp = flight.response
+        if flight.followers and resp is not None and resp.streaming:
+            try:
+                resp.content
+            except Exception:
+                flight.error = sys.exc_info()
@@ -12,16 +12,24 @@ class Sip(object):
     name = "SIP"
     key = "sip"
 
-    def __init__(self, base_uri, auth, timeout):
+    def __init__(self, base_uri, auth, timeout, http_client=None):
         self.uri = "%s/SIP" % base_uri
         self.auth = auth
         self.timeout = timeout
-        self.domains = Domains(self.uri, auth, timeout)
-        self.credential_lists = SipCredentialLists(self.uri, auth, timeout)
+        self.http_client = http_client
+        self.domains = Domains(self.uri, auth, timeout,
+                               http_client=http_client)
+        self.credential_lists = SipCredentialLists(
+            self.uri,
+            auth,
+            timeout,
+            http_client=http_client,
+        )
         self.ip_access_control_lists = SipIpAccessControlLists(
             self.uri,
             auth,
             timeout,
+            http_client=http_client,
         )
 
     def ip_access_control_list_mappings(self, domain_sid):
@@ -30,7 +38,12 @@ class Sip(object):
         :class:`Domain` with the given domain_sid
         """
         base_uri = "%s/Domains/%s" % (self.uri, domain_sid)
-        return IpAccessControlListMappings(base_uri, self.auth, self.timeout)
+        return IpAccessControlListMappings(
+            base_uri,
+            self.auth,
+            self.timeout,
+            http_client=self.http_client,
+        )
 
     def credential_list_mappings(self, domain_sid):
         """
@@ -38,7 +51,8 @@ class Sip(object):
         :class:`Domain` with the given domain_sid
         """
         base_uri = "%s/Domains/%s" % (self.uri, domain_sid)
-        return CredentialListMappings(base_uri, self.auth, self.timeout)
+        return CredentialListMappings(base_uri, self.auth, self.timeout,
+                                      http_client=self.http_client)
 
     def ip_addresses(self, ip_access_control_list_sid):
         """
@@ -49,7 +63,8 @@ class Sip(object):
             self.uri,
             ip_access_control_list_sid,
         )
-        return IpAddresses(base_uri, self.auth, self.timeout)
+        return IpAddresses(base_uri, self.auth, self.timeout,
+                           http_client=self.http_client)
 
     def credentials(self, credential_list_sid):
         """
@@ -60,4 +75,5 @@ class Sip(object):
             self.uri,
             credential_list_sid,
         )
-        return Credentials(base_uri, self.auth, self.timeout)
+        return Credentials(base_uri, self.auth, self.timeout,
+                           http_client=self.http_client)
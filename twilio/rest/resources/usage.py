@@ -120,15 +120,19 @@ class BaseUsageRecords(ListResource):
 
 class UsageRecords(BaseUsageRecords):
 
-    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT):
-        super(UsageRecords, self).__init__(base_uri, auth, timeout)
-        self.daily = UsageRecordsDaily(base_uri, auth, timeout)
-        self.monthly = UsageRecordsMonthly(base_uri, auth, timeout)
-        self.yearly = UsageRecordsYearly(base_uri, auth, timeout)
-        self.today = UsageRecordsToday(base_uri, auth, timeout)
-        self.yesterday = UsageRecordsYesterday(base_uri, auth, timeout)
-        self.this_month = UsageRecordsThisMonth(base_uri, auth, timeout)
-        self.last_month = UsageRecordsLastMonth(base_uri, auth, timeout)
+    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT,
+                 http_client=None):
+        super(UsageRecords, self).__init__(base_uri, auth, timeout,
+                                           http_client=http_client)
+        args = (base_uri, auth, timeout)
+        kwargs = {'http_client': http_client}
+        self.daily = UsageRecordsDaily(*args, **kwargs)
+        self.monthly = UsageRecordsMonthly(*args, **kwargs)
+        self.yearly = UsageRecordsYearly(*args, **kwargs)
+        self.today = UsageRecordsToday(*args, **kwargs)
+        self.yesterday = UsageRecordsYesterday(*args, **kwargs)
+        self.this_month = UsageRecordsThisMonth(*args, **kwargs)
+        self.last_month = UsageRecordsLastMonth(*args, **kwargs)
 
 
 class UsageRecordsDaily(BaseUsageRecords):
@@ -174,7 +178,10 @@ class Usage(object):
     Holds all the specific Usage list resources
     """
 
-    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT):
-        self.records = UsageRecords(base_uri, auth, timeout=timeout)
-        self.triggers = UsageTriggers(base_uri, auth, timeout=timeout)
+    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT,
+                 http_client=None):
+        self.records = UsageRecords(base_uri, auth, timeout=timeout,
+                                    http_client=http_client)
+        self.triggers = UsageTriggers(base_uri, auth, timeout=timeout,
+                                      http_client=http_client)
         self.timeout = timeout
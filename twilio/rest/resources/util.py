@@ -1,7 +1,13 @@
+from collections import deque
 import datetime
+from multiprocessing.pool import ThreadPool
+import sys
+import threading
 
 from email.utils import parsedate
-from six import iteritems
+from functools import wraps
+from six import iteritems, reraise
+from six.moves import queue
 import pytz
 
 
@@ -48,17 +54,83 @@ def parse_date(d):
         return d
 
 
+def split_dates(start, end, shards):
+    """
+    Split the days from `start` to `end`, inclusive, into at most `shards`
+    contiguous ranges. Returns a list of (first day, last day) tuples, the
+    latest range first.
+    """
+    if isinstance(start, datetime.datetime):
+        start = start.date()
+    if isinstance(end, datetime.datetime):
+        end = end.date()
+
+    days = (end - start).days + 1
+    shards = min(shards, days)
+
+    ranges = []
+    for i in range(shards):
+        first = start + datetime.timedelta(days=days * i // shards)
+        last = start + datetime.timedelta(days=days * (i + 1) // shards - 1)
+        ranges.append((first, last))
+
+    ranges.reverse()
+    return ranges
+
+
+def memoize(maxsize):
+    """
+    Cache the results of a function of one hashable argument, forgetting
+    them all once `maxsize` results are cached
+    """
+    def decorator(func):
+        cache = {}
+
+        @wraps(func)
+        def inner(arg):
+            try:
+                return cache[arg]
+            except KeyError:
+                pass
+
+            value = func(arg)
+            if len(cache) >= maxsize:
+                cache.clear()
+            cache[arg] = value
+            return value
+        inner.cache = cache
+        return inner
+    return decorator
+
+
+MONTHS = dict((month, number) for number, month in enumerate(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+     "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1))
+
+
+@memoize(1024)
 def parse_rfc2822_date(s):
     """
     Parses an RFC 2822 date string and returns a time zone naive datetime
     object. All dates returned from Twilio are UTC.
     """
+    # Twilio always sends dates like "Tue, 15 Feb 2011 04:21:00 +0000", which
+    # are sliced directly. Anything else goes through email.utils.
+    if len(s) == 31 and s[3] == ',' and s[25:] == ' +0000':
+        try:
+            return datetime.datetime(int(s[12:16]), MONTHS[s[8:11]],
+                                     int(s[5:7]), int(s[17:19]),
+                                     int(s[20:22]), int(s[23:25]))
+        except (KeyError, ValueError):
+            pass
+
     date_tuple = parsedate(s)
     if date_tuple is None:
         return None
     return datetime.datetime(*date_tuple[:6])
 
 
+@memoize(1024)
 def parse_iso_date(s):
     """
     Parses an ISO 8601 date string and returns a UTC datetime object,
@@ -66,6 +138,16 @@ def parse_iso_date(s):
     :param s: ISO 8601-formatted string date
     :return: datetime or str
     """
+    # Twilio always sends dates like "2015-07-30T20:00:00Z", whose
+    # separators are every third character from the fifth.
+    if len(s) == 20 and s[4::3] == '--T::Z':
+        try:
+            return datetime.datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                                     int(s[11:13]), int(s[14:16]),
+                                     int(s[17:19]), tzinfo=pytz.utc)
+        except ValueError:
+            pass
+
     format = "%Y-%m-%dT%H:%M:%SZ"
     try:
         return datetime.datetime.strptime(s, format).replace(tzinfo=pytz.utc)
@@ -142,6 +224,103 @@ def change_dict_key(d, from_key, to_key):
         pass
 
 
+def prefetch_iter(iterable, size):
+    """
+    Iterate over `iterable` in a background thread, keeping up to `size`
+    items ready ahead of the consumer. Exceptions raised by `iterable` are
+    raised to the consumer, and the thread stops when the consumer stops
+    iterating.
+    """
+    return merge_iter([iterable], size)
+
+
+def merge_iter(iterables, size=50, ordered=False):
+    """
+    Iterate over several iterables at once, each in its own background
+    thread with up to `size` items buffered. Items are yielded as they
+    arrive or, if `ordered`, all the items of the first iterable, then all
+    the items of the second, and so on. Exceptions raised by any iterable
+    are raised to the consumer, and the threads stop when the consumer
+    stops iterating.
+    """
+    stopped = threading.Event()
+    iterables = list(iterables)
+
+    try:
+        if ordered:
+            queues = [queue.Queue(maxsize=size) for _ in iterables]
+            for iterable, items in zip(iterables, queues):
+                _start_producer(iterable, items, stopped)
+            for items in queues:
+                for item in _consume(items, 1):
+                    yield item
+        else:
+            items = queue.Queue(maxsize=size)
+            for iterable in iterables:
+                _start_producer(iterable, items, stopped)
+            for item in _consume(items, len(iterables)):
+                yield item
+    finally:
+        stopped.set()
+
+
+def _start_producer(iterable, items, stopped):
+    def put(item):
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((True, item)):
+                    return
+        except Exception:
+            put((False, sys.exc_info()))
+        else:
+            put((False, None))
+
+    thread = threading.Thread(target=produce)
+    thread.daemon = True
+    thread.start()
+
+
+def _consume(items, producers):
+    while producers:
+        ok, item = items.get()
+        if ok:
+            yield item
+        elif item is None:
+            producers -= 1
+        else:
+            reraise(*item)
+
+
+def parallel_map(func, iterable, workers):
+    """
+    Yield ``func(item)`` for each item of `iterable`, in order, calling
+    `func` from a pool of `workers` threads. At most `workers` calls run or
+    wait to be consumed at once. Exceptions raised by `func` are raised to
+    the consumer.
+    """
+    pool = ThreadPool(workers)
+    try:
+        pending = deque()
+        for item in iterable:
+            pending.append(pool.apply_async(func, (item,)))
+            if len(pending) >= workers:
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+
+
 class _UnsetTimeoutKls(object):
     """ A sentinel for an unset timeout. Defaults to the system timeout. """
     def __repr__(self):
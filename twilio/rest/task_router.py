@@ -25,17 +25,28 @@ class TwilioTaskRouterClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://taskrouter.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 http_client=None, retry_policy=None, rate_limiter=None,
+                 concurrency_limiter=None, coalesce_requests=False,
+                 instance_cache=None, record_store=None,
+                 json_codec=None):
         """
         Create a Twilio REST API client.
         """
         super(TwilioTaskRouterClient, self).__init__(account, token, base,
                                                      version, timeout,
-                                                     request_account)
+                                                     request_account,
+                                                     http_client, retry_policy,
+                                                     rate_limiter,
+                                                     concurrency_limiter,
+                                                     coalesce_requests,
+                                                     instance_cache,
+                                                     record_store, json_codec)
         self.base_uri = "{0}/{1}".format(base, version)
         self.workspace_uri = "{0}/Workspaces".format(self.base_uri)
 
-        self.workspaces = Workspaces(self.base_uri, self.auth, timeout)
+        self.workspaces = Workspaces(self.base_uri, self.auth, timeout,
+                                     http_client=self.http_client)
 
     def activities(self, workspace_sid):
         """
@@ -43,7 +54,8 @@ class TwilioTaskRouterClient(TwilioClient):
         with the given workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Activities(base_uri, self.auth, self.timeout)
+        return Activities(base_uri, self.auth, self.timeout,
+                          http_client=self.http_client)
 
     def events(self, workspace_sid):
         """
@@ -51,7 +63,8 @@ class TwilioTaskRouterClient(TwilioClient):
         workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Events(base_uri, self.auth, self.timeout)
+        return Events(base_uri, self.auth, self.timeout,
+                      http_client=self.http_client)
 
     def reservations(self, workspace_sid, task_sid):
         """
@@ -60,7 +73,8 @@ class TwilioTaskRouterClient(TwilioClient):
         """
         base_uri = "{0}/{1}/Tasks/{2}".format(self.workspace_uri,
                                               workspace_sid, task_sid)
-        return Reservations(base_uri, self.auth, self.timeout)
+        return Reservations(base_uri, self.auth, self.timeout,
+                            http_client=self.http_client)
 
     def worker_reservations(self, workspace_sid, worker_sid):
         """
@@ -69,7 +83,8 @@ class TwilioTaskRouterClient(TwilioClient):
         """
         base_uri = "{0}/{1}/Workers/{2}".format(self.workspace_uri,
                                                 workspace_sid, worker_sid)
-        return Reservations(base_uri, self.auth, self.timeout)
+        return Reservations(base_uri, self.auth, self.timeout,
+                            http_client=self.http_client)
 
     def task_queues(self, workspace_sid):
         """
@@ -77,7 +92,8 @@ class TwilioTaskRouterClient(TwilioClient):
         the given workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return TaskQueues(base_uri, self.auth, self.timeout)
+        return TaskQueues(base_uri, self.auth, self.timeout,
+                          http_client=self.http_client)
 
     def tasks(self, workspace_sid):
         """
@@ -85,7 +101,8 @@ class TwilioTaskRouterClient(TwilioClient):
         workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Tasks(base_uri, self.auth, self.timeout)
+        return Tasks(base_uri, self.auth, self.timeout,
+                     http_client=self.http_client)
 
     def workers(self, workspace_sid):
         """
@@ -93,7 +110,8 @@ class TwilioTaskRouterClient(TwilioClient):
         given workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Workers(base_uri, self.auth, self.timeout)
+        return Workers(base_uri, self.auth, self.timeout,
+                       http_client=self.http_client)
 
     def workflows(self, workspace_sid):
         """
@@ -101,4 +119,5 @@ class TwilioTaskRouterClient(TwilioClient):
         given workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Workflows(base_uri, self.auth, self.timeout)
+        return Workflows(base_uri, self.auth, self.timeout,
+                         http_client=self.http_client)
@@ -22,13 +22,23 @@ class TwilioTrunkingClient(TwilioClient):
 
     def __init__(self, account=None, token=None,
                  base="https://trunking.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None,
+                 http_client=None, retry_policy=None, rate_limiter=None,
+                 concurrency_limiter=None, coalesce_requests=False,
+                 instance_cache=None, record_store=None,
+                 json_codec=None):
         """
         Create a Twilio REST API client.
         """
         super(TwilioTrunkingClient, self).__init__(account, token, base,
                                                    version, timeout,
-                                                   request_account)
+                                                   request_account,
+                                                   http_client, retry_policy,
+                                                   rate_limiter,
+                                                   concurrency_limiter,
+                                                   coalesce_requests,
+                                                   instance_cache,
+                                                   record_store, json_codec)
         self.trunk_base_uri = "{0}/{1}".format(base, version)
 
     def credential_lists(self, trunk_sid):
@@ -37,7 +47,8 @@ class TwilioTrunkingClient(TwilioClient):
         """
         credential_lists_uri = "{0}/Trunks/{1}".format(
             self.trunk_base_uri, trunk_sid)
-        return CredentialLists(credential_lists_uri, self.auth, self.timeout)
+        return CredentialLists(credential_lists_uri, self.auth, self.timeout,
+                               http_client=self.http_client)
 
     def ip_access_control_lists(self, trunk_sid):
         """
@@ -46,7 +57,8 @@ class TwilioTrunkingClient(TwilioClient):
         ip_access_control_lists_uri = "{0}/Trunks/{1}".format(
             self.trunk_base_uri, trunk_sid)
         return IpAccessControlLists(ip_access_control_lists_uri, self.auth,
-                                    self.timeout)
+                                    self.timeout,
+                                    http_client=self.http_client)
 
     def origination_urls(self, trunk_sid):
         """
@@ -54,7 +66,8 @@ class TwilioTrunkingClient(TwilioClient):
         """
         origination_urls_uri = "{0}/Trunks/{1}".format(
             self.trunk_base_uri, trunk_sid)
-        return OriginationUrls(origination_urls_uri, self.auth, self.timeout)
+        return OriginationUrls(origination_urls_uri, self.auth, self.timeout,
+                               http_client=self.http_client)
 
     def phone_numbers(self, trunk_sid):
         """
@@ -62,10 +75,12 @@ class TwilioTrunkingClient(TwilioClient):
         """
         phone_numbers_uri = "{0}/Trunks/{1}".format(self.trunk_base_uri,
                                                     trunk_sid)
-        return PhoneNumbers(phone_numbers_uri, self.auth, self.timeout)
+        return PhoneNumbers(phone_numbers_uri, self.auth, self.timeout,
+                            http_client=self.http_client)
 
     def trunks(self):
         """
         Return a :class:`Trunks` instance
         """
-        return Trunks(self.trunk_base_uri, self.auth, self.timeout)
+        return Trunks(self.trunk_base_uri, self.auth, self.timeout,
+                      http_client=self.http_client)